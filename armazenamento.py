@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Histórico das coletas em SQLite
+
+Cada execução do scraper vira uma linha em `execucoes`; os jogadores de cada
+página são inseridos em lote (`executemany`) em `jogadores`, identificados por
+uma identidade estável do card. Com o banco em modo WAL, a gravação de uma
+página não bloqueia leituras concorrentes (consultas, outras contas do pool).
+
+Exemplos de consulta:
+    armazenamento.historico_jogador('Essien')
+    armazenamento.diferencas(execucao_anterior, execucao_atual)
+"""
+
+import os
+import hashlib
+import logging
+import sqlite3
+from datetime import datetime
+from urllib.request import pathname2url
+
+from extratores import CAMPOS_JOGADOR
+from registros import JogadorRegistro, como_registros
+
+logger = logging.getLogger(__name__)
+
+# Coluna SQL de cada campo do esquema de jogador
+COLUNAS_JOGADOR = {
+    'Nome': 'nome',
+    'Overall': 'overall',
+    'Posição': 'posicao',
+    'Clube': 'clube',
+    'Rating': 'rating',
+    'Qualidade': 'qualidade',
+    'Nação': 'nacao',
+    'Liga': 'liga',
+    'PAC': 'pac',
+    'SHO': 'sho',
+    'PAS': 'pas',
+    'DRI': 'dri',
+    'DEF': 'def',
+    'PHY': 'phy',
+    'Traits': 'traits',
+    'Status': 'status',
+    'Posições_Alternativas': 'posicoes_alternativas'
+}
+
+# Campos que identificam o card quando a API não fornece o ID do item
+CAMPOS_IDENTIDADE = ['Nome', 'Posição', 'Qualidade', 'Nação', 'Liga', 'Clube', 'Status']
+
+# Re-extrações de snapshots (snapshots.py) não servem de referência para a coleta
+SEM_OFFLINE = "COALESCE(motor, '') != 'offline'"
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS execucoes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    inicio TEXT NOT NULL,
+    fim TEXT,
+    conta TEXT,
+    motor TEXT,
+    versao_webapp TEXT,
+    secao TEXT DEFAULT 'clube',
+    total INTEGER DEFAULT 0,
+    status TEXT DEFAULT 'em_andamento'
+);
+
+CREATE TABLE IF NOT EXISTS jogadores (
+    execucao_id INTEGER NOT NULL REFERENCES execucoes(id),
+    identidade TEXT NOT NULL,
+    pagina INTEGER,
+    nome TEXT,
+    overall INTEGER,
+    posicao TEXT,
+    clube TEXT,
+    rating INTEGER,
+    qualidade TEXT,
+    nacao TEXT,
+    liga TEXT,
+    pac INTEGER,
+    sho INTEGER,
+    pas INTEGER,
+    dri INTEGER,
+    def INTEGER,
+    phy INTEGER,
+    traits TEXT,
+    status TEXT,
+    posicoes_alternativas TEXT,
+    PRIMARY KEY (execucao_id, identidade)
+);
+
+CREATE TABLE IF NOT EXISTS paginas (
+    execucao_id INTEGER NOT NULL REFERENCES execucoes(id),
+    pagina INTEGER NOT NULL,
+    impressao TEXT NOT NULL,
+    PRIMARY KEY (execucao_id, pagina)
+);
+
+CREATE INDEX IF NOT EXISTS idx_jogadores_nome ON jogadores (nome);
+CREATE INDEX IF NOT EXISTS idx_jogadores_posicao ON jogadores (posicao);
+CREATE INDEX IF NOT EXISTS idx_jogadores_overall ON jogadores (overall);
+CREATE INDEX IF NOT EXISTS idx_jogadores_identidade ON jogadores (identidade, execucao_id);
+CREATE INDEX IF NOT EXISTS idx_jogadores_pagina ON jogadores (execucao_id, pagina);
+"""
+
+
+def identidade_card(jogador):
+    """
+    Identidade estável do card: o ID do item quando vem da API, senão um hash
+    dos atributos que não mudam entre execuções (o overall pode evoluir)
+    """
+    if isinstance(jogador, JogadorRegistro):
+        jogador = jogador.como_dicionario()
+    if jogador.get('ID'):
+        return f"id:{jogador['ID']}"
+    chave = '|'.join(str(jogador.get(campo, 'N/A')) for campo in CAMPOS_IDENTIDADE)
+    return 'h:' + hashlib.sha1(chave.encode('utf-8')).hexdigest()[:16]
+
+
+class ArmazenamentoSQLite:
+    """Grava as execuções e os jogadores coletados em um banco SQLite"""
+
+    def __init__(self, caminho='historico_fc25.db', somente_leitura=False):
+        self.caminho = caminho
+        # Leitores (serviço de consulta, exportação) não tocam no esquema nem na trava de escrita
+        self.somente_leitura = somente_leitura
+        self.conexao = None
+        self.execucao_id = None
+        self._ocorrencias = {}
+        # Expressão SQL da seção de cada execução (bancos antigos lidos sem migração não têm a coluna)
+        self._secao_sql = "COALESCE(secao, 'clube')"
+
+    def abrir(self):
+        """Abre o banco em modo WAL e cria as tabelas e índices se necessário (ou só para leitura)"""
+        if self.somente_leitura:
+            uri = f"file:{pathname2url(os.path.abspath(self.caminho))}?mode=ro"
+            self.conexao = sqlite3.connect(uri, uri=True, timeout=30, check_same_thread=False)
+            colunas = {linha[1] for linha in self.conexao.execute('PRAGMA table_info(execucoes)')}
+            if 'secao' not in colunas:
+                self._secao_sql = "'clube'"
+            return self
+        # A conexão é usada pela thread do pipeline de coleta (um uso por vez)
+        self.conexao = sqlite3.connect(self.caminho, timeout=30, check_same_thread=False)
+        self.conexao.execute('PRAGMA journal_mode=WAL')
+        # Com WAL, NORMAL só sincroniza no checkpoint: commits por página ficam baratos
+        self.conexao.execute('PRAGMA synchronous=NORMAL')
+        self.conexao.executescript(ESQUEMA)
+        # Bancos anteriores às seções: as execuções antigas são todas do clube
+        colunas = {linha[1] for linha in self.conexao.execute('PRAGMA table_info(execucoes)')}
+        if 'secao' not in colunas:
+            self.conexao.execute("ALTER TABLE execucoes ADD COLUMN secao TEXT DEFAULT 'clube'")
+        self.conexao.commit()
+        return self
+
+    def iniciar_execucao(self, conta=None, motor=None, versao_webapp=None, secao='clube', inicio=None):
+        """
+        Registra uma nova execução (de uma seção do web app) e retorna o seu id.
+        `inicio` preserva a data de uma coleta reprocessada (padrão: agora)
+        """
+        cursor = self.conexao.execute(
+            'INSERT INTO execucoes (inicio, conta, motor, versao_webapp, secao) VALUES (?, ?, ?, ?, ?)',
+            (inicio or datetime.now().isoformat(timespec='seconds'), conta, motor, versao_webapp, secao)
+        )
+        self.conexao.commit()
+        self.execucao_id = cursor.lastrowid
+        self._ocorrencias = {}
+        logger.info(f"Execução {self.execucao_id} registrada em {self.caminho}")
+        return self.execucao_id
+
+    def retomar_execucao(self, execucao_id, ultima_pagina):
+        """Continua uma execução interrompida, descartando páginas após o checkpoint"""
+        self.execucao_id = execucao_id
+        self.conexao.execute('DELETE FROM jogadores WHERE execucao_id = ? AND pagina > ?',
+                             (execucao_id, ultima_pagina))
+        self.conexao.execute('DELETE FROM paginas WHERE execucao_id = ? AND pagina > ?',
+                             (execucao_id, ultima_pagina))
+        self.conexao.commit()
+        self._ocorrencias = {}
+        self._contar_ocorrencias(
+            identidade for (identidade,) in self.conexao.execute(
+                'SELECT identidade FROM jogadores WHERE execucao_id = ?', (execucao_id,)))
+        logger.info(f"Retomando a execução {execucao_id} a partir da página {ultima_pagina + 1}")
+
+    def _contar_ocorrencias(self, identidades):
+        """Atualiza a contagem de cards idênticos com identidades já gravadas"""
+        for identidade in identidades:
+            base, _, numero = identidade.partition('#')
+            ocorrencia = int(numero) if numero else 1
+            if ocorrencia > self._ocorrencias.get(base, 0):
+                self._ocorrencias[base] = ocorrencia
+
+    def _identidade_unica(self, jogador):
+        """Diferencia cards idênticos da mesma execução (#2, #3...)"""
+        identidade = identidade_card(jogador)
+        ocorrencia = self._ocorrencias.get(identidade, 0) + 1
+        self._ocorrencias[identidade] = ocorrencia
+        return identidade if ocorrencia == 1 else f"{identidade}#{ocorrencia}"
+
+    def gravar_pagina(self, jogadores, pagina):
+        """Insere os jogadores (registros ou dicionários) de uma página em uma única transação"""
+        if not jogadores:
+            return
+        linhas = [
+            (self.execucao_id, self._identidade_unica(registro), pagina, *registro.valores())
+            for registro in como_registros(jogadores)
+        ]
+        colunas = ', '.join(['execucao_id', 'identidade', 'pagina'] + list(COLUNAS_JOGADOR.values()))
+        marcadores = ', '.join('?' * (len(CAMPOS_JOGADOR) + 3))
+        with self.conexao:
+            self.conexao.executemany(
+                f'INSERT OR REPLACE INTO jogadores ({colunas}) VALUES ({marcadores})', linhas)
+
+    def gravar_impressao(self, pagina, impressao):
+        """Guarda a impressão digital da página na execução atual"""
+        with self.conexao:
+            self.conexao.execute(
+                'INSERT OR REPLACE INTO paginas (execucao_id, pagina, impressao) VALUES (?, ?, ?)',
+                (self.execucao_id, pagina, impressao))
+
+    def impressoes(self, execucao_id):
+        """Impressões digitais das páginas de uma execução ({pagina: impressao})"""
+        return dict(self.conexao.execute(
+            'SELECT pagina, impressao FROM paginas WHERE execucao_id = ?', (execucao_id,)))
+
+    def execucao_anterior(self, conta=None, secao='clube'):
+        """
+        Última execução concluída da conta na mesma seção, sem contar a atual
+        nem as re-extrações offline
+        """
+        linha = self.conexao.execute(
+            f"SELECT id FROM execucoes WHERE status = 'concluida' AND {SEM_OFFLINE} AND conta IS ? "
+            f"AND id != ? AND {self._secao_sql} = ? ORDER BY id DESC LIMIT 1",
+            (conta, self.execucao_id if self.execucao_id is not None else -1, secao)).fetchone()
+        return linha[0] if linha else None
+
+    def copiar_paginas(self, execucao_origem, pagina_inicial, pagina_final=None):
+        """
+        Copia jogadores e impressões das páginas [pagina_inicial, pagina_final]
+        de uma execução anterior para a atual (páginas inalteradas) e retorna
+        os registros dos jogadores copiados
+        """
+        pagina_final = pagina_final if pagina_final is not None else 2 ** 31
+        colunas = ', '.join(['identidade', 'pagina'] + list(COLUNAS_JOGADOR.values()))
+        parametros = (execucao_origem, pagina_inicial, pagina_final)
+        with self.conexao:
+            self.conexao.execute(
+                f'INSERT OR REPLACE INTO jogadores (execucao_id, {colunas}) '
+                f'SELECT ?, {colunas} FROM jogadores '
+                f'WHERE execucao_id = ? AND pagina BETWEEN ? AND ?', (self.execucao_id,) + parametros)
+            self.conexao.execute(
+                'INSERT OR REPLACE INTO paginas (execucao_id, pagina, impressao) '
+                'SELECT ?, pagina, impressao FROM paginas '
+                'WHERE execucao_id = ? AND pagina BETWEEN ? AND ?', (self.execucao_id,) + parametros)
+
+        cursor = self.conexao.execute(
+            f'SELECT {colunas} FROM jogadores WHERE execucao_id = ? AND pagina BETWEEN ? AND ? '
+            f'ORDER BY pagina, rowid', parametros)
+        linhas = cursor.fetchall()
+        self._contar_ocorrencias(linha[0] for linha in linhas)
+        return [JogadorRegistro.de_valores(linha[2:], self._id_item(linha[0])) for linha in linhas]
+
+    @staticmethod
+    def _id_item(identidade):
+        """ID do item da API contido na identidade (None para identidades por hash)"""
+        if identidade.startswith('id:'):
+            return int(identidade[3:].partition('#')[0])
+        return None
+
+    def finalizar_execucao(self, total, status='concluida'):
+        """Fecha a execução com o total de jogadores e o status final"""
+        if self.execucao_id is None:
+            return
+        with self.conexao:
+            self.conexao.execute(
+                'UPDATE execucoes SET fim = ?, total = ?, status = ? WHERE id = ?',
+                (datetime.now().isoformat(timespec='seconds'), total, status, self.execucao_id)
+            )
+
+    def fechar(self):
+        """Fecha a conexão com o banco"""
+        if self.conexao:
+            self.conexao.close()
+            self.conexao = None
+
+    # Consultas
+
+    def _dicionarios(self, cursor):
+        nomes = [coluna[0] for coluna in cursor.description]
+        return [dict(zip(nomes, linha)) for linha in cursor.fetchall()]
+
+    def execucoes(self, conta=None, limite=20):
+        """Últimas execuções (mais recentes primeiro)"""
+        if conta is None:
+            cursor = self.conexao.execute(
+                'SELECT * FROM execucoes ORDER BY id DESC LIMIT ?', (limite,))
+        else:
+            cursor = self.conexao.execute(
+                'SELECT * FROM execucoes WHERE conta = ? ORDER BY id DESC LIMIT ?', (conta, limite))
+        return self._dicionarios(cursor)
+
+    def ultima_execucao(self, conta=None, secao='clube'):
+        """
+        Id da última execução concluída da seção (e da conta, se informada),
+        sem contar as re-extrações offline
+        """
+        consulta = (f"SELECT id FROM execucoes WHERE status = 'concluida' AND {SEM_OFFLINE} "
+                    f"AND {self._secao_sql} = ?")
+        parametros = [secao]
+        if conta is not None:
+            consulta += ' AND conta IS ?'
+            parametros.append(conta)
+        linha = self.conexao.execute(consulta + ' ORDER BY id DESC LIMIT 1', parametros).fetchone()
+        return linha[0] if linha else None
+
+    def jogadores_execucao(self, execucao_id):
+        """Registros dos jogadores de uma execução, na ordem de coleta"""
+        colunas = ', '.join(['identidade'] + list(COLUNAS_JOGADOR.values()))
+        cursor = self.conexao.execute(
+            f'SELECT {colunas} FROM jogadores WHERE execucao_id = ? ORDER BY pagina, rowid', (execucao_id,))
+        return [JogadorRegistro.de_valores(linha[1:], self._id_item(linha[0])) for linha in cursor]
+
+    def historico_jogador(self, nome):
+        """Evolução de um jogador (pelo nome) em todas as execuções"""
+        cursor = self.conexao.execute(
+            'SELECT e.id AS execucao_id, e.inicio, j.identidade, j.overall, j.posicao, j.qualidade, j.status '
+            'FROM jogadores j JOIN execucoes e ON e.id = j.execucao_id '
+            'WHERE j.nome = ? ORDER BY e.id', (nome,))
+        return self._dicionarios(cursor)
+
+    def diferencas(self, execucao_anterior, execucao_atual):
+        """Cards adicionados, removidos e alterados entre duas execuções"""
+        def carregar(execucao_id):
+            cursor = self.conexao.execute('SELECT * FROM jogadores WHERE execucao_id = ?', (execucao_id,))
+            return {linha['identidade']: linha for linha in self._dicionarios(cursor)}
+
+        anterior = carregar(execucao_anterior)
+        atual = carregar(execucao_atual)
+        ignorar = {'execucao_id', 'identidade', 'pagina'}
+
+        alterados = []
+        for identidade in anterior.keys() & atual.keys():
+            campos = {coluna: (anterior[identidade][coluna], valor)
+                      for coluna, valor in atual[identidade].items()
+                      if coluna not in ignorar and anterior[identidade][coluna] != valor}
+            if campos:
+                alterados.append({'identidade': identidade, 'nome': atual[identidade]['nome'],
+                                  'campos': campos})
+
+        return {
+            'adicionados': [atual[i] for i in atual.keys() - anterior.keys()],
+            'removidos': [anterior[i] for i in anterior.keys() - atual.keys()],
+            'alterados': alterados
+        }
+
+    def __enter__(self):
+        return self.abrir()
+
+    def __exit__(self, *exc):
+        self.fechar()
+        return False
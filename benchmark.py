@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark offline dos motores de extração sobre fixtures HTML do clube
+
+Serve as páginas de `fixtures/` por um servidor HTTP local para o Chrome
+headless e mede, para cada motor (selenium, html, js, api), cards por segundo,
+chamadas ao WebDriver por card e tempo por página. Não precisa de login EA.
+
+Uso:
+    python benchmark.py                       # todos os motores, 3 repetições
+    python benchmark.py --motores html js -r 10
+    python benchmark.py --sem-navegador       # só o parse do HTML, sem Chrome
+"""
+
+import os
+import sys
+import json
+import time
+import glob
+import argparse
+import logging
+import threading
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+logger = logging.getLogger(__name__)
+
+DIRETORIO_FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+MOTORES = ('selenium', 'html', 'js', 'api')
+
+
+class _HandlerSilencioso(SimpleHTTPRequestHandler):
+    """Serve arquivos estáticos sem registrar cada requisição no stderr"""
+
+    def log_message(self, format, *args):
+        pass
+
+
+def iniciar_servidor(diretorio=DIRETORIO_FIXTURES, porta=0):
+    """Inicia um servidor HTTP local em segundo plano servindo o diretório"""
+    handler = partial(_HandlerSilencioso, directory=diretorio)
+    servidor = ThreadingHTTPServer(('127.0.0.1', porta), handler)
+    thread = threading.Thread(target=servidor.serve_forever, daemon=True)
+    thread.start()
+    logger.info(f"Servidor de fixtures em http://127.0.0.1:{servidor.server_port}/")
+    return servidor
+
+
+def listar_fixtures(diretorio=DIRETORIO_FIXTURES):
+    """Retorna os arquivos de página de clube disponíveis, em ordem"""
+    return sorted(glob.glob(os.path.join(diretorio, 'clube_pagina_*.html')))
+
+
+def medir_sem_navegador(fixtures, repeticoes):
+    """Mede apenas o parse do HTML (motor html) diretamente dos arquivos"""
+    from extratores import ExtratorHTML
+
+    extrator = ExtratorHTML()
+    paginas = [open(caminho, encoding='utf-8').read() for caminho in fixtures]
+
+    cards = 0
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        for html in paginas:
+            cards += len(extrator.extrair_pagina(html))
+    duracao = time.perf_counter() - inicio
+
+    return [{
+        'motor': 'html (sem navegador)',
+        'paginas': len(paginas) * repeticoes,
+        'cards': cards,
+        'segundos': duracao,
+        'comandos': 0
+    }]
+
+
+def medir_com_navegador(fixtures, motores, repeticoes):
+    """Carrega cada fixture no Chrome headless e mede cada motor"""
+    from fc25_scraper import FC25Scraper
+
+    scraper = FC25Scraper()
+    scraper.config.headless = True
+    if 'api' in motores:
+        # Liga o log de rede; as fixtures chamam ut/game/fc25/club/pagina_N.json
+        scraper.config.motor_extracao = 'api'
+    if not scraper.setup_driver():
+        raise RuntimeError("Não foi possível iniciar o Chrome headless")
+
+    servidor = iniciar_servidor()
+    instrumentacao = scraper.instrumentacao
+    resultados = {motor: {'motor': motor, 'paginas': 0, 'cards': 0, 'segundos': 0.0, 'comandos': 0}
+                  for motor in motores}
+
+    try:
+        for caminho in fixtures:
+            url = f"http://127.0.0.1:{servidor.server_port}/{os.path.basename(caminho)}"
+            scraper.captura_api.limpar()
+            scraper.driver.get(url)
+            scraper.aguardar_cards()
+            if 'api' in motores:
+                # A leitura do log de rede faz parte do custo do motor 'api'
+                comandos_antes = instrumentacao.total
+                inicio = time.perf_counter()
+                scraper.captura_api.coletar(scraper.driver)
+                resultados['api']['segundos'] += time.perf_counter() - inicio
+                resultados['api']['comandos'] += instrumentacao.total - comandos_antes
+
+            for motor in motores:
+                scraper.config.motor_extracao = motor
+                for _ in range(repeticoes):
+                    comandos_antes = instrumentacao.total
+                    inicio = time.perf_counter()
+                    jogadores = scraper.extrair_pagina(1)
+                    resultado = resultados[motor]
+                    resultado['segundos'] += time.perf_counter() - inicio
+                    resultado['comandos'] += instrumentacao.total - comandos_antes
+                    resultado['cards'] += len(jogadores)
+                    resultado['paginas'] += 1
+    finally:
+        servidor.shutdown()
+        scraper.driver.quit()
+
+    return list(resultados.values())
+
+
+def imprimir_resultados(resultados):
+    """Mostra a tabela de resultados do benchmark"""
+    print("\n" + "="*78)
+    print("BENCHMARK DOS MOTORES DE EXTRAÇÃO")
+    print("="*78)
+    print(f"{'Motor':<22}{'Páginas':>9}{'Cards':>8}{'Cards/s':>12}{'Cmds/card':>12}{'ms/página':>13}")
+    print("-"*78)
+    for r in resultados:
+        cards_por_segundo = r['cards'] / r['segundos'] if r['segundos'] else 0.0
+        comandos_por_card = r['comandos'] / r['cards'] if r['cards'] else 0.0
+        ms_por_pagina = 1000 * r['segundos'] / r['paginas'] if r['paginas'] else 0.0
+        r.update({
+            'cards_por_segundo': round(cards_por_segundo, 2),
+            'comandos_por_card': round(comandos_por_card, 2),
+            'ms_por_pagina': round(ms_por_pagina, 2)
+        })
+        print(f"{r['motor']:<22}{r['paginas']:>9}{r['cards']:>8}{cards_por_segundo:>12.1f}"
+              f"{comandos_por_card:>12.1f}{ms_por_pagina:>13.1f}")
+    print("="*78)
+
+
+def main(argv=None):
+    """Função principal do benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark offline dos motores de extração")
+    parser.add_argument('--motores', nargs='+', choices=MOTORES, default=list(MOTORES),
+                        help="motores a medir (padrão: todos)")
+    parser.add_argument('-r', '--repeticoes', type=int, default=3,
+                        help="repetições por página e motor (padrão: 3)")
+    parser.add_argument('--fixtures', default=DIRETORIO_FIXTURES,
+                        help="diretório com as páginas clube_pagina_*.html")
+    parser.add_argument('--sem-navegador', action='store_true',
+                        help="mede só o parse do HTML, sem abrir o Chrome")
+    parser.add_argument('--json', help="grava os resultados neste arquivo JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    fixtures = listar_fixtures(args.fixtures)
+    if not fixtures:
+        print(f"❌ Nenhuma fixture encontrada em {args.fixtures}")
+        return 1
+
+    if args.sem_navegador:
+        resultados = medir_sem_navegador(fixtures, args.repeticoes)
+    else:
+        resultados = medir_com_navegador(fixtures, args.motores, args.repeticoes)
+
+    imprimir_resultados(resultados)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as arquivo:
+            json.dump(resultados, arquivo, indent=2, ensure_ascii=False)
+        print(f"📁 Resultados gravados em {args.json}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
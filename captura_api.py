@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Captura das respostas JSON da API do clube (motor de extração 'api')
+
+A tela Clube > Jogadores é preenchida por respostas XHR/fetch com a lista
+`itemData` dos cards. Com o log de performance do Chrome ativo, cada resposta
+da API do clube aparece como eventos `Network.*`; o corpo é lido com o comando
+CDP `Network.getResponseBody` e convertido para o mesmo esquema de jogador dos
+motores baseados no DOM, com IDs e atributos numéricos exatos.
+"""
+
+import re
+import json
+import base64
+import logging
+
+from extratores import ESTATISTICAS, jogador_vazio
+from identificadores import tabela_padrao
+
+logger = logging.getLogger(__name__)
+
+# Capability que liga o log de performance (eventos de rede do DevTools)
+CAPACIDADE_LOG_PERFORMANCE = ('goog:loggingPrefs', {'performance': 'ALL'})
+
+# Endpoint que devolve os itens do clube (web app real e fixtures locais)
+PADRAO_URL_CLUBE = r'/ut/game/fc\d+/club'
+
+# rareflag do item -> qualidade usada pelos motores do DOM
+QUALIDADE_POR_RAREFLAG = {
+    0: 'Base',
+    1: 'Base',
+    12: 'Icon',
+    72: 'Hero'
+}
+
+
+def mapear_item(item, resolvedor=None):
+    """
+    Converte um item de `itemData` para o esquema padrão de jogador. Os IDs de
+    clube, nação e liga passam pela mesma tabela de identificadores dos escudos
+    """
+    resolvedor = resolvedor or tabela_padrao()
+    jogador = jogador_vazio()
+
+    nome = item.get('commonName') or ' '.join(
+        parte for parte in (item.get('firstName'), item.get('lastName')) if parte)
+    if nome:
+        jogador['Nome'] = nome
+
+    if item.get('rating') is not None:
+        jogador['Overall'] = str(item['rating'])
+        jogador['Rating'] = jogador['Overall']
+
+    posicao = item.get('preferredPosition')
+    if posicao:
+        jogador['Posição'] = posicao
+    outras = [p for p in item.get('possiblePositions') or [] if p != posicao]
+    if outras:
+        jogador['Posições_Alternativas'] = ', '.join(outras)
+
+    # IDs numéricos exatos de clube, nação e liga, com os mesmos nomes do DOM
+    for campo, chave, tipo in (('Clube', 'teamid', 'clubes'), ('Nação', 'nation', 'nacoes'),
+                               ('Liga', 'leagueId', 'ligas')):
+        if item.get(chave):
+            jogador[campo] = resolvedor.nome(tipo, item[chave])
+
+    for label, valor in zip(ESTATISTICAS, item.get('attributeArray') or []):
+        jogador[label] = str(valor)
+
+    rareflag = item.get('rareflag', 0)
+    jogador['Qualidade'] = QUALIDADE_POR_RAREFLAG.get(rareflag, 'Special')
+    jogador['Status'] = 'Untradeable' if item.get('untradeable') else 'Tradeable'
+
+    # Identidade do card (fora de CAMPOS_JOGADOR, não vai para o CSV)
+    jogador['ID'] = item.get('id')
+    jogador['Asset_ID'] = item.get('assetId')
+    return jogador
+
+
+def mapear_itens(itens, resolvedor=None):
+    """Converte a lista `itemData`, ignorando itens que não são jogadores"""
+    return [mapear_item(item, resolvedor) for item in itens if item.get('itemType', 'player') == 'player']
+
+
+def completar_com_dom(jogadores, jogadores_dom):
+    """
+    Preenche os campos que a API não traz (nome e traits) com os dados do DOM
+    da mesma página. Os cards aparecem na mesma ordem dos itens da resposta;
+    se as quantidades diferem (itens que não são jogadores, renderização
+    parcial), a página é extraída só do DOM
+    """
+    if len(jogadores) != len(jogadores_dom):
+        logger.warning(f"API com {len(jogadores)} jogadores e DOM com {len(jogadores_dom)} cards; "
+                       f"usando o DOM")
+        return jogadores_dom
+    for jogador, jogador_dom in zip(jogadores, jogadores_dom):
+        if jogador['Nome'] == 'N/A':
+            jogador['Nome'] = jogador_dom['Nome']
+        if jogador['Traits'] == 'N/A':
+            jogador['Traits'] = jogador_dom['Traits']
+    return jogadores
+
+
+class CapturaAPI:
+    """
+    Lê o log de performance do Chrome e guarda os itens da última resposta do
+    endpoint (clube por padrão; cada seção de secoes.py tem o seu)
+    """
+
+    def __init__(self, padrao_url=PADRAO_URL_CLUBE):
+        self.padrao_url = re.compile(padrao_url)
+        self.pendentes = {}
+        self.itens = []
+        self.respostas = 0
+
+    def _eventos(self, driver):
+        """Eventos de rede registrados desde a última leitura do log"""
+        for entrada in driver.get_log('performance'):
+            try:
+                mensagem = json.loads(entrada['message'])['message']
+            except (KeyError, ValueError):
+                continue
+            if mensagem.get('method', '').startswith('Network.'):
+                yield mensagem['method'], mensagem.get('params', {})
+
+    def _corpo(self, driver, request_id):
+        """Lê o corpo da resposta pelo DevTools Protocol (None se indisponível)"""
+        try:
+            resposta = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+        except Exception as e:
+            logger.debug(f"Corpo da resposta {request_id} indisponível: {str(e)}")
+            return None
+        corpo = resposta.get('body', '')
+        if resposta.get('base64Encoded'):
+            corpo = base64.b64decode(corpo).decode('utf-8')
+        return corpo
+
+    def coletar(self, driver):
+        """
+        Processa o log de performance e retorna os itens da resposta do clube
+        mais recente (a lista anterior é mantida se nenhuma resposta nova chegou)
+        """
+        concluidas = []
+        for metodo, params in self._eventos(driver):
+            if metodo == 'Network.responseReceived':
+                url = params.get('response', {}).get('url', '')
+                if self.padrao_url.search(url):
+                    self.pendentes[params['requestId']] = url
+            elif metodo == 'Network.loadingFinished' and params.get('requestId') in self.pendentes:
+                concluidas.append(params['requestId'])
+
+        novos = None
+        for request_id in concluidas:
+            url = self.pendentes.pop(request_id)
+            corpo = self._corpo(driver, request_id)
+            if not corpo:
+                continue
+            try:
+                dados = json.loads(corpo)
+            except ValueError:
+                logger.warning(f"Resposta da API não é JSON: {url}")
+                continue
+            if isinstance(dados, dict) and 'auctionInfo' in dados:
+                # Lista de transferências: cada leilão traz o item em `itemData`
+                dados = {'itemData': [leilao['itemData'] for leilao in dados['auctionInfo']
+                                      if leilao.get('itemData')]}
+            if isinstance(dados, dict) and 'itemData' in dados:
+                novos = dados['itemData']
+                self.respostas += 1
+                logger.info(f"Resposta da API capturada ({self.respostas}ª): {len(novos)} itens ({url})")
+
+        if novos is not None:
+            self.itens = novos
+        return self.itens
+
+    def limpar(self):
+        """Descarta os itens da página atual (chamado antes de trocar de página)"""
+        self.itens = []
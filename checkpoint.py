@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Checkpoint da coleta paginada, usado para retomar uma execução interrompida
+"""
+
+import os
+import json
+import logging
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+class Checkpoint:
+    """
+    Guarda a última página concluída, a quantidade de cards vistos e o tamanho
+    dos arquivos de saída após essa página. É regravado ao fim de cada página.
+    """
+
+    def __init__(self, caminho='checkpoint_fc25.json'):
+        self.caminho = caminho
+
+    def carregar(self):
+        """Retorna o estado salvo ou None se não houver checkpoint válido"""
+        if not os.path.exists(self.caminho):
+            return None
+        try:
+            with open(self.caminho, 'r', encoding='utf-8') as arquivo:
+                estado = json.load(arquivo)
+            logger.info(f"Checkpoint encontrado: página {estado['pagina']} concluída, "
+                        f"{estado['total_coletados']} jogadores gravados")
+            return estado
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Checkpoint inválido ignorado ({self.caminho}): {str(e)}")
+            return None
+
+    def salvar(self, pagina, cards_vistos, total_coletados, offsets, **extras):
+        """Grava o checkpoint de forma atômica (arquivo temporário + replace)"""
+        estado = {
+            'pagina': pagina,
+            'cards_vistos': cards_vistos,
+            'total_coletados': total_coletados,
+            'offsets': offsets,
+            'atualizado_em': datetime.now().isoformat(timespec='seconds')
+        }
+        estado.update(extras)
+
+        temporario = self.caminho + '.tmp'
+        with open(temporario, 'w', encoding='utf-8') as arquivo:
+            json.dump(estado, arquivo, indent=2, ensure_ascii=False)
+        os.replace(temporario, self.caminho)
+
+    def limpar(self):
+        """Remove o checkpoint (coleta concluída)"""
+        if os.path.exists(self.caminho):
+            os.remove(self.caminho)
+            logger.info("Checkpoint removido: coleta concluída")
@@ -5,19 +5,183 @@ Configurações para o EA FC 25 Web App Scraper
 """
 
 import os
+import copy
+import json
 from getpass import getpass
 
+from captura_api import PADRAO_URL_CLUBE
+
 class Config:
     """Classe para gerenciar configurações do scraper"""
     
+    # Motores de extração disponíveis:
+    #   selenium - um find_element por campo de cada card (comportamento original)
+    #   html     - um único page_source por página, processado com lxml/BeautifulSoup
+    #   js       - uma única chamada execute_script por página, que devolve JSON
+    #   api      - respostas JSON da API do clube lidas do log de performance do Chrome (CDP),
+    #              com nome e traits completados pelo DOM
+    MOTORES_EXTRACAO = ('selenium', 'html', 'js', 'api')
+    
+    # Padrões de URL bloqueados no modo enxuto (Network.setBlockedURLs do CDP).
+    # Os atributos src continuam no DOM; apenas o download é evitado
+    PADROES_BLOQUEADOS = [
+        '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+        '*.mp4', '*.webm', '*.mp3', '*.ogg',
+        '*.woff', '*.woff2', '*.ttf', '*.otf'
+    ]
+    
     def __init__(self):
         self.email = None
         self.senha = None
         self.auto_login = False
+        self.motor_extracao = os.getenv('FC25_MOTOR', 'selenium')
+        self.headless = False
+        
+        # Motor 'api': URL (regex) das respostas JSON do clube lidas do log de rede
+        self.padrao_url_api = PADRAO_URL_CLUBE
+        
+        # Modo enxuto: headless, viewport fixo, bloqueio de imagens/mídia/fontes
+        # e animações desligadas (menos rede e memória por navegador)
+        self.modo_enxuto = os.getenv('FC25_ENXUTO', '').lower() in ('1', 'true', 'sim')
+        self.tamanho_janela = (1366, 900)
+        self.padroes_bloqueados = list(self.PADROES_BLOQUEADOS)
+        
+        # Execução não interativa (pool de contas, cron): nunca chama input();
+        # sem credenciais, aguarda o login na janela até timeout_login_manual
+        self.interativo = True
+        self.timeout_login_manual = 300
+        
+        # Conta e perfil do Chrome (--user-data-dir) usados nesta execução.
+        # Com um perfil persistente, uma sessão EA já autenticada é reaproveitada
+        # e a fase de login é pulada
+        self.conta = None
+        self.perfil_dir = os.getenv('FC25_PERFIL_DIR')
+        self.reutilizar_sessao = True
+        self.timeout_sessao = 15
+        
+        # Esperas por condição (segundos)
+        self.timeout_espera = 20
+        self.intervalo_espera = 0.2
+        self.timeout_verificacao_login = 5
+        self.timeout_cards = 10
+        
+        # Arquivos de saída (gravados página a página durante a coleta)
+        self.arquivo_csv = 'jogadores_fc25.csv'
+        self.arquivo_jsonl = 'jogadores_fc25.jsonl'
+        # Mantém também os jogadores em memória (self.jogadores, como JogadorRegistro); desligado
+        # para que a memória não cresça com o tamanho do clube
+        self.manter_em_memoria = False
+        # Carrega o CSV final em um DataFrame para o preview (pós-processamento opcional)
+        self.exportar_dataframe = True
+        
+        # Pipeline: o processamento de cada página roda em outra thread enquanto
+        # o navegador já avança para a próxima (fila limitada = contrapressão)
+        self.pipeline = True
+        self.tamanho_fila_pipeline = 2
+        
+        # Filtro da coleta (overall, posições, qualidade, status), aplicado pelos
+        # controles da tela do clube; ex.: "overall>=85 posicao=ST,CF" (filtros.py)
+        self.filtro = os.getenv('FC25_FILTRO')
+        
+        # Seções coletadas em sequência na mesma sessão (secoes.py): clube,
+        # transferencias, nao_atribuidos, armazenamento_sbc. Cada seção além do
+        # clube grava seus próprios arquivos (jogadores_fc25_<secao>.csv, ...)
+        self.secoes = [secao.strip() for secao in os.getenv('FC25_SECOES', 'clube').split(',') if secao.strip()]
+        self.secao = 'clube'
+        
+        # Grava o HTML de cada página em snapshots/execucao_<id>.jsonl.gz para
+        # re-extração offline (python snapshots.py ...)
+        self.gravar_snapshots = os.getenv('FC25_SNAPSHOTS', '').lower() in ('1', 'true', 'sim')
+        self.diretorio_snapshots = 'snapshots'
+        
+        # Histórico das execuções em SQLite (None desativa); várias contas
+        # podem compartilhar o mesmo banco (coluna conta)
+        self.arquivo_banco = 'historico_fc25.db'
+        
+        # Coleta incremental: páginas com a mesma impressão digital da última
+        # execução são copiadas do histórico; as mudanças vão para arquivo_diferencas.
+        # parar_em_pagina_inalterada encerra a paginação na primeira página igual
+        # (use apenas se a ordenação do clube garantir que o resto não mudou)
+        self.incremental = os.getenv('FC25_INCREMENTAL', '').lower() in ('1', 'true', 'sim')
+        self.parar_em_pagina_inalterada = False
+        self.arquivo_diferencas = 'diferencas_fc25.json'
+        
+        # Checkpoint da coleta paginada (--resume continua da última página concluída)
+        self.arquivo_checkpoint = 'checkpoint_fc25.json'
+        self.retomar = False
+        
+        # Perfil dos comandos do WebDriver por fase (None desativa cada saída);
+        # o flamegraph usa o formato "collapsed stacks"
+        self.arquivo_perfil = 'perfil_webdriver.json'
+        self.arquivo_flamegraph = None
+        
+        # Log assíncrono: arquivo com rotação (uma linha JSON por registro) e
+        # amostras por página das mensagens repetidas de cada card
+        self.arquivo_log = 'fc25_scraper.log'
+        self.log_json = True
+        self.log_max_bytes = 10 * 1024 * 1024
+        self.log_backups = 5
+        self.amostras_log_por_pagina = 1
+        
+        # Manifesto local versão do Chrome -> chromedriver verificado
+        self.arquivo_manifesto_driver = 'chromedriver_manifesto.json'
+        
+        # Seletores aprendidos por versão do web app
+        self.arquivo_cache_seletores = 'seletores_cache.json'
+        
+        # IDs de clube/nação/liga vistos nos escudos e ausentes da tabela versionada
+        self.arquivo_cache_identificadores = 'identificadores_cache.json'
+    
+    def carregar_arquivo(self, caminho):
+        """
+        Aplica um arquivo JSON de configuração ({"motor_extracao": "html", ...});
+        as chaves são os atributos desta classe
+        """
+        with open(caminho, 'r', encoding='utf-8') as arquivo:
+            valores = json.load(arquivo)
+        
+        desconhecidas = [chave for chave in valores if not hasattr(self, chave)]
+        if desconhecidas:
+            raise ValueError(f"Opções desconhecidas em {caminho}: {', '.join(desconhecidas)}")
+        for chave, valor in valores.items():
+            if chave == 'tamanho_janela':
+                valor = tuple(valor)
+            setattr(self, chave, valor)
+        return self
+    
+    def para_conta(self, conta, diretorio_saida='.', diretorio_perfis='perfis'):
+        """Direciona perfil do Chrome e arquivos de saída para uma conta específica"""
+        self.conta = conta
+        self.perfil_dir = os.path.abspath(os.path.join(diretorio_perfis, conta))
+        self.arquivo_csv = os.path.join(diretorio_saida, f'jogadores_{conta}.csv')
+        self.arquivo_jsonl = os.path.join(diretorio_saida, f'jogadores_{conta}.jsonl')
+        self.arquivo_checkpoint = os.path.join(diretorio_saida, f'checkpoint_{conta}.json')
+        self.arquivo_diferencas = os.path.join(diretorio_saida, f'diferencas_{conta}.json')
+        if self.arquivo_perfil:
+            self.arquivo_perfil = os.path.join(diretorio_saida, f'perfil_webdriver_{conta}.json')
+        return self
+    
+    def para_secao(self, secao):
+        """
+        Cópia desta configuração com os arquivos de saída, checkpoint e
+        diferenças da seção (o clube mantém os nomes originais)
+        """
+        from secoes import caminho_da_secao
+        
+        config = copy.copy(self)
+        config.secao = secao
+        for atributo in ('arquivo_csv', 'arquivo_jsonl', 'arquivo_checkpoint', 'arquivo_diferencas'):
+            setattr(config, atributo, caminho_da_secao(getattr(self, atributo), secao))
+        return config
     
     def carregar_credenciais(self):
         """Carrega credenciais das variáveis de ambiente ou solicita ao usuário"""
         
+        # Credenciais já definidas (ex.: arquivo de contas do pool)
+        if self.email and self.senha:
+            self.auto_login = True
+            return True
+        
         # Tenta carregar das variáveis de ambiente primeiro
         self.email = os.getenv('EA_EMAIL')
         self.senha = os.getenv('EA_SENHA')
@@ -27,6 +191,10 @@ class Config:
             self.auto_login = True
             return True
         
+        # Em modo não interativo não há a quem perguntar
+        if not self.interativo:
+            return False
+        
         # Se não encontrou, pergunta ao usuário
         print("\n" + "="*50)
         print("CONFIGURAÇÃO DE LOGIN AUTOMÁTICO")
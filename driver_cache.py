@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Resolução do chromedriver com cache local (offline-first)
+
+Mantém um manifesto que associa a versão principal do Chrome instalado ao
+caminho de um chromedriver já verificado. Se o manifesto tiver um driver
+compatível, nada é consultado na rede; o webdriver-manager só é chamado
+quando a versão do Chrome muda ou o driver salvo deixa de existir.
+"""
+
+import os
+import re
+import sys
+import json
+import shutil
+import logging
+import threading
+import subprocess
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# Executáveis do Chrome testados em Linux/macOS
+EXECUTAVEIS_CHROME = [
+    'google-chrome',
+    'google-chrome-stable',
+    'chromium',
+    'chromium-browser',
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'
+]
+
+# Chaves do registro onde o Chrome guarda a versão no Windows
+CHAVES_REGISTRO_CHROME = [
+    r'HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon',
+    r'HKEY_LOCAL_MACHINE\Software\Google\Chrome\BLBeacon',
+    r'HKEY_LOCAL_MACHINE\Software\WOW6432Node\Google\Chrome\BLBeacon'
+]
+
+PADRAO_VERSAO = re.compile(r'(\d+)\.\d+\.\d+\.\d+')
+
+
+def _executar(comando):
+    """Executa um comando curto e retorna a saída (ou '' em caso de erro)"""
+    try:
+        resultado = subprocess.run(comando, capture_output=True, text=True, timeout=10)
+        return resultado.stdout or ''
+    except (OSError, subprocess.SubprocessError):
+        return ''
+
+
+def versao_principal(texto):
+    """Extrai a versão principal (ex.: '126') de um texto com versão completa"""
+    match = PADRAO_VERSAO.search(texto or '')
+    return match.group(1) if match else None
+
+
+def detectar_versao_chrome():
+    """Detecta a versão completa do Chrome instalado sem acessar a rede"""
+    if sys.platform.startswith('win'):
+        for chave in CHAVES_REGISTRO_CHROME:
+            saida = _executar(['reg', 'query', chave, '/v', 'version'])
+            match = PADRAO_VERSAO.search(saida)
+            if match:
+                return match.group(0)
+        return None
+
+    for executavel in EXECUTAVEIS_CHROME:
+        if os.path.isabs(executavel):
+            if not os.path.exists(executavel):
+                continue
+        elif not shutil.which(executavel):
+            continue
+        match = PADRAO_VERSAO.search(_executar([executavel, '--version']))
+        if match:
+            return match.group(0)
+    return None
+
+
+def detectar_versao_driver(caminho):
+    """Retorna a versão completa do chromedriver informado"""
+    match = PADRAO_VERSAO.search(_executar([caminho, '--version']))
+    return match.group(0) if match else None
+
+
+class ResolvedorDriver:
+    """Resolve o caminho do chromedriver consultando primeiro o manifesto local"""
+
+    _trava = threading.Lock()
+
+    def __init__(self, manifesto='chromedriver_manifesto.json'):
+        self.manifesto = manifesto
+
+    def _ler_manifesto(self):
+        if not os.path.exists(self.manifesto):
+            return {}
+        try:
+            with open(self.manifesto, 'r', encoding='utf-8') as arquivo:
+                return json.load(arquivo)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Manifesto do chromedriver ignorado ({self.manifesto}): {str(e)}")
+            return {}
+
+    def _gravar_manifesto(self, dados):
+        with open(self.manifesto, 'w', encoding='utf-8') as arquivo:
+            json.dump(dados, arquivo, indent=2, ensure_ascii=False)
+
+    def _driver_valido(self, entrada, principal):
+        """Confere se o driver do manifesto existe e tem a versão principal esperada"""
+        caminho = entrada.get('caminho')
+        if not caminho or not os.path.exists(caminho):
+            return False
+        return versao_principal(detectar_versao_driver(caminho)) == principal
+
+    def resolver(self):
+        """Retorna o caminho de um chromedriver compatível com o Chrome instalado"""
+        with self._trava:
+            versao_chrome = detectar_versao_chrome()
+            principal = versao_principal(versao_chrome)
+            dados = self._ler_manifesto()
+
+            if principal and principal in dados and self._driver_valido(dados[principal], principal):
+                logger.info(f"chromedriver {principal} encontrado no manifesto local (sem rede)")
+                return dados[principal]['caminho']
+
+            if principal is None:
+                # Sem versão do Chrome detectável: usa o driver verificado mais recente
+                for chave in sorted(dados, key=lambda v: int(v) if v.isdigit() else 0, reverse=True):
+                    if self._driver_valido(dados[chave], chave):
+                        logger.warning(f"Versão do Chrome não detectada; usando chromedriver {chave} do manifesto")
+                        return dados[chave]['caminho']
+
+            # Versão nova ou driver ausente: recorre ao webdriver-manager
+            logger.info(f"chromedriver para o Chrome {versao_chrome or '(versão desconhecida)'} "
+                        f"não está no manifesto; consultando o webdriver-manager...")
+            from webdriver_manager.chrome import ChromeDriverManager
+            caminho = ChromeDriverManager().install()
+
+            versao_driver = detectar_versao_driver(caminho)
+            chave = principal or versao_principal(versao_driver)
+            if chave:
+                dados[chave] = {
+                    'caminho': caminho,
+                    'versao_chrome': versao_chrome,
+                    'versao_driver': versao_driver,
+                    'verificado_em': datetime.now().isoformat(timespec='seconds')
+                }
+                self._gravar_manifesto(dados)
+                logger.info(f"Manifesto do chromedriver atualizado: {chave} -> {caminho}")
+            return caminho
@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Melhor escalação (XI) por formação a partir dos jogadores coletados
+
+Para cada formação é montada uma matriz NumPy jogador x posição da formação
+com a aptidão de cada card: overall e atributos (PAC..PHY) ponderados pela
+posição, multiplicados por um fator que depende da posição principal e das
+alternativas do jogador. A escalação é o problema de atribuição sobre essa
+matriz:
+
+- só os 11 melhores candidatos de cada posição podem entrar no XI ótimo,
+  então o clube inteiro é reduzido a no máximo 121 candidatos com argpartition;
+- com SciPy instalado, a atribuição usa linear_sum_assignment; sem ele, uma
+  programação dinâmica exata sobre os subconjuntos de posições, vetorizada em
+  NumPy (2^11 estados por jogador);
+- o bônus de química (liga, nação e clube em comum) é aproximado resolvendo de
+  novo com a química do XI anterior somada à aptidão, até estabilizar.
+
+Uso:
+    python escalacao.py jogadores_fc25.csv --formacoes 4-3-3 4-2-3-1 --quimica 1.5
+"""
+
+import sys
+import csv
+import json
+import time
+import argparse
+import logging
+
+import numpy as np
+
+from extratores import ESTATISTICAS
+from registros import JogadorRegistro, Posicao
+
+logger = logging.getLogger(__name__)
+
+FORMACOES = {
+    '4-3-3': ['GK', 'LB', 'CB', 'CB', 'RB', 'CM', 'CM', 'CM', 'LW', 'ST', 'RW'],
+    '4-4-2': ['GK', 'LB', 'CB', 'CB', 'RB', 'LM', 'CM', 'CM', 'RM', 'ST', 'ST'],
+    '4-2-3-1': ['GK', 'LB', 'CB', 'CB', 'RB', 'CDM', 'CDM', 'LM', 'CAM', 'RM', 'ST'],
+    '4-1-2-1-2': ['GK', 'LB', 'CB', 'CB', 'RB', 'CDM', 'CM', 'CM', 'CAM', 'ST', 'ST'],
+    '3-5-2': ['GK', 'CB', 'CB', 'CB', 'LM', 'CDM', 'CDM', 'RM', 'CAM', 'ST', 'ST'],
+    '3-4-3': ['GK', 'CB', 'CB', 'CB', 'LM', 'CM', 'CM', 'RM', 'LW', 'ST', 'RW'],
+    '5-3-2': ['GK', 'LWB', 'CB', 'CB', 'CB', 'RWB', 'CM', 'CM', 'CM', 'ST', 'ST'],
+}
+
+POSICOES = [posicao.value for posicao in Posicao]
+INDICE_POSICAO = {posicao: indice for indice, posicao in enumerate(POSICOES)}
+
+# Peso de cada atributo (PAC, SHO, PAS, DRI, DEF, PHY) na aptidão de cada posição
+PESOS_ATRIBUTOS = {
+    'GK': (0, 0, 0, 0, 0, 0),
+    'CB': (0.10, 0, 0.10, 0, 0.50, 0.30),
+    'LB': (0.30, 0, 0.20, 0.10, 0.30, 0.10),
+    'RB': (0.30, 0, 0.20, 0.10, 0.30, 0.10),
+    'LWB': (0.30, 0, 0.25, 0.20, 0.15, 0.10),
+    'RWB': (0.30, 0, 0.25, 0.20, 0.15, 0.10),
+    'CDM': (0, 0, 0.30, 0.10, 0.35, 0.25),
+    'CM': (0.05, 0.10, 0.40, 0.30, 0.10, 0.05),
+    'CAM': (0.10, 0.25, 0.30, 0.35, 0, 0),
+    'LM': (0.30, 0.10, 0.30, 0.30, 0, 0),
+    'RM': (0.30, 0.10, 0.30, 0.30, 0, 0),
+    'LW': (0.35, 0.20, 0.15, 0.30, 0, 0),
+    'RW': (0.35, 0.20, 0.15, 0.30, 0, 0),
+    'ST': (0.30, 0.50, 0, 0.10, 0, 0.10),
+    'CF': (0.20, 0.35, 0.15, 0.30, 0, 0),
+}
+PESO_OVERALL = 0.8
+
+# Fatores de posição: principal, alternativa do card e posição parecida (fora disso não joga)
+FATOR_PRINCIPAL = 1.0
+FATOR_ALTERNATIVA = 0.995
+FATOR_PARECIDA = 0.85
+POSICOES_PARECIDAS = [
+    ('LB', 'LWB'), ('RB', 'RWB'), ('CDM', 'CM'), ('CM', 'CAM'), ('CAM', 'CF'),
+    ('LM', 'LW'), ('RM', 'RW'), ('ST', 'CF'), ('LB', 'LM'), ('RB', 'RM')
+]
+
+# Química no estilo do jogo: pontos por quantidade de jogadores do mesmo clube,
+# nação e liga no XI (máximo de 3 por jogador)
+LIMIARES_QUIMICA = {
+    'clube': (2, 5, 7),
+    'nacao': (2, 5, 8),
+    'liga': (3, 5, 8)
+}
+QUIMICA_MAXIMA = 3
+ITERACOES_QUIMICA = 6
+
+CANDIDATOS_POR_POSICAO = 11
+
+
+def _matriz_fatores():
+    """Fator posição principal x posição da formação"""
+    fatores = np.zeros((len(POSICOES), len(POSICOES)))
+    for a, b in POSICOES_PARECIDAS:
+        fatores[INDICE_POSICAO[a], INDICE_POSICAO[b]] = FATOR_PARECIDA
+        fatores[INDICE_POSICAO[b], INDICE_POSICAO[a]] = FATOR_PARECIDA
+    np.fill_diagonal(fatores, FATOR_PRINCIPAL)
+    return fatores
+
+
+FATORES_POSICAO = _matriz_fatores()
+MATRIZ_PESOS = np.array([PESOS_ATRIBUTOS[posicao] for posicao in POSICOES], dtype=float)
+
+
+class ElencoVetorizado:
+    """Colunas NumPy dos jogadores coletados (montadas uma vez por elenco)"""
+
+    def __init__(self, registros):
+        # Posições fora do enum (mantidas como texto) não têm linha nos fatores
+        self.registros = [r for r in registros if r.overall is not None and isinstance(r.posicao, Posicao)]
+        n = len(self.registros)
+        self.overall = np.array([r.overall for r in self.registros], dtype=float)
+        self.posicao = np.array([INDICE_POSICAO[r.posicao.value] for r in self.registros], dtype=np.intp)
+
+        self.alternativas = np.zeros((n, len(POSICOES)), dtype=bool)
+        for i, registro in enumerate(self.registros):
+            for posicao in (registro.posicoes_alternativas or '').split(','):
+                indice = INDICE_POSICAO.get(posicao.strip())
+                if indice is not None:
+                    self.alternativas[i, indice] = True
+
+        # Atributos ausentes assumem o overall do card
+        atributos = np.array(
+            [[getattr(r, a) if getattr(r, a) is not None else np.nan for a in ('pac', 'sho', 'pas', 'dri', 'def_', 'phy')]
+             for r in self.registros], dtype=float).reshape(n, len(ESTATISTICAS))
+        self.atributos = np.where(np.isnan(atributos), self.overall[:, None], atributos)
+
+        # Códigos inteiros de clube, nação e liga para a contagem da química
+        self.grupos = {
+            'clube': self._codigos([r.clube for r in self.registros]),
+            'nacao': self._codigos([r.nacao for r in self.registros]),
+            'liga': self._codigos([r.liga for r in self.registros])
+        }
+        self.nomes = self._codigos([r.nome for r in self.registros])
+
+    @staticmethod
+    def _codigos(valores):
+        """Código inteiro por valor (-1 para ausente)"""
+        codigos = {}
+        return np.array([codigos.setdefault(v, len(codigos)) if v is not None else -1 for v in valores],
+                        dtype=np.intp)
+
+    def __len__(self):
+        return len(self.registros)
+
+    def aptidao(self, posicoes):
+        """Matriz jogador x posição da formação (-inf onde o jogador não pode atuar)"""
+        indices = np.array([INDICE_POSICAO[p] for p in posicoes], dtype=np.intp)
+        fatores = FATORES_POSICAO[self.posicao][:, indices]
+        fatores = np.maximum(fatores, self.alternativas[:, indices] * FATOR_ALTERNATIVA)
+
+        pesos = MATRIZ_PESOS[indices]
+        soma_pesos = pesos.sum(axis=1)
+        ponderados = np.divide(self.atributos @ pesos.T, soma_pesos, where=soma_pesos > 0,
+                               out=np.repeat(self.overall[:, None], len(indices), axis=1))
+        base = PESO_OVERALL * self.overall[:, None] + (1 - PESO_OVERALL) * ponderados
+        return np.where(fatores > 0, base * fatores, -np.inf)
+
+
+def _pontos(contagem, limiares):
+    return (contagem >= limiares[0]).astype(int) + (contagem >= limiares[1]) + (contagem >= limiares[2])
+
+
+def quimica_candidatos(elenco, escalados):
+    """
+    Química que cada jogador do elenco teria no XI `escalados` (contando a si
+    mesmo), calculada para todos de uma vez
+    """
+    total = np.zeros(len(elenco), dtype=int)
+    for grupo, limiares in LIMIARES_QUIMICA.items():
+        codigos = elenco.grupos[grupo]
+        do_xi = codigos[escalados]
+        contagem = np.bincount(do_xi[do_xi >= 0], minlength=codigos.max() + 2)
+        ja_no_xi = np.zeros(len(elenco), dtype=int)
+        ja_no_xi[escalados] = 1
+        por_jogador = np.where(codigos >= 0, contagem[codigos] + 1 - ja_no_xi, 0)
+        total += _pontos(por_jogador, limiares)
+    return np.minimum(total, QUIMICA_MAXIMA)
+
+
+def _atribuicao_dp(pesos):
+    """
+    Atribuição exata por programação dinâmica sobre subconjuntos de posições,
+    vetorizada em NumPy. Retorna {candidato: posição} ou None se inviável
+    """
+    m, k = pesos.shape
+    estados = np.arange(1 << k)
+    dp = np.full(1 << k, -np.inf)
+    dp[0] = 0.0
+    escolhas = np.full((m, 1 << k), -1, dtype=np.int8)
+    sem_bit = [estados[(estados & (1 << s)) == 0] for s in range(k)]
+
+    for p in range(m):
+        novo = dp.copy()
+        for s in range(k):
+            if pesos[p, s] == -np.inf:
+                continue
+            origem = sem_bit[s]
+            candidato = dp[origem] + pesos[p, s]
+            destino = origem | (1 << s)
+            melhor = candidato > novo[destino]
+            novo[destino[melhor]] = candidato[melhor]
+            escolhas[p, destino[melhor]] = s
+        dp = novo
+
+    completo = (1 << k) - 1
+    if dp[completo] == -np.inf:
+        return None
+    atribuicao = {}
+    estado = completo
+    for p in range(m - 1, -1, -1):
+        s = escolhas[p, estado]
+        if s >= 0:
+            atribuicao[p] = int(s)
+            estado ^= 1 << int(s)
+    return atribuicao
+
+
+def _atribuicao_scipy(pesos):
+    from scipy.optimize import linear_sum_assignment
+
+    finitos = np.where(np.isfinite(pesos), pesos, -1e9)
+    linhas, colunas = linear_sum_assignment(finitos, maximize=True)
+    if not np.all(np.isfinite(pesos[linhas, colunas])):
+        return None
+    return dict(zip(linhas.tolist(), colunas.tolist()))
+
+
+try:
+    import scipy.optimize  # noqa: F401
+    resolver_atribuicao = _atribuicao_scipy
+except ImportError:
+    resolver_atribuicao = _atribuicao_dp
+
+
+def melhor_atribuicao(aptidao):
+    """
+    Melhor atribuição jogador -> posição (índices no elenco), reduzindo antes o
+    elenco aos melhores candidatos de cada posição
+    """
+    n, k = aptidao.shape
+    if n < k:
+        return None
+    corte = min(CANDIDATOS_POR_POSICAO, n)
+    melhores = np.argpartition(-aptidao, corte - 1, axis=0)[:corte]
+    candidatos = np.unique(melhores)
+    atribuicao = resolver_atribuicao(aptidao[candidatos])
+    if atribuicao is None:
+        return None
+    return {int(candidatos[p]): s for p, s in atribuicao.items()}
+
+
+def escalar(elenco, formacao, peso_quimica=0.0):
+    """
+    Melhor XI de uma formação. Com `peso_quimica`, cada ponto de química vale
+    esse tanto de aptidão e o XI é refinado até a química estabilizar
+    """
+    posicoes = FORMACOES[formacao]
+    aptidao = elenco.aptidao(posicoes)
+
+    # Versões diferentes do mesmo jogador não podem dividir o XI
+    bloqueados = np.zeros(len(elenco), dtype=bool)
+    bonus = np.zeros(len(elenco))
+    melhor = None
+    vistos = set()
+    for _ in range(ITERACOES_QUIMICA if peso_quimica else 1):
+        while True:
+            pesos = aptidao + bonus[:, None]
+            pesos[bloqueados] = -np.inf
+            atribuicao = melhor_atribuicao(pesos)
+            if atribuicao is None:
+                return melhor
+            escalados = np.fromiter(atribuicao, dtype=np.intp)
+            nomes, contagem = np.unique(elenco.nomes[escalados], return_counts=True)
+            repetidos = nomes[contagem > 1]
+            if not len(repetidos):
+                break
+            for nome in repetidos:
+                mesmos = escalados[elenco.nomes[escalados] == nome]
+                valores = [aptidao[j, atribuicao[j]] for j in mesmos]
+                bloqueados[np.delete(mesmos, int(np.argmax(valores)))] = True
+
+        quimica = quimica_candidatos(elenco, escalados)[escalados]
+        valor = float(sum(aptidao[j, s] for j, s in atribuicao.items()) + peso_quimica * quimica.sum())
+        if melhor is None or valor > melhor['valor']:
+            melhor = {
+                'formacao': formacao,
+                'valor': valor,
+                'atribuicao': atribuicao,
+                'quimica': dict(zip(escalados.tolist(), quimica.tolist())),
+                'aptidao': aptidao
+            }
+
+        chave = frozenset(atribuicao.items())
+        if not peso_quimica or chave in vistos:
+            break
+        vistos.add(chave)
+        bonus = peso_quimica * quimica_candidatos(elenco, escalados)
+    return melhor
+
+
+def montar_resultado(elenco, resultado):
+    """XI em formato serializável, na ordem das posições da formação"""
+    posicoes = FORMACOES[resultado['formacao']]
+    por_posicao = sorted(resultado['atribuicao'].items(), key=lambda item: item[1])
+    xi = []
+    for jogador, slot in por_posicao:
+        registro = elenco.registros[jogador]
+        xi.append({
+            'posicao': posicoes[slot],
+            'nome': registro.nome,
+            'overall': registro.overall,
+            'posicao_card': registro.posicao.value,
+            'clube': registro.clube,
+            'nacao': registro.nacao,
+            'liga': registro.liga,
+            'aptidao': round(float(resultado['aptidao'][jogador, slot]), 1),
+            'quimica': resultado['quimica'][jogador]
+        })
+    return {
+        'formacao': resultado['formacao'],
+        'valor': round(resultado['valor'], 1),
+        'overall_medio': round(sum(j['overall'] for j in xi) / len(xi), 1),
+        'quimica': sum(j['quimica'] for j in xi),
+        'xi': xi
+    }
+
+
+def melhores_escalacoes(registros, formacoes=None, peso_quimica=0.0):
+    """Melhor XI de cada formação (formações sem jogadores suficientes são omitidas)"""
+    elenco = registros if isinstance(registros, ElencoVetorizado) else ElencoVetorizado(registros)
+    resultados = []
+    for formacao in formacoes or FORMACOES:
+        resultado = escalar(elenco, formacao, peso_quimica)
+        if resultado is None:
+            logger.warning(f"Formação {formacao}: jogadores insuficientes")
+            continue
+        resultados.append(montar_resultado(elenco, resultado))
+    return sorted(resultados, key=lambda r: r['valor'], reverse=True)
+
+
+def carregar_csv(caminho):
+    """Registros a partir do CSV exportado pelo scraper"""
+    with open(caminho, 'r', newline='', encoding='utf-8-sig') as arquivo:
+        return [JogadorRegistro.de_dicionario(linha) for linha in csv.DictReader(arquivo)]
+
+
+def imprimir_escalacao(resultado):
+    print(f"\n⚽ {resultado['formacao']}  valor {resultado['valor']}  "
+          f"overall médio {resultado['overall_medio']}  química {resultado['quimica']}")
+    for jogador in resultado['xi']:
+        print(f"   {jogador['posicao']:<4}{jogador['nome']:<24}{jogador['overall']:>4}  "
+              f"({jogador['posicao_card']}, {jogador['liga'] or '-'}, {jogador['nacao'] or '-'})  "
+              f"química {jogador['quimica']}")
+
+
+def main(argv=None):
+    """Função principal da escalação"""
+    parser = argparse.ArgumentParser(description="Melhor XI por formação a partir do CSV coletado")
+    parser.add_argument('csv', nargs='?', default='jogadores_fc25.csv', help="CSV exportado pelo scraper")
+    parser.add_argument('--formacoes', nargs='+', choices=list(FORMACOES), help="formações (padrão: todas)")
+    parser.add_argument('--quimica', type=float, default=0.0,
+                        help="valor de cada ponto de química em aptidão (padrão: 0, sem química)")
+    parser.add_argument('--json', help="grava as escalações neste arquivo JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    registros = carregar_csv(args.csv)
+    inicio = time.perf_counter()
+    resultados = melhores_escalacoes(registros, args.formacoes, args.quimica)
+    duracao = time.perf_counter() - inicio
+    if not resultados:
+        print("❌ Jogadores insuficientes para as formações pedidas")
+        return 1
+
+    for resultado in resultados:
+        imprimir_escalacao(resultado)
+    print(f"\n✅ {len(resultados)} formação(ões) para {len(registros)} cards em {duracao * 1000:.0f} ms")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as arquivo:
+            json.dump(resultados, arquivo, indent=2, ensure_ascii=False)
+        print(f"📁 Escalações gravadas em {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Esperas baseadas em condições para o EA FC 25 Web App Scraper
+"""
+
+import time
+import logging
+from collections import defaultdict
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+
+logger = logging.getLogger(__name__)
+
+# Identidade do primeiro card visível: texto do nome + rating, lido em uma chamada
+SCRIPT_IDENTIDADE_PRIMEIRO_CARD = """
+var seletores = arguments[0];
+for (var i = 0; i < seletores.length; i++) {
+    var card = document.querySelector(seletores[i]);
+    if (card) {
+        return (card.innerText || card.textContent || '').trim().slice(0, 200);
+    }
+}
+return null;
+"""
+
+SCRIPT_CONTAGEM_CARDS = """
+var seletores = arguments[0];
+for (var i = 0; i < seletores.length; i++) {
+    var total = document.querySelectorAll(seletores[i]).length;
+    if (total) {
+        return total;
+    }
+}
+return 0;
+"""
+
+
+def identidade_primeiro_card(driver, seletores):
+    """Retorna uma identidade textual do primeiro card da página"""
+    return driver.execute_script(SCRIPT_IDENTIDADE_PRIMEIRO_CARD, seletores)
+
+
+def documento_pronto(driver):
+    """Condição: document.readyState é 'complete'"""
+    return driver.execute_script("return document.readyState") == 'complete'
+
+
+class primeiro_card_mudou:
+    """Condição: o primeiro card deixou de ser o card de referência"""
+
+    def __init__(self, seletores, referencia):
+        self.seletores = seletores
+        self.referencia = referencia
+
+    def __call__(self, driver):
+        atual = identidade_primeiro_card(driver, self.seletores)
+        return atual is not None and atual != self.referencia
+
+
+class contagem_cards_estavel:
+    """
+    Condição: a quantidade de cards é maior que zero e não mudou entre
+    leituras consecutivas (a lista terminou de renderizar)
+    """
+
+    def __init__(self, seletores, leituras=2):
+        self.seletores = seletores
+        self.leituras = leituras
+        self.historico = []
+
+    def __call__(self, driver):
+        total = driver.execute_script(SCRIPT_CONTAGEM_CARDS, self.seletores)
+        self.historico.append(total)
+        recentes = self.historico[-self.leituras:]
+        if total and len(recentes) == self.leituras and len(set(recentes)) == 1:
+            return total
+        return False
+
+
+class GerenciadorEsperas:
+    """
+    Centraliza as esperas do scraper sobre o WebDriverWait e contabiliza o
+    tempo efetivamente gasto esperando em cada fase da execução
+    """
+
+    def __init__(self, driver, wait, intervalo=0.5, obter_fase=None):
+        self.driver = driver
+        self.wait = wait
+        self.intervalo = intervalo
+        self.obter_fase = obter_fase or (lambda: 'geral')
+        self.tempos = defaultdict(float)
+        self.quantidades = defaultdict(int)
+        self.timeouts = defaultdict(int)
+
+    def aguardar(self, condicao, timeout=None, descricao=None):
+        """
+        Aguarda até a condição ser verdadeira. Retorna o valor da condição ou
+        None se o tempo limite esgotar (a espera nunca lança exceção).
+        """
+        wait = self.wait
+        if timeout is not None:
+            wait = WebDriverWait(self.driver, timeout, poll_frequency=self.intervalo,
+                                 ignored_exceptions=[StaleElementReferenceException])
+
+        fase = self.obter_fase()
+        inicio = time.perf_counter()
+        try:
+            return wait.until(condicao)
+        except TimeoutException:
+            self.timeouts[fase] += 1
+            if descricao:
+                logger.warning(f"Tempo esgotado aguardando: {descricao}")
+            return None
+        finally:
+            self.tempos[fase] += time.perf_counter() - inicio
+            self.quantidades[fase] += 1
+
+    def relatorio(self):
+        """Registra no log o tempo gasto em esperas por fase"""
+        total = sum(self.tempos.values())
+        logger.info("="*50)
+        logger.info("TEMPO GASTO EM ESPERAS POR FASE")
+        for fase, segundos in sorted(self.tempos.items(), key=lambda item: -item[1]):
+            logger.info(
+                f"  {fase:<12} {segundos:8.2f}s em {self.quantidades[fase]} espera(s)"
+                f" ({self.timeouts[fase]} timeout(s))"
+            )
+        logger.info(f"  {'total':<12} {total:8.2f}s")
+        logger.info("="*50)
+        return dict(self.tempos)
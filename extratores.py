@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Motores de extração dos cards de jogadores do EA FC 25 Web App
+"""
+
+import re
+import logging
+
+from identificadores import identificar_escudo, tabela_padrao
+
+logger = logging.getLogger(__name__)
+
+# Esquema das colunas produzidas por todos os motores de extração
+CAMPOS_JOGADOR = [
+    'Nome',
+    'Overall',
+    'Posição',
+    'Clube',
+    'Rating',
+    'Qualidade',
+    'Nação',
+    'Liga',
+    'PAC',
+    'SHO',
+    'PAS',
+    'DRI',
+    'DEF',
+    'PHY',
+    'Traits',
+    'Status',
+    'Posições_Alternativas'
+]
+
+ESTATISTICAS = ['PAC', 'SHO', 'PAS', 'DRI', 'DEF', 'PHY']
+
+POSICOES = ['GK', 'CB', 'LB', 'RB', 'CDM', 'CM', 'CAM', 'LM', 'RM', 'LW', 'RW', 'ST', 'CF']
+
+SELETORES_CARDS = [
+    "li.listFUTItem",
+    ".listFUTItem",
+    ".ut-item-view--main",
+    ".ut-item-view.main",
+    ".player-card",
+    ".item-view"
+]
+SELETORES_NOME = [
+    '.name',
+    '.name.untradeable',
+    '.player-name',
+    '.ut-player-name',
+    '[data-testid*="name"]',
+    '.ut-item-name',
+    '.item-name'
+]
+SELETORES_OVERALL = ['.rating', '.overall', '.ut-rating', '[data-testid*="rating"]']
+SELETORES_POSICAO = ['.position', '.ut-position', '[data-testid*="position"]']
+SELETORES_CLUBE = ['.club', '.team', '.ut-club', '[data-testid*="club"]']
+
+
+def jogador_vazio():
+    """Retorna um dicionário de jogador com todos os campos em 'N/A'"""
+    return dict.fromkeys(CAMPOS_JOGADOR, 'N/A')
+
+
+def classificar_qualidade(classes):
+    """Determina a qualidade do card a partir das classes CSS"""
+    classes = classes or ''
+    if 'specials' in classes:
+        return 'Special'
+    elif 'hero' in classes:
+        return 'Hero'
+    elif 'icon' in classes:
+        return 'Icon'
+    return 'Base'
+
+
+def classificar_status(classes):
+    """Determina se o jogador é tradeable a partir das classes CSS do nome"""
+    if 'untradeable' in (classes or ''):
+        return 'Untradeable'
+    return 'Tradeable'
+
+
+def nome_por_texto(texto_completo):
+    """Procura o nome na primeira linha relevante do texto do card"""
+    for linha in texto_completo.split('\n'):
+        linha = linha.strip()
+        # Ignora linhas que são apenas números, muito curtas ou posições
+        if len(linha) > 2 and not linha.isdigit() and linha not in POSICOES:
+            return linha
+    return 'N/A'
+
+
+def overall_por_texto(texto_completo):
+    """Assume que o primeiro número de 2-3 dígitos do card é o overall"""
+    numeros = re.findall(r'\b\d{2,3}\b', texto_completo)
+    return numeros[0] if numeros else 'N/A'
+
+
+def posicao_por_texto(texto_completo):
+    """Procura uma posição conhecida no texto do card"""
+    for pos in POSICOES:
+        if pos in texto_completo:
+            return pos
+    return 'N/A'
+
+
+# Campo do jogador preenchido por cada tipo de escudo da seção bio
+CAMPO_POR_TIPO_ESCUDO = {
+    'nacoes': 'Nação',
+    'ligas': 'Liga',
+    'clubes': 'Clube'
+}
+
+
+def aplicar_bio(jogador, bio, resolvedor=None):
+    """
+    Preenche Nação, Liga e Clube a partir das linhas da seção bio
+    ([label, src da imagem]), resolvendo o ID de cada escudo pela tabela de
+    identificadores
+    """
+    resolvedor = resolvedor or tabela_padrao()
+    for label, img_src in bio or []:
+        escudo = identificar_escudo(img_src)
+        if escudo is None:
+            continue
+        tipo, identificador = escudo
+        jogador[CAMPO_POR_TIPO_ESCUDO[tipo]] = resolvedor.nome(tipo, identificador, label)
+    return jogador
+
+
+def montar_jogador(bruto, resolvedor=None):
+    """
+    Monta o dicionário de jogador no esquema padrão a partir dos dados brutos
+    de um card, independente do motor que os coletou.
+    
+    Campos esperados em `bruto`: nome, overall, posicao, clube, texto, stats
+    (label -> valor), bio (lista de [label, src da imagem]), traits,
+    outras_posicoes, classes_card e classes_nome. `resolvedor` converte os
+    IDs dos escudos em nomes (TabelaIdentificadores).
+    """
+    jogador = jogador_vazio()
+    texto_completo = bruto.get('texto') or ''
+
+    jogador['Nome'] = bruto.get('nome') or nome_por_texto(texto_completo)
+    jogador['Overall'] = bruto.get('overall') or overall_por_texto(texto_completo)
+    jogador['Posição'] = bruto.get('posicao') or posicao_por_texto(texto_completo)
+    jogador['Clube'] = bruto.get('clube') or 'N/A'
+
+    # Estatísticas detalhadas
+    for label, value in (bruto.get('stats') or {}).items():
+        if label in ESTATISTICAS and value:
+            jogador[label] = value
+
+    # Informações de nação, liga e clube na seção bio
+    aplicar_bio(jogador, bruto.get('bio'), resolvedor)
+
+    jogador['Qualidade'] = classificar_qualidade(bruto.get('classes_card'))
+
+    if bruto.get('classes_nome') is not None:
+        jogador['Status'] = classificar_status(bruto['classes_nome'])
+
+    if bruto.get('outras_posicoes'):
+        jogador['Posições_Alternativas'] = bruto['outras_posicoes']
+
+    traits = [t for t in bruto.get('traits') or [] if t and not t.startswith('+')]
+    if traits:
+        jogador['Traits'] = ', '.join(traits[:3])  # Limita a 3 traits principais
+
+    if jogador['Rating'] == 'N/A' and jogador['Overall'] != 'N/A':
+        jogador['Rating'] = jogador['Overall']
+
+    return jogador
+
+
+def comparar_resultados(referencia, comparado):
+    """
+    Compara as listas de jogadores produzidas por dois motores de extração.
+    Retorna uma lista de (índice, campo, valor_referencia, valor_comparado).
+    """
+    diferencas = []
+    if len(referencia) != len(comparado):
+        diferencas.append((None, 'quantidade', len(referencia), len(comparado)))
+    for indice, (a, b) in enumerate(zip(referencia, comparado)):
+        for campo in CAMPOS_JOGADOR:
+            if a.get(campo) != b.get(campo):
+                diferencas.append((indice, campo, a.get(campo), b.get(campo)))
+    return diferencas
+
+
+class ExtratorHTML:
+    """
+    Extrai todos os cards de uma página a partir de um único snapshot do
+    page_source, sem nenhuma chamada adicional ao WebDriver
+    """
+
+    SELETOR_CARDS = 'li.listFUTItem'
+
+    def __init__(self, parser='lxml', resolvedor=None, seletores_cards=None):
+        self.parser = parser
+        self.resolvedor = resolvedor
+        # Container dos cards de uma seção (secoes.py), em ordem de preferência
+        self.seletores_cards = list(seletores_cards or [self.SELETOR_CARDS])
+
+    def extrair_pagina(self, html):
+        """Extrai os dados de todos os cards presentes no HTML da página"""
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(html, self.parser)
+        cards = []
+        for seletor in self.seletores_cards:
+            cards = soup.select(seletor)
+            if cards:
+                break
+        logger.info(f"Encontrados {len(cards)} cards no snapshot da página")
+
+        jogadores = []
+        for card in cards:
+            try:
+                jogadores.append(self.extrair_card(card))
+            except Exception as e:
+                logger.error(f"Erro ao extrair card do snapshot: {str(e)}")
+        return jogadores
+
+    def _texto(self, card, seletores):
+        """Retorna o texto do primeiro seletor que encontrar conteúdo"""
+        for seletor in seletores:
+            elemento = card.select_one(seletor)
+            if elemento is not None:
+                texto = elemento.get_text(' ', strip=True)
+                if texto:
+                    return texto
+        return None
+
+    def extrair_card(self, card):
+        """Extrai os dados de um card (elemento BeautifulSoup) no esquema padrão"""
+        stats = {}
+        for stat in card.select('.player-stats-data-component li'):
+            label = stat.select_one('.label')
+            value = stat.select_one('.value')
+            if label is not None and value is not None:
+                stats[label.get_text(strip=True)] = value.get_text(strip=True)
+
+        bio = []
+        for row in card.select('.ut-item-view--bio .ut-item-row'):
+            label = row.select_one('.ut-item-row-label--left')
+            if label is None:
+                continue
+            img = row.select_one('img')
+            bio.append([label.get_text(strip=True), img.get('src') if img is not None else None])
+
+        nome_element = card.select_one('.name')
+
+        return montar_jogador({
+            'nome': self._texto(card, SELETORES_NOME),
+            'overall': self._texto(card, SELETORES_OVERALL),
+            'posicao': self._texto(card, SELETORES_POSICAO),
+            'clube': self._texto(card, SELETORES_CLUBE),
+            'texto': card.get_text('\n', strip=True),
+            'stats': stats,
+            'bio': bio,
+            'traits': [
+                t.get_text(strip=True)
+                for t in card.select('.ut-item-view--traits .ut-item-row .ut-item-row-label--left')
+            ],
+            'outras_posicoes': self._texto(card, ['.otherPositions']),
+            'classes_card': ' '.join(card.get('class', [])),
+            'classes_nome': ' '.join(nome_element.get('class', [])) if nome_element is not None else None,
+        }, self.resolvedor)
+
+
+# Função executada no navegador: percorre todos os cards e devolve os dados
+# brutos de cada um em uma única chamada execute_script
+SCRIPT_EXTRACAO_CARDS = """
+var seletores = arguments[0];
+
+function textoDe(el) {
+    return el ? (el.innerText || el.textContent || '').trim() : '';
+}
+
+function primeiroTexto(card, lista) {
+    for (var i = 0; i < lista.length; i++) {
+        var texto = textoDe(card.querySelector(lista[i]));
+        if (texto) {
+            return texto;
+        }
+    }
+    return null;
+}
+
+var cards = [];
+for (var i = 0; i < seletores.cards.length; i++) {
+    cards = document.querySelectorAll(seletores.cards[i]);
+    if (cards.length) {
+        break;
+    }
+}
+
+return Array.prototype.map.call(cards, function (card) {
+    var stats = {};
+    card.querySelectorAll('.player-stats-data-component li').forEach(function (li) {
+        var label = li.querySelector('.label');
+        var value = li.querySelector('.value');
+        if (label && value) {
+            stats[textoDe(label)] = textoDe(value);
+        }
+    });
+
+    var bio = [];
+    card.querySelectorAll('.ut-item-view--bio .ut-item-row').forEach(function (row) {
+        var label = row.querySelector('.ut-item-row-label--left');
+        if (label) {
+            var img = row.querySelector('img');
+            bio.push([textoDe(label), img ? img.getAttribute('src') : null]);
+        }
+    });
+
+    var traits = [];
+    card.querySelectorAll('.ut-item-view--traits .ut-item-row .ut-item-row-label--left').forEach(function (t) {
+        traits.push(textoDe(t));
+    });
+
+    var nome = card.querySelector('.name');
+
+    return {
+        nome: primeiroTexto(card, seletores.nome),
+        overall: primeiroTexto(card, seletores.overall),
+        posicao: primeiroTexto(card, seletores.posicao),
+        clube: primeiroTexto(card, seletores.clube),
+        texto: textoDe(card),
+        stats: stats,
+        bio: bio,
+        traits: traits,
+        outras_posicoes: primeiroTexto(card, ['.otherPositions']),
+        classes_card: card.getAttribute('class') || '',
+        classes_nome: nome ? (nome.getAttribute('class') || '') : null
+    };
+});
+"""
+
+
+class ExtratorJS:
+    """
+    Extrai todos os cards de uma página com uma única chamada execute_script,
+    que devolve os dados brutos de cada card como JSON
+    """
+
+    SELETORES = {
+        'cards': SELETORES_CARDS,
+        'nome': SELETORES_NOME,
+        'overall': SELETORES_OVERALL,
+        'posicao': SELETORES_POSICAO,
+        'clube': SELETORES_CLUBE,
+    }
+
+    def __init__(self, resolvedor=None, seletores_cards=None):
+        self.resolvedor = resolvedor
+        # Seletores enviados ao script (o container dos cards pode vir da seção)
+        self.seletores = dict(self.SELETORES)
+        if seletores_cards:
+            self.seletores['cards'] = list(seletores_cards)
+
+    def extrair_pagina(self, driver):
+        """Executa o script de extração no navegador e monta os jogadores"""
+        return self.montar(self.capturar(driver))
+
+    def capturar(self, driver):
+        """Executa o script no navegador e devolve os dados brutos dos cards"""
+        brutos = driver.execute_script(SCRIPT_EXTRACAO_CARDS, self.seletores) or []
+        logger.info(f"Encontrados {len(brutos)} cards via execute_script")
+        return brutos
+
+    def montar(self, brutos):
+        """Monta os jogadores a partir dos dados brutos (sem acessar o navegador)"""
+        jogadores = []
+        for bruto in brutos:
+            try:
+                jogadores.append(montar_jogador(bruto, self.resolvedor))
+            except Exception as e:
+                logger.error(f"Erro ao montar jogador do script: {str(e)}")
+        return jogadores
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Linha de comando do EA FC 25 Web App Scraper
+
+Selenium, pandas e o webdriver só são importados pelos subcomandos que abrem
+o navegador; `--help` e `exportar` iniciam sem eles. Sem terminal (cron,
+CI) a execução é não interativa e nunca lê da entrada padrão.
+
+Uso:
+    python fc25.py coletar --motor html --headless
+    python fc25.py coletar --secoes clube,transferencias,nao_atribuidos
+    python fc25.py retomar                       # continua do último checkpoint
+    python fc25.py exportar --csv clube.csv      # última execução do histórico SQLite
+    python fc25.py benchmark --sem-navegador
+    python fc25.py escalacao jogadores_fc25.csv --quimica 1.5
+    python fc25.py servir --porta 8765
+"""
+
+import os
+import sys
+import argparse
+
+
+def criar_config(args):
+    """Config com o arquivo de configuração e as opções da linha de comando aplicados"""
+    from config import Config
+
+    config = Config()
+    if args.config:
+        config.carregar_arquivo(args.config)
+    if args.conta:
+        config.para_conta(args.conta, args.diretorio_saida)
+    elif args.diretorio_saida != '.':
+        config.arquivo_csv = os.path.join(args.diretorio_saida, config.arquivo_csv)
+        config.arquivo_jsonl = os.path.join(args.diretorio_saida, config.arquivo_jsonl)
+    if args.csv:
+        config.arquivo_csv = args.csv
+    if args.jsonl is not None:
+        config.arquivo_jsonl = args.jsonl or None
+    if args.banco is not None:
+        config.arquivo_banco = args.banco or None
+    return config
+
+
+def comando_coletar(args, retomar=False):
+    """Abre o navegador e coleta as seções pedidas (ou retoma a partir do checkpoint)"""
+    config = criar_config(args)
+    if args.motor:
+        config.motor_extracao = args.motor
+    if args.headless:
+        config.headless = True
+    if args.enxuto:
+        config.modo_enxuto = True
+    if args.filtro:
+        config.filtro = args.filtro
+    if args.secoes:
+        config.secoes = args.secoes.split(',')
+    if args.sem_dataframe:
+        config.exportar_dataframe = False
+    config.retomar = retomar
+    config.interativo = not args.nao_interativo and sys.stdin.isatty()
+
+    # Seções e filtro são validados antes de abrir o navegador
+    from secoes import obter_secoes
+    from filtros import FiltroJogadores
+    try:
+        secoes = obter_secoes(config.secoes)
+        config.filtro = FiltroJogadores.de_config(config.filtro)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+
+    from fc25_scraper import FC25Scraper
+
+    if config.interativo:
+        print("="*60)
+        print("SCRAPER EA FC 25 WEB APP")
+        print("="*60)
+        print("Este script irá:")
+        print("1. Abrir o navegador Chrome")
+        print("2. Acessar o EA FC 25 Web App")
+        print("3. Aguardar seu login manual")
+        print("4. Coletar dados dos jogadores de: " + ', '.join(secao.titulo for secao in secoes))
+        print(f"5. Exportar para {config.arquivo_csv}" + (" (um arquivo por seção)" if len(secoes) > 1 else ""))
+        print("="*60)
+    if retomar:
+        print("🔁 Modo retomada: continuando a partir do último checkpoint")
+
+    scraper = FC25Scraper(config)
+    if scraper.executar_scraping():
+        print("\n✅ Scraping concluído com sucesso!")
+        for resultado in scraper.resultados_secoes:
+            print(f"📁 Arquivo gerado: {resultado['arquivo_csv']} "
+                  f"({resultado['secao']}, {resultado['total']} jogadores)")
+        return 0
+
+    print("\n❌ Erro durante o scraping. Verifique os logs para mais detalhes.")
+    return 1
+
+
+def comando_exportar(args):
+    """Exporta uma execução do histórico SQLite para CSV/JSONL, sem navegador"""
+    from armazenamento import ArmazenamentoSQLite
+    from saida import SaidaIncremental
+
+    config = criar_config(args)
+    if not config.arquivo_banco or not os.path.exists(config.arquivo_banco):
+        print(f"❌ Histórico não encontrado: {config.arquivo_banco}")
+        return 1
+
+    with ArmazenamentoSQLite(config.arquivo_banco) as armazenamento:
+        execucao_id = args.execucao or armazenamento.ultima_execucao(config.conta, args.secao)
+        if execucao_id is None:
+            print("❌ Nenhuma execução concluída no histórico")
+            return 1
+        jogadores = armazenamento.jogadores_execucao(execucao_id)
+
+    with SaidaIncremental(config.arquivo_csv, config.arquivo_jsonl) as saida:
+        saida.escrever_pagina(jogadores)
+
+    print(f"✅ Execução {execucao_id}: {saida.total} jogadores exportados para {config.arquivo_csv}")
+    return 0
+
+
+def comando_benchmark(args):
+    """Repassa os argumentos restantes para benchmark.py"""
+    from benchmark import main as main_benchmark
+    return main_benchmark(args.argumentos)
+
+
+def comando_escalacao(args):
+    """Repassa os argumentos restantes para escalacao.py"""
+    from escalacao import main as main_escalacao
+    return main_escalacao(args.argumentos)
+
+
+def comando_servir(args):
+    """Repassa os argumentos restantes para servico.py"""
+    from servico import main as main_servico
+    return main_servico(args.argumentos)
+
+
+def adicionar_opcoes_saida(parser):
+    parser.add_argument('--config', help="arquivo JSON com atributos de Config")
+    parser.add_argument('--conta', help="nome da conta (perfil do Chrome e arquivos de saída próprios)")
+    parser.add_argument('--diretorio-saida', default='.', help="diretório dos arquivos de saída")
+    parser.add_argument('--csv', help="arquivo CSV de saída")
+    parser.add_argument('--jsonl', help="arquivo JSONL de saída ('' desativa)")
+    parser.add_argument('--banco', help="histórico SQLite ('' desativa)")
+
+
+def adicionar_opcoes_coleta(parser):
+    from config import Config
+
+    adicionar_opcoes_saida(parser)
+    parser.add_argument('--motor', choices=Config.MOTORES_EXTRACAO, help="motor de extração")
+    parser.add_argument('--headless', action='store_true', help="abre o Chrome sem janela")
+    parser.add_argument('--enxuto', action='store_true',
+                        help="modo enxuto: headless, sem imagens/mídia/fontes e sem animações")
+    parser.add_argument('--filtro', help='filtro da coleta, ex.: "overall>=85 posicao=ST,CF"')
+    parser.add_argument('--secoes', help="seções coletadas na mesma sessão, ex.: clube,transferencias,"
+                                         "nao_atribuidos,armazenamento_sbc")
+    parser.add_argument('--sem-dataframe', action='store_true',
+                        help="não carrega o CSV no pandas para o preview final")
+    parser.add_argument('--nao-interativo', action='store_true',
+                        help="nunca lê da entrada padrão (automático sem terminal)")
+
+
+def criar_parser():
+    parser = argparse.ArgumentParser(prog='fc25', description="Scraper do clube no EA FC 25 Web App")
+    subcomandos = parser.add_subparsers(dest='comando', metavar='comando')
+    subcomandos.required = True
+
+    coletar = subcomandos.add_parser('coletar', aliases=['scrape'], help="coleta os jogadores do clube")
+    adicionar_opcoes_coleta(coletar)
+    coletar.set_defaults(executar=comando_coletar)
+
+    retomar = subcomandos.add_parser('retomar', aliases=['resume'],
+                                     help="continua a coleta a partir do último checkpoint")
+    adicionar_opcoes_coleta(retomar)
+    retomar.set_defaults(executar=lambda args: comando_coletar(args, retomar=True))
+
+    exportar = subcomandos.add_parser('exportar', aliases=['export'],
+                                      help="exporta uma execução do histórico SQLite para CSV/JSONL")
+    adicionar_opcoes_saida(exportar)
+    exportar.add_argument('--execucao', type=int, help="id da execução (padrão: a última concluída)")
+    exportar.add_argument('--secao', default='clube',
+                          help="seção da última execução concluída (clube, transferencias, ...)")
+    exportar.set_defaults(executar=comando_exportar)
+
+    benchmark = subcomandos.add_parser('benchmark', aliases=['bench'],
+                                       help="benchmark offline dos motores (argumentos de benchmark.py)")
+    benchmark.set_defaults(executar=comando_benchmark)
+
+    escalacao = subcomandos.add_parser('escalacao', aliases=['xi'],
+                                       help="melhor XI por formação a partir do CSV (argumentos de escalacao.py)")
+    escalacao.set_defaults(executar=comando_escalacao)
+
+    servir = subcomandos.add_parser('servir', aliases=['serve'],
+                                    help="serviço HTTP local de consulta à última coleta (argumentos de servico.py)")
+    servir.set_defaults(executar=comando_servir)
+    return parser
+
+
+def main(argv=None):
+    """Função principal da linha de comando"""
+    parser = criar_parser()
+    # Os argumentos não reconhecidos só são aceitos pelos subcomandos que os repassam
+    args, restantes = parser.parse_known_args(argv)
+    args.argumentos = restantes
+    if args.argumentos and args.executar not in (comando_benchmark, comando_escalacao, comando_servir):
+        parser.error(f"argumentos não reconhecidos: {' '.join(args.argumentos)}")
+    return args.executar(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,84 +6,196 @@ Autor: Sistema de Web Scraping
 Data: 2024
 """
 
-import time
+import os
+import sys
 import csv
-import pandas as pd
+import time
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
+from selenium.common.exceptions import (
+    NoSuchElementException, ElementClickInterceptedException, StaleElementReferenceException,
+    InvalidSelectorException
+)
 from selenium.webdriver.common.keys import Keys
-from webdriver_manager.chrome import ChromeDriverManager
 import logging
+from contextlib import contextmanager
+from datetime import datetime
 from config import Config
-
-# Configuração de logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('fc25_scraper.log'),
-        logging.StreamHandler()
-    ]
+from saida import SaidaIncremental
+from driver_cache import ResolvedorDriver
+from instrumentacao import InstrumentacaoWebDriver
+from checkpoint import Checkpoint
+from armazenamento import ArmazenamentoSQLite
+from incremental import impressao_pagina, gravar_diferencas
+from registros import como_registros, dataframe_jogadores, tipar_dataframe
+from pipeline import PipelinePaginas
+from snapshots import GravadorSnapshots
+from seletores import CacheSeletores, detectar_versao_webapp
+from identificadores import TabelaIdentificadores
+from filtros import FiltroJogadores, AplicadorFiltros
+from secoes import SECOES, SECAO_PADRAO, obter_secoes
+from logs import configurar_logging, AmostradorCards
+from captura_api import CapturaAPI, CAPACIDADE_LOG_PERFORMANCE, completar_com_dom, mapear_itens
+from esperas import (
+    GerenciadorEsperas, documento_pronto, identidade_primeiro_card,
+    primeiro_card_mudou, contagem_cards_estavel
 )
+from extratores import (
+    ExtratorHTML, ExtratorJS, jogador_vazio, aplicar_bio, classificar_qualidade, classificar_status,
+    nome_por_texto, overall_por_texto, posicao_por_texto,
+    comparar_resultados, CAMPOS_JOGADOR, SELETORES_CARDS, SELETORES_NOME, SELETORES_OVERALL, SELETORES_POSICAO, SELETORES_CLUBE
+)
+
 logger = logging.getLogger(__name__)
 
+# Estilo injetado no modo enxuto para desligar animações e transições
+SCRIPT_SEM_ANIMACOES = """
+(function () {
+    var css = '*, *::before, *::after { animation: none !important; '
+            + 'transition: none !important; scroll-behavior: auto !important; }';
+    function aplicar() {
+        var estilo = document.createElement('style');
+        estilo.textContent = css;
+        (document.head || document.documentElement).appendChild(estilo);
+    }
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', aplicar);
+    } else {
+        aplicar();
+    }
+})();
+"""
+
 class FC25Scraper:
     """
     Classe para fazer web scraping dos jogadores do EA FC 25 Web App
     """
     
-    def __init__(self):
+    def __init__(self, config=None):
         """Inicializa o scraper com configurações do Chrome"""
         self.driver = None
         self.wait = None
+        self.esperas = None
+        self.fase_atual = 'inicializacao'
+        self.instrumentacao = InstrumentacaoWebDriver(obter_fase=lambda: self.fase_atual)
         self.jogadores = []
-        self.config = Config()
+        self.total_coletados = 0
+        self.progresso = {}
+        self.snapshots = None
+        self.filtro = None
+        self.filtro_ordenado = False
+        self.config = config or Config()
+        # Configuração da execução; self.config passa a ser a da seção em coleta
+        self.config_base = self.config
+        self.secao = SECOES[SECAO_PADRAO]
+        self.secao_atual = None
+        self.secoes_coleta = []
+        self.resultados_secoes = []
+        self.saida = SaidaIncremental(self.config.arquivo_csv, self.config.arquivo_jsonl)
+        self.checkpoint = Checkpoint(self.config.arquivo_checkpoint)
+        self.armazenamento = ArmazenamentoSQLite(self.config.arquivo_banco) if self.config.arquivo_banco else None
+        self.resolvedor_driver = ResolvedorDriver(self.config.arquivo_manifesto_driver)
+        self.identificadores = TabelaIdentificadores(caminho_cache=self.config.arquivo_cache_identificadores)
+        self.extrator_html = ExtratorHTML(resolvedor=self.identificadores)
+        self.extrator_js = ExtratorJS(resolvedor=self.identificadores)
+        self.cache_seletores = CacheSeletores(self.config.arquivo_cache_seletores)
+        self.captura_api = CapturaAPI(self.config.padrao_url_api)
+        self.log_cards = AmostradorCards(logger, self.config.amostras_log_por_pagina)
+    
+    @property
+    def seletores_cards(self):
+        """Container dos cards da seção atual (o padrão dos motores se a seção não define)"""
+        return self.secao.seletores_cards or SELETORES_CARDS
+    
+    @contextmanager
+    def fase(self, nome):
+        """Marca a fase atual da execução (usada na contabilização das esperas)"""
+        anterior = self.fase_atual
+        self.fase_atual = nome
+        try:
+            yield
+        finally:
+            self.fase_atual = anterior
         
     def setup_driver(self):
         """Configura o driver do Chrome com opções otimizadas"""
         try:
             # Configurações do Chrome
             chrome_options = Options()
-            chrome_options.add_argument("--start-maximized")
+            if self.config.modo_enxuto:
+                largura, altura = self.config.tamanho_janela
+                chrome_options.add_argument("--headless=new")
+                chrome_options.add_argument(f"--window-size={largura},{altura}")
+                chrome_options.add_argument("--force-prefers-reduced-motion")
+                chrome_options.add_argument("--disable-extensions")
+                chrome_options.add_argument("--mute-audio")
+            else:
+                chrome_options.add_argument("--start-maximized")
+                if self.config.headless:
+                    chrome_options.add_argument("--headless=new")
+                    chrome_options.add_argument("--window-size=1920,1080")
             chrome_options.add_argument("--disable-blink-features=AutomationControlled")
             chrome_options.add_argument("--no-sandbox")
             chrome_options.add_argument("--disable-dev-shm-usage")
+            if self.config.perfil_dir:
+                # Perfil dedicado por conta (permite várias instâncias em paralelo)
+                chrome_options.add_argument(f"--user-data-dir={self.config.perfil_dir}")
             chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
             chrome_options.add_experimental_option('useAutomationExtension', False)
+            if self.config.motor_extracao == 'api':
+                # Log de performance com os eventos de rede (respostas da API do clube)
+                chrome_options.set_capability(*CAPACIDADE_LOG_PERFORMANCE)
+            
+            # Resolve o chromedriver (manifesto local primeiro, rede só se necessário)
+            inicio = time.perf_counter()
+            try:
+                driver_path = self.resolvedor_driver.resolver()
+            except Exception as e:
+                logger.warning(f"Resolução do chromedriver falhou: {str(e)}")
+                driver_path = None
+            tempo_resolucao = time.perf_counter() - inicio
+            logger.info(f"Resolução do chromedriver: {tempo_resolucao:.2f}s")
             
-            # Tenta diferentes abordagens para inicializar o driver
+            # Inicia o navegador com o driver resolvido ou, em último caso, com o Selenium Manager
+            inicio = time.perf_counter()
             try:
-                # Método 1: Usando ChromeDriverManager
-                service = Service(ChromeDriverManager().install())
+                if not driver_path:
+                    raise RuntimeError("chromedriver não resolvido")
+                service = Service(driver_path)
                 self.driver = webdriver.Chrome(service=service, options=chrome_options)
             except Exception as e1:
-                logger.warning(f"ChromeDriverManager falhou: {str(e1)}")
-                try:
-                    # Método 2: Driver automático sem service
-                    self.driver = webdriver.Chrome(options=chrome_options)
-                except Exception as e2:
-                    logger.warning(f"Driver automático falhou: {str(e2)}")
-                    # Método 3: Usando webdriver-manager com configurações específicas
-                    from webdriver_manager.chrome import ChromeDriverManager
-                    import os
-                    
-                    # Força download do driver
-                    driver_path = ChromeDriverManager().install()
-                    logger.info(f"Driver baixado em: {driver_path}")
-                    
-                    service = Service(driver_path)
-                    self.driver = webdriver.Chrome(service=service, options=chrome_options)
+                logger.warning(f"Inicialização com chromedriver resolvido falhou: {str(e1)}")
+                # Driver automático sem service
+                self.driver = webdriver.Chrome(options=chrome_options)
+            tempo_inicializacao = time.perf_counter() - inicio
+            logger.info(f"Inicialização do navegador: {tempo_inicializacao:.2f}s")
+            
+            # Instrumenta todos os comandos enviados ao chromedriver
+            self.instrumentacao.registrar('resolverDriver', tempo_resolucao)
+            self.instrumentacao.registrar('newSession', tempo_inicializacao)
+            self.instrumentacao.instalar(self.driver)
             
             # Remove indicadores de automação
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
-            # Configura wait explícito
-            self.wait = WebDriverWait(self.driver, 20)
+            if self.config.modo_enxuto:
+                self.aplicar_modo_enxuto()
+            
+            # Configura wait explícito e o gerenciador de esperas por condição
+            self.wait = WebDriverWait(
+                self.driver, self.config.timeout_espera,
+                poll_frequency=self.config.intervalo_espera,
+                ignored_exceptions=[StaleElementReferenceException]
+            )
+            self.esperas = GerenciadorEsperas(
+                self.driver, self.wait,
+                intervalo=self.config.intervalo_espera,
+                obter_fase=lambda: self.fase_atual
+            )
             
             logger.info("Driver do Chrome configurado com sucesso")
             return True
@@ -93,6 +205,20 @@ class FC25Scraper:
             logger.error("Verifique se o Google Chrome está instalado e atualizado")
             return False
     
+    def aplicar_modo_enxuto(self):
+        """Bloqueia recursos pesados e desliga animações via Chrome DevTools Protocol"""
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.config.padroes_bloqueados})
+            self.driver.execute_cdp_cmd('Emulation.setEmulatedMedia', {
+                'features': [{'name': 'prefers-reduced-motion', 'value': 'reduce'}]
+            })
+            # Injeta em todo documento novo um estilo que zera animações e transições
+            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': SCRIPT_SEM_ANIMACOES})
+            logger.info(f"Modo enxuto ativo: {len(self.config.padroes_bloqueados)} padrão(ões) de URL bloqueado(s)")
+        except Exception as e:
+            logger.warning(f"Não foi possível aplicar o modo enxuto: {str(e)}")
+    
     def acessar_webapp(self):
         """Acessa o EA FC 25 Web App"""
         try:
@@ -102,8 +228,13 @@ class FC25Scraper:
             self.driver.get(url)
             logger.info("Página carregada com sucesso")
             
-            # Aguarda carregamento inicial
-            time.sleep(5)
+            # Aguarda o documento e a interface inicial do web app
+            self.esperas.aguardar(documento_pronto, descricao="carregamento do documento")
+            self.esperas.aguardar(EC.any_of(
+                EC.presence_of_element_located((By.CSS_SELECTOR, ".ut-login-content")),
+                EC.presence_of_element_located((By.CSS_SELECTOR, ".ut-tab-bar-item")),
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'input[type="email"]'))
+            ), descricao="interface inicial do web app")
             return True
             
         except Exception as e:
@@ -115,9 +246,6 @@ class FC25Scraper:
         try:
             logger.info("Tentando login automático...")
             
-            # Aguarda carregamento da página de login
-            time.sleep(3)
-            
             # Procura pelo campo de email
             seletores_email = [
                 'input[type="email"]',
@@ -129,12 +257,10 @@ class FC25Scraper:
             
             campo_email = None
             for seletor in seletores_email:
-                try:
-                    campo_email = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, seletor)))
+                campo_email = self.esperas.aguardar(EC.presence_of_element_located((By.CSS_SELECTOR, seletor)))
+                if campo_email:
                     logger.info(f"Campo de email encontrado: {seletor}")
                     break
-                except TimeoutException:
-                    continue
             
             if not campo_email:
                 logger.warning("Campo de email não encontrado, tentando login manual")
@@ -199,8 +325,11 @@ class FC25Scraper:
                 botao_login.click()
                 logger.info("Botão de login clicado")
             
-            # Aguarda redirecionamento ou carregamento
-            time.sleep(5)
+            # Aguarda o redirecionamento para fora da página de login
+            self.esperas.aguardar(
+                lambda driver: not self._url_de_login(driver.current_url),
+                descricao="redirecionamento após login"
+            )
             
             # Verifica se o login foi bem-sucedido
             if self.verificar_login_sucesso():
@@ -214,18 +343,21 @@ class FC25Scraper:
             logger.error(f"Erro durante login automático: {str(e)}")
             return False
     
-    def verificar_login_sucesso(self):
-        """Verifica se o login foi bem-sucedido"""
+    @staticmethod
+    def _url_de_login(url):
+        """Verifica se a URL corresponde à página de login da EA"""
+        url = url.lower()
+        return "login" in url or "signin" in url
+    
+    def verificar_login_sucesso(self, estrito=False, timeout=None):
+        """
+        Verifica se o login foi bem-sucedido. Com `estrito`, só considera logado
+        se algum indicador da interface autenticada estiver visível.
+        """
         try:
-            # Aguarda um pouco para a página carregar
-            time.sleep(3)
-            
-            # Verifica se ainda está na página de login
-            if "login" in self.driver.current_url.lower() or "signin" in self.driver.current_url.lower():
-                return False
-            
             # Verifica se há elementos que indicam que está logado
             indicadores_logado = [
+                '.ut-tab-bar-item',
                 '.user-profile',
                 '.account-menu',
                 '.logout',
@@ -233,6 +365,16 @@ class FC25Scraper:
                 '.ut-navigation'
             ]
             
+            # Aguarda a página mostrar um indicador de login ou o formulário de login
+            self.esperas.aguardar(EC.any_of(
+                EC.presence_of_element_located((By.CSS_SELECTOR, ', '.join(indicadores_logado))),
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'input[type="email"]'))
+            ), timeout=timeout or self.config.timeout_verificacao_login)
+            
+            # Verifica se ainda está na página de login
+            if self._url_de_login(self.driver.current_url):
+                return False
+            
             for indicador in indicadores_logado:
                 try:
                     elemento = self.driver.find_element(By.CSS_SELECTOR, indicador)
@@ -241,6 +383,9 @@ class FC25Scraper:
                 except NoSuchElementException:
                     continue
             
+            if estrito:
+                return False
+            
             # Se não encontrou indicadores específicos, verifica se não há campos de login
             try:
                 self.driver.find_element(By.CSS_SELECTOR, 'input[type="email"]')
@@ -252,6 +397,23 @@ class FC25Scraper:
             logger.error(f"Erro ao verificar login: {str(e)}")
             return False
     
+    def sessao_ja_autenticada(self):
+        """Detecta uma sessão EA já autenticada no perfil persistente do Chrome"""
+        logger.info("Verificando sessão salva no perfil do Chrome...")
+        
+        # Com a sessão salva, a tela inicial mostra apenas o botão de entrar,
+        # que leva direto ao app sem pedir credenciais
+        botao_entrar = self._buscar_elemento(self.driver, '.ut-login-content button')
+        if botao_entrar and botao_entrar.is_displayed():
+            botao_entrar.click()
+        
+        if self.verificar_login_sucesso(estrito=True, timeout=self.config.timeout_sessao):
+            logger.info("✅ Sessão reaproveitada: login não é necessário")
+            return True
+        
+        logger.info("Nenhuma sessão ativa no perfil, seguindo para o login")
+        return False
+    
     def aguardar_login(self):
         """Aguarda o usuário fazer login manualmente ou tenta login automático"""
         try:
@@ -260,111 +422,192 @@ class FC25Scraper:
                 # Tenta login automático
                 if self.fazer_login_automatico():
                     logger.info("Login automático realizado com sucesso!")
-                    return True
+                    with self.fase('navegacao'):
+                        return self.abrir_primeira_secao()
+
+            # Headless (ou modo enxuto): não há janela onde fazer o login manual
+            if self.config.headless or self.config.modo_enxuto:
+                logger.error("Login não realizado: sem janela do navegador (headless/modo enxuto) não há "
+                             "login manual. Configure as credenciais (auto_login) ou um perfil já "
+                             "autenticado (perfil_dir com reutilizar_sessao)")
+                return False
+
+            # Sem terminal: aguarda o login ser concluído na própria janela
+            if not self.config.interativo:
+                return self.aguardar_login_nao_interativo()
             
             # Se não conseguiu login automático, aguarda manual
             logger.info("Aguardando login manual do usuário...")
-            logger.info("Por favor, faça login na sua conta EA e navegue até 'Clube > Jogadores'")
+            secao = self.primeira_secao()
+            self.preparar_secao(secao)
+            logger.info(f"Por favor, faça login na sua conta EA e navegue até '{secao.titulo}'")
             
             # Aguarda até que o usuário confirme que está logado
-            input("Pressione ENTER após fazer login e navegar para 'Clube > Jogadores'...")
+            input(f"Pressione ENTER após fazer login e navegar para '{secao.titulo}'...")
             
             logger.info("Login confirmado pelo usuário")
             
-            # Tenta navegar automaticamente para a página de jogadores
-            if self.navegar_para_jogadores():
-                logger.info("Navegação automática para jogadores realizada!")
+            # Tenta navegar automaticamente para a primeira seção pedida
+            with self.fase('navegacao'):
+                navegou = self.navegar_para_secao(secao)
+            if navegou:
+                logger.info(f"Navegação automática para {secao.titulo} realizada!")
                 return True
             else:
                 logger.info("Navegação automática falhou, aguardando navegação manual...")
-                input("Pressione ENTER quando estiver na página 'Clube > Jogadores'...")
+                input(f"Pressione ENTER quando estiver na página '{secao.titulo}'...")
+                self.secao_atual = secao.nome
                 return True
             
         except Exception as e:
             logger.error(f"Erro durante aguardo do login: {str(e)}")
             return False
     
-    def navegar_para_jogadores(self):
-        """Navega para a seção de jogadores usando os seletores corretos"""
+    def aguardar_login_nao_interativo(self):
+        """Aguarda (sem input) o login ser feito na janela e navega para a primeira seção"""
+        logger.info(f"Aguardando login na janela do navegador (até {self.config.timeout_login_manual}s)...")
+        
+        logado = self.esperas.aguardar(
+            lambda driver: not self._url_de_login(driver.current_url)
+            and driver.find_elements(By.CSS_SELECTOR, '.ut-tab-bar-item'),
+            timeout=self.config.timeout_login_manual,
+            descricao="login na janela do navegador"
+        )
+        if not logado:
+            logger.error("Login não concluído dentro do tempo limite")
+            return False
+        
+        with self.fase('navegacao'):
+            return self.abrir_primeira_secao()
+    
+    def primeira_secao(self):
+        """Seção aberta logo após o login: a primeira a coletar (o clube, por padrão)"""
+        return (self.secoes_coleta or obter_secoes(self.config_base.secoes))[0]
+    
+    def abrir_primeira_secao(self):
+        """
+        Navega para a primeira seção pedida logo após o login, já com a captura
+        da API da seção (a coleta dessa seção não precisa navegar de novo)
+        """
+        secao = self.primeira_secao()
+        self.preparar_secao(secao)
+        return self.navegar_para_secao(secao)
+    
+    def clicar_passo(self, descricao, seletores):
+        """
+        Aguarda e clica no primeiro elemento visível de um passo da navegação
+        (seletores CSS ou XPath iniciados por '//'). Retorna True se clicou
+        """
+        def clicavel(driver):
+            for seletor in seletores:
+                por = By.XPATH if seletor.startswith('//') else By.CSS_SELECTOR
+                try:
+                    for elemento in driver.find_elements(por, seletor):
+                        if elemento.is_displayed() and elemento.is_enabled():
+                            return elemento
+                except InvalidSelectorException:
+                    continue
+            return False
+        
         try:
-            logger.info("Navegando para seção de jogadores...")
-            
-            # Aguarda carregamento da página
-            time.sleep(3)
-            
-            # Primeiro, clica no botão "Club" na navbar
-            try:
-                club_button = self.driver.find_element(By.CSS_SELECTOR, "button.ut-tab-bar-item.icon-club")
-                if club_button.is_displayed() and club_button.is_enabled():
-                    club_button.click()
-                    logger.info("Botão Club clicado com sucesso")
-                    time.sleep(3)
-                else:
-                    logger.warning("Botão Club não está visível ou habilitado")
-            except Exception as e:
-                logger.warning(f"Erro ao clicar no botão Club: {str(e)}")
-            
-            # Agora procura pelo tile "Players" no hub
-            try:
-                players_tile = self.driver.find_element(By.CSS_SELECTOR, "div.players-tile")
-                if players_tile.is_displayed():
-                    players_tile.click()
-                    logger.info("Tile Players clicado com sucesso")
-                    time.sleep(3)
-                    return True
-                else:
-                    logger.warning("Tile Players não está visível")
-            except Exception as e:
-                logger.warning(f"Erro ao clicar no tile Players: {str(e)}")
-            
-            # Se não conseguir clicar no tile, tenta pelo header
-            try:
-                players_header = self.driver.find_element(By.XPATH, "//h1[contains(text(), 'Players')]")
-                if players_header.is_displayed():
-                    players_header.click()
-                    logger.info("Header Players clicado com sucesso")
-                    time.sleep(3)
-                    return True
-            except Exception as e:
-                logger.warning(f"Erro ao clicar no header Players: {str(e)}")
+            elemento = self.esperas.aguardar(clicavel, descricao=f"{descricao} clicável")
+            if not elemento:
+                logger.warning(f"{descricao} não está visível ou habilitado")
+                return False
+            elemento.click()
+            logger.info(f"{descricao} clicado com sucesso")
+            return True
+        except Exception as e:
+            logger.warning(f"Erro ao clicar em {descricao}: {str(e)}")
+            return False
+    
+    def navegar_para_secao(self, secao):
+        """
+        Navega até a lista de itens da seção pela barra de abas, na mesma
+        sessão (a aba é clicada mesmo se já estiver ativa, voltando ao hub)
+        """
+        try:
+            logger.info(f"Navegando para {secao.titulo}...")
+            self.secao = secao
+            
+            # A aba pode falhar (ex.: já aberta com o hub visível); o tile decide
+            self.clicar_passo(*secao.caminho[0])
+            chegou = all(self.clicar_passo(descricao, seletores) for descricao, seletores in secao.caminho[1:])
+            
+            if not chegou:
+                # Se nenhum método funcionar, tenta navegação manual
+                if not self.config.interativo:
+                    logger.error(f"Navegação automática para {secao.titulo} falhou (modo não interativo)")
+                    return False
+                
+                logger.warning("Navegação automática falhou. Aguardando navegação manual...")
+                input(f"Por favor, navegue manualmente para '{secao.titulo}' e pressione ENTER...")
             
-            # Se nenhum método funcionar, tenta navegação manual
-            logger.warning("Navegação automática falhou. Aguardando navegação manual...")
-            input("Por favor, navegue manualmente para 'Club > Players' e pressione ENTER...")
-            time.sleep(3)
+            # Listas fora do clube podem estar vazias: espera curta pelos cards
+            self.pagina_carregada(None if secao.nome == SECAO_PADRAO else self.config.timeout_cards)
+            self.secao_atual = secao.nome
             return True
             
         except Exception as e:
-            logger.error(f"Erro ao navegar para jogadores: {str(e)}")
+            logger.error(f"Erro ao navegar para {secao.titulo}: {str(e)}")
             return False
     
+    def aplicar_filtros(self):
+        """
+        Aplica o filtro da coleta pelos controles de ordenação e filtro da tela
+        do clube (logo após a navegação para Club > Players)
+        """
+        logger.info(f"Filtro da coleta: {self.filtro}")
+        try:
+            if self.cache_seletores.versao is None:
+                self.cache_seletores.carregar(detectar_versao_webapp(self.driver))
+            
+            aplicador = AplicadorFiltros(self.driver, self.esperas, self.cache_seletores)
+            self.captura_api.limpar()
+            if aplicador.aplicar(self.filtro):
+                self.pagina_carregada()
+            self.filtro_ordenado = aplicador.ordenado_por_rating
+        except Exception as e:
+            logger.warning(f"Erro ao aplicar filtros no web app: {str(e)}")
+            self.filtro_ordenado = False
+        
+        if not self.filtro_ordenado:
+            logger.info("Lista sem ordenação por rating: todas as páginas serão percorridas")
+    
+    def aguardar_cards(self, timeout=None):
+        """Aguarda a lista de cards renderizar e a quantidade estabilizar"""
+        return self.esperas.aguardar(
+            contagem_cards_estavel(self.seletores_cards),
+            timeout=timeout,
+            descricao="lista de cards estável"
+        )
+    
+    def pagina_carregada(self, timeout=None):
+        """Aguarda os cards da nova página e captura a resposta da API (motor 'api')"""
+        self.aguardar_cards(timeout)
+        if self.config.motor_extracao == 'api':
+            try:
+                self.captura_api.coletar(self.driver)
+            except Exception as e:
+                logger.warning(f"Não foi possível ler o log de rede: {str(e)}")
+    
     def localizar_cards_jogadores(self):
         """Localiza todos os cards de jogadores na página"""
         try:
-            # Aguarda carregamento da página
-            time.sleep(2)
-            
-            # Seletor correto para cards de jogadores (container principal)
-            seletores_cards = [
-                "li.listFUTItem",
-                ".listFUTItem",
-                ".ut-item-view--main",
-                ".ut-item-view.main",
-                ".player-card",
-                ".item-view"
-            ]
-            
-            cards_encontrados = []
+            # Aguarda a lista de cards terminar de renderizar
+            self.aguardar_cards(timeout=self.config.timeout_cards)
             
-            for seletor in seletores_cards:
+            def buscar_cards(seletor):
                 try:
-                    cards = self.driver.find_elements(By.CSS_SELECTOR, seletor)
-                    if cards:
-                        logger.info(f"Encontrados {len(cards)} cards usando seletor: {seletor}")
-                        cards_encontrados = cards
-                        break
-                except NoSuchElementException:
-                    continue
+                    return self.driver.find_elements(By.CSS_SELECTOR, seletor)
+                except InvalidSelectorException:
+                    return None
+            
+            # Seletores para cards de jogadores (container principal)
+            cards_encontrados = self.cache_seletores.resolver(
+                self.secao.chave_seletor('cards'), self.seletores_cards, buscar_cards) or []
+            if cards_encontrados:
+                logger.info(f"Encontrados {len(cards_encontrados)} cards de jogadores")
             
             if not cards_encontrados:
                 # Tenta encontrar por texto que contenha informações de jogador
@@ -383,9 +626,6 @@ class FC25Scraper:
     def ir_proxima_pagina(self):
         """Navega para a próxima página de jogadores"""
         try:
-            # Aguarda um pouco para garantir que a página carregou
-            time.sleep(2)
-            
             # Procura pelo botão "Próxima"
             seletores_proxima = [
                 'button.pagination.next',
@@ -398,27 +638,33 @@ class FC25Scraper:
                 '.pagination-next'
             ]
             
-            botao_proxima = None
-            for seletor in seletores_proxima:
-                try:
-                    botao_proxima = self.driver.find_element(By.CSS_SELECTOR, seletor)
-                    if botao_proxima.is_displayed() and botao_proxima.is_enabled():
-                        logger.info(f"Botão 'Próxima' encontrado: {seletor}")
-                        break
-                except NoSuchElementException:
-                    continue
+            def buscar_proxima(seletor):
+                botao = self._buscar_elemento(self.driver, seletor)
+                if botao and botao.is_displayed() and botao.is_enabled():
+                    return botao
+                return None
+            
+            botao_proxima = self.cache_seletores.resolver('proxima', seletores_proxima, buscar_proxima)
             
             if botao_proxima:
                 # Rola até o botão para garantir que está visível
                 self.driver.execute_script("arguments[0].scrollIntoView(true);", botao_proxima)
-                time.sleep(1)
+                self.esperas.aguardar(EC.element_to_be_clickable(botao_proxima), descricao="botão 'Próxima' clicável")
+                
+                # Guarda a identidade do primeiro card para detectar a troca de página
+                referencia = identidade_primeiro_card(self.driver, self.seletores_cards)
+                self.captura_api.limpar()
                 
                 # Clica no botão
                 botao_proxima.click()
                 logger.info("Clicou no botão 'Próxima'")
                 
-                # Aguarda carregamento da nova página
-                time.sleep(3)
+                # Aguarda a nova página substituir os cards e a lista estabilizar
+                if not self.esperas.aguardar(primeiro_card_mudou(self.seletores_cards, referencia),
+                                             descricao="troca de página"):
+                    logger.warning("A lista de cards não mudou após clicar em 'Próxima'")
+                    return False
+                self.pagina_carregada()
                 return True
             else:
                 logger.info("Botão 'Próxima' não encontrado ou não está visível")
@@ -428,129 +674,67 @@ class FC25Scraper:
             logger.error(f"Erro ao navegar para próxima página: {str(e)}")
             return False
     
+    def _buscar_elemento(self, contexto, seletor):
+        """Retorna o primeiro elemento do seletor (ou None) sem lançar exceção"""
+        try:
+            elementos = contexto.find_elements(By.CSS_SELECTOR, seletor)
+        except InvalidSelectorException:
+            return None
+        return elementos[0] if elementos else None
+    
+    def _texto_por_seletores(self, card, campo, seletores):
+        """Retorna o texto do campo usando o cache de seletores aprendidos"""
+        def buscar(seletor):
+            elemento = self._buscar_elemento(card, seletor)
+            return elemento.text.strip() if elemento else None
+        return self.cache_seletores.resolver(campo, seletores, buscar)
+    
     def extrair_dados_jogador(self, card):
         """Extrai dados de um jogador individual"""
         try:
-            jogador = {
-                'Nome': 'N/A',
-                'Overall': 'N/A',
-                'Posição': 'N/A',
-                'Clube': 'N/A',
-                'Rating': 'N/A',
-                'Qualidade': 'N/A',
-                'Nação': 'N/A',
-                'Liga': 'N/A',
-                'PAC': 'N/A',
-                'SHO': 'N/A',
-                'PAS': 'N/A',
-                'DRI': 'N/A',
-                'DEF': 'N/A',
-                'PHY': 'N/A',
-                'Traits': 'N/A',
-                'Status': 'N/A',
-                'Posições_Alternativas': 'N/A'
-            }
+            jogador = jogador_vazio()
             
             # Extrai nome do jogador
             try:
-                # Seletor correto para nome baseado na estrutura HTML
-                seletores_nome = [
-                    '.name',  # Seletor principal encontrado no HTML
-                    '.name.untradeable',
-                    '.player-name', 
-                    '.ut-player-name', 
-                    '[data-testid*="name"]',
-                    '.ut-item-name',
-                    '.item-name'
-                ]
-                for seletor in seletores_nome:
-                    try:
-                        nome_element = card.find_element(By.CSS_SELECTOR, seletor)
-                        if nome_element.text.strip():
-                            jogador['Nome'] = nome_element.text.strip()
-                            break
-                    except NoSuchElementException:
-                        continue
+                # Seletores para nome baseados na estrutura HTML
+                jogador['Nome'] = self._texto_por_seletores(card, 'nome', SELETORES_NOME) or 'N/A'
                 
                 # Se não encontrou por seletor, tenta por texto
                 if jogador['Nome'] == 'N/A':
-                    texto_completo = card.text
                     # Procura por padrões de nome (primeira linha geralmente é o nome)
-                    linhas = texto_completo.split('\n')
-                    for linha in linhas:
-                        linha = linha.strip()
-                        # Ignora linhas que são apenas números ou muito curtas
-                        if (len(linha) > 2 and 
-                            not linha.isdigit() and 
-                            not linha in ['GK', 'CB', 'LB', 'RB', 'CDM', 'CM', 'CAM', 'LM', 'RM', 'LW', 'RW', 'ST', 'CF']):
-                            jogador['Nome'] = linha
-                            break
+                    jogador['Nome'] = nome_por_texto(card.text)
                 
             except Exception as e:
-                logger.warning(f"Erro ao extrair nome: {str(e)}")
+                self.log_cards.aviso('nome', f"Erro ao extrair nome: {str(e)}")
             
             # Extrai overall/rating
             try:
-                seletores_overall = ['.rating', '.overall', '.ut-rating', '[data-testid*="rating"]']
-                for seletor in seletores_overall:
-                    try:
-                        overall_element = card.find_element(By.CSS_SELECTOR, seletor)
-                        if overall_element.text.strip():
-                            jogador['Overall'] = overall_element.text.strip()
-                            break
-                    except NoSuchElementException:
-                        continue
+                jogador['Overall'] = self._texto_por_seletores(card, 'overall', SELETORES_OVERALL) or 'N/A'
                 
                 # Se não encontrou por seletor, procura por números no texto
                 if jogador['Overall'] == 'N/A':
-                    texto_completo = card.text
-                    import re
-                    numeros = re.findall(r'\b\d{2,3}\b', texto_completo)
-                    if numeros:
-                        # Assume que o primeiro número de 2-3 dígitos é o overall
-                        jogador['Overall'] = numeros[0]
+                    jogador['Overall'] = overall_por_texto(card.text)
                 
             except Exception as e:
-                logger.warning(f"Erro ao extrair overall: {str(e)}")
+                self.log_cards.aviso('overall', f"Erro ao extrair overall: {str(e)}")
             
             # Extrai posição
             try:
-                seletores_posicao = ['.position', '.ut-position', '[data-testid*="position"]']
-                for seletor in seletores_posicao:
-                    try:
-                        posicao_element = card.find_element(By.CSS_SELECTOR, seletor)
-                        if posicao_element.text.strip():
-                            jogador['Posição'] = posicao_element.text.strip()
-                            break
-                    except NoSuchElementException:
-                        continue
+                jogador['Posição'] = self._texto_por_seletores(card, 'posicao', SELETORES_POSICAO) or 'N/A'
                 
                 # Se não encontrou por seletor, procura por posições conhecidas no texto
                 if jogador['Posição'] == 'N/A':
-                    texto_completo = card.text
-                    posicoes = ['GK', 'CB', 'LB', 'RB', 'CDM', 'CM', 'CAM', 'LM', 'RM', 'LW', 'RW', 'ST', 'CF']
-                    for pos in posicoes:
-                        if pos in texto_completo:
-                            jogador['Posição'] = pos
-                            break
+                    jogador['Posição'] = posicao_por_texto(card.text)
                 
             except Exception as e:
-                logger.warning(f"Erro ao extrair posição: {str(e)}")
+                self.log_cards.aviso('posicao', f"Erro ao extrair posição: {str(e)}")
             
             # Extrai clube/time
             try:
-                seletores_clube = ['.club', '.team', '.ut-club', '[data-testid*="club"]']
-                for seletor in seletores_clube:
-                    try:
-                        clube_element = card.find_element(By.CSS_SELECTOR, seletor)
-                        if clube_element.text.strip():
-                            jogador['Clube'] = clube_element.text.strip()
-                            break
-                    except NoSuchElementException:
-                        continue
+                jogador['Clube'] = self._texto_por_seletores(card, 'clube', SELETORES_CLUBE) or 'N/A'
                 
             except Exception as e:
-                logger.warning(f"Erro ao extrair clube: {str(e)}")
+                self.log_cards.aviso('clube', f"Erro ao extrair clube: {str(e)}")
             
             # Extrai estatísticas detalhadas
             try:
@@ -576,59 +760,42 @@ class FC25Scraper:
                     except:
                         continue
             except Exception as e:
-                logger.warning(f"Erro ao extrair estatísticas: {str(e)}")
+                self.log_cards.aviso('estatisticas', f"Erro ao extrair estatísticas: {str(e)}")
             
             # Extrai informações de nação, liga e clube
             try:
                 # Procura por informações na seção bio
+                bio = []
                 bio_rows = card.find_elements(By.CSS_SELECTOR, '.ut-item-view--bio .ut-item-row')
                 for row in bio_rows:
                     try:
                         label = row.find_element(By.CSS_SELECTOR, '.ut-item-row-label--left').text.strip()
                         
-                        if label == 'IRE':
-                            jogador['Nação'] = 'Irlanda'
-                        elif label == 'ICN':
-                            jogador['Liga'] = 'Icon'
-                        elif label == 'CLB':  # Possível label para clube
-                            # Tenta extrair nome do clube
-                            try:
-                                clube_img = row.find_element(By.CSS_SELECTOR, 'img')
-                                clube_src = clube_img.get_attribute('src')
-                                if 'clubs' in clube_src:
-                                    jogador['Clube'] = 'Clube Detectado'  # Placeholder
-                            except:
-                                pass
+                        # O src do escudo traz o ID numérico da nação, liga ou clube
+                        try:
+                            img_src = row.find_element(By.CSS_SELECTOR, 'img').get_attribute('src')
+                        except:
+                            img_src = None
+                        bio.append([label, img_src])
                     except:
                         continue
+                aplicar_bio(jogador, bio, self.identificadores)
             except Exception as e:
-                logger.warning(f"Erro ao extrair nação/liga: {str(e)}")
+                self.log_cards.aviso('bio', f"Erro ao extrair nação/liga: {str(e)}")
             
             # Extrai qualidade do card
             try:
                 # Verifica classes CSS para determinar qualidade
-                card_classes = card.get_attribute('class')
-                if 'specials' in card_classes:
-                    jogador['Qualidade'] = 'Special'
-                elif 'hero' in card_classes:
-                    jogador['Qualidade'] = 'Hero'
-                elif 'icon' in card_classes:
-                    jogador['Qualidade'] = 'Icon'
-                else:
-                    jogador['Qualidade'] = 'Base'
+                jogador['Qualidade'] = classificar_qualidade(card.get_attribute('class'))
             except Exception as e:
-                logger.warning(f"Erro ao extrair qualidade: {str(e)}")
+                self.log_cards.aviso('qualidade', f"Erro ao extrair qualidade: {str(e)}")
             
             # Extrai status (tradeable/untradeable)
             try:
                 nome_element = card.find_element(By.CSS_SELECTOR, '.name')
-                nome_classes = nome_element.get_attribute('class')
-                if 'untradeable' in nome_classes:
-                    jogador['Status'] = 'Untradeable'
-                else:
-                    jogador['Status'] = 'Tradeable'
+                jogador['Status'] = classificar_status(nome_element.get_attribute('class'))
             except Exception as e:
-                logger.warning(f"Erro ao extrair status: {str(e)}")
+                self.log_cards.aviso('status', f"Erro ao extrair status: {str(e)}")
             
             # Extrai posições alternativas
             try:
@@ -650,7 +817,7 @@ class FC25Scraper:
                 if traits:
                     jogador['Traits'] = ', '.join(traits[:3])  # Limita a 3 traits principais
             except Exception as e:
-                logger.warning(f"Erro ao extrair traits: {str(e)}")
+                self.log_cards.aviso('traits', f"Erro ao extrair traits: {str(e)}")
             
             # Copia overall para rating se rating estiver vazio
             if jogador['Rating'] == 'N/A' and jogador['Overall'] != 'N/A':
@@ -668,85 +835,429 @@ class FC25Scraper:
                 'Rating': 'N/A'
             }
     
+    def extrair_pagina(self, pagina_atual):
+        """Extrai os jogadores da página atual usando o motor de extração configurado"""
+        return self.processar_snapshot(self.capturar_pagina(pagina_atual))
+    
+    def capturar_pagina(self, pagina_atual):
+        """
+        Lê da página aberta o snapshot bruto de que o motor configurado precisa.
+        É a única etapa da extração que usa o navegador; o motor 'selenium' não
+        tem snapshot e extrai os cards aqui mesmo
+        """
+        motor = self.config.motor_extracao
+        self.log_cards.iniciar_pagina(pagina_atual)
+        try:
+            if motor == 'html':
+                return self.driver.page_source
+            if motor == 'js':
+                return self.extrator_js.capturar(self.driver)
+            if motor == 'api':
+                return list(self.captura_api.itens), self.driver.page_source
+        except Exception as e:
+            logger.error(f"Erro ao capturar a página {pagina_atual}: {str(e)}")
+            return None
+        return self.extrair_pagina_selenium(pagina_atual)
+    
+    def processar_snapshot(self, snapshot):
+        """Converte o snapshot capturado em jogadores, sem acessar o navegador"""
+        if snapshot is None:
+            return []
+        motor = self.config.motor_extracao
+        try:
+            if motor == 'html':
+                return self.extrator_html.extrair_pagina(snapshot)
+            if motor == 'js':
+                return self.extrator_js.montar(snapshot)
+            if motor == 'api':
+                # Nomes e traits (ausentes na API) vêm do DOM; sem resposta capturada,
+                # a página inteira é extraída do DOM
+                itens, html = snapshot
+                jogadores = mapear_itens(itens, self.identificadores)
+                jogadores_dom = self.extrator_html.extrair_pagina(html)
+                if not jogadores:
+                    logger.warning("Nenhuma resposta da API capturada para a página; usando o DOM")
+                    return jogadores_dom
+                return completar_com_dom(jogadores, jogadores_dom)
+        except Exception as e:
+            logger.error(f"Erro ao processar snapshot da página: {str(e)}")
+            return []
+        return snapshot
+    
+    def snapshot_para_arquivo(self, snapshot):
+        """HTML (e itens da API) da página para o arquivo de snapshots"""
+        motor = self.config.motor_extracao
+        if motor == 'html' and snapshot:
+            return snapshot, None
+        if motor == 'api' and snapshot:
+            return snapshot[1], snapshot[0]
+        # Motores sem HTML no snapshot: uma leitura extra do page_source
+        try:
+            return self.driver.page_source, None
+        except Exception as e:
+            logger.warning(f"Não foi possível ler o HTML para o arquivo de snapshots: {str(e)}")
+            return None
+    
+    def extrair_pagina_html(self):
+        """Extrai todos os cards a partir de um único snapshot do page_source"""
+        try:
+            html = self.driver.page_source
+            return self.extrator_html.extrair_pagina(html)
+        except Exception as e:
+            logger.error(f"Erro ao extrair página pelo HTML: {str(e)}")
+            return []
+    
+    def extrair_pagina_js(self):
+        """Extrai todos os cards com uma única chamada execute_script"""
+        try:
+            return self.extrator_js.extrair_pagina(self.driver)
+        except Exception as e:
+            logger.error(f"Erro ao extrair página via script: {str(e)}")
+            return []
+    
+    def comparar_motores_pagina(self, pagina_atual=1):
+        """Extrai a página atual com todos os motores e registra as diferenças"""
+        referencia = self.extrair_pagina_selenium(pagina_atual)
+        resultados = {
+            'html': self.extrair_pagina_html(),
+            'js': self.extrair_pagina_js()
+        }
+        
+        for motor, jogadores in resultados.items():
+            diferencas = comparar_resultados(referencia, jogadores)
+            if diferencas:
+                logger.warning(f"Motor '{motor}' difere do Selenium em {len(diferencas)} campo(s)")
+                for indice, campo, esperado, obtido in diferencas[:20]:
+                    logger.warning(f"  card {indice}: {campo} = {obtido!r} (Selenium: {esperado!r})")
+            else:
+                logger.info(f"Motor '{motor}' idêntico ao Selenium ({len(jogadores)} cards)")
+        
+        resultados['selenium'] = referencia
+        return resultados
+    
+    def extrair_pagina_selenium(self, pagina_atual):
+        """Extrai os cards um a um através de elementos do Selenium"""
+        # Localiza cards da página atual
+        with self.fase('localizar'):
+            cards = self.localizar_cards_jogadores()
+        
+        if not cards:
+            return []
+        
+        logger.info(f"Encontrados {len(cards)} jogadores na página {pagina_atual}")
+        
+        jogadores_pagina = []
+        for i, card in enumerate(cards):
+            try:
+                # Por card só em DEBUG; o resumo da página sai pelo AmostradorCards
+                logger.debug(f"Processando jogador {self.total_coletados + i + 1} "
+                             f"(página {pagina_atual}, posição {i+1})")
+                
+                # Rola até o card para garantir que está visível
+                self.driver.execute_script("arguments[0].scrollIntoView(true);", card)
+                
+                jogadores_pagina.append(self.extrair_dados_jogador(card))
+                
+            except Exception as e:
+                logger.error(f"Erro ao processar card {i+1} da página {pagina_atual}: {str(e)}")
+                continue
+        
+        return jogadores_pagina
+    
+    def avancar_para_pagina(self, pagina_destino):
+        """Avança rapidamente até a página informada, sem extrair os cards"""
+        logger.info(f"Retomando: avançando até a página {pagina_destino}...")
+        
+        with self.fase('paginacao'):
+            for pagina in range(2, pagina_destino + 1):
+                if not self.ir_proxima_pagina():
+                    logger.warning(f"Não foi possível avançar além da página {pagina - 1}")
+                    return False
+        
+        logger.info(f"Página {pagina_destino} alcançada")
+        return True
+    
     def coletar_dados_jogadores(self):
         """Coleta dados de todos os jogadores usando paginação"""
         try:
             logger.info("Iniciando coleta de dados dos jogadores...")
             
+            # Carrega os seletores aprendidos para a versão atual do web app
+            if self.cache_seletores.versao is None:
+                self.cache_seletores.carregar(detectar_versao_webapp(self.driver))
+            
             pagina_atual = 1
             max_paginas = 50  # Limite de segurança
-            
-            while pagina_atual <= max_paginas:
-                logger.info(f"Processando página {pagina_atual}...")
-                
-                # Localiza cards da página atual
-                cards = self.localizar_cards_jogadores()
-                
-                if not cards:
-                    logger.warning(f"Nenhum card de jogador encontrado na página {pagina_atual}")
-                    break
-                
-                logger.info(f"Encontrados {len(cards)} jogadores na página {pagina_atual}")
-                
-                # Processa todos os jogadores da página atual
-                for i, card in enumerate(cards):
-                    try:
-                        indice_global = len(self.jogadores) + 1
-                        logger.info(f"Processando jogador {indice_global} (página {pagina_atual}, posição {i+1})")
-                        
-                        # Rola até o card para garantir que está visível
-                        self.driver.execute_script("arguments[0].scrollIntoView(true);", card)
-                        time.sleep(0.5)
-                        
-                        jogador = self.extrair_dados_jogador(card)
-                        
-                        # Só adiciona se tem dados válidos
-                        if (jogador['Nome'] != 'Erro' and 
-                            jogador['Nome'] != 'N/A' and 
-                            jogador['Overall'] != 'N/A' and
-                            jogador['Overall'].strip() != ''):
-                            
-                            self.jogadores.append(jogador)
-                            logger.info(f"Jogador coletado: {jogador['Nome']} - {jogador['Overall']}")
-                        else:
-                            logger.info(f"Card ignorado - dados insuficientes")
-                        
-                    except Exception as e:
-                        logger.error(f"Erro ao processar card {indice_global}: {str(e)}")
-                        continue
-                
-                # Tenta ir para a próxima página
-                if not self.ir_proxima_pagina():
-                    logger.info("Não há mais páginas ou botão 'Próxima' não encontrado")
-                    break
+            cards_vistos = 0
+            offsets = None
+            
+            # Retoma a partir do checkpoint, se solicitado
+            estado = self.checkpoint.carregar() if self.config.retomar else None
+            if estado:
+                pagina_atual = estado['pagina'] + 1
+                cards_vistos = estado['cards_vistos']
+                self.total_coletados = estado['total_coletados']
+                offsets = estado['offsets']
+                self.saida.anexar = True
                 
-                pagina_atual += 1
-                
-                # Aguarda carregamento da nova página
-                time.sleep(3)
+                if not self.avancar_para_pagina(pagina_atual):
+                    logger.error(f"Não foi possível retomar na página {pagina_atual}")
+                    return False
+            elif self.config.retomar:
+                logger.info("Nenhum checkpoint encontrado, iniciando da página 1")
+            
+            # Saída incremental: cada página é gravada assim que extraída
+            self.saida.abrir(offsets)
+            if self.armazenamento:
+                self.armazenamento.abrir()
+                if estado and estado.get('execucao_id'):
+                    self.armazenamento.retomar_execucao(estado['execucao_id'], estado['pagina'])
+                else:
+                    self.armazenamento.iniciar_execucao(
+                        conta=self.config.conta,
+                        motor=self.config.motor_extracao,
+                        versao_webapp=self.cache_seletores.versao,
+                        secao=self.secao.nome
+                    )
+            
+            # Arquivo com o HTML de cada página para re-extração offline
+            if self.config.gravar_snapshots:
+                self.snapshots = GravadorSnapshots(
+                    (estado or {}).get('snapshots') or self.caminho_snapshots(),
+                    execucao=self.armazenamento.execucao_id if self.armazenamento else None,
+                    conta=self.config.conta,
+                    secao=self.secao.nome
+                ).abrir()
+            
+            # Execução anterior usada como referência na coleta incremental
+            anterior = self.execucao_referencia()
+            impressoes_anteriores = self.armazenamento.impressoes(anterior) if anterior else {}
+            self.progresso = {'cards_vistos': cards_vistos, 'paginas_inalteradas': 0, 'anterior': anterior}
+            
+            pipeline = None
+            if self.config.pipeline:
+                pipeline = PipelinePaginas(self.concluir_pagina, self.config.tamanho_fila_pipeline).iniciar()
             
-            logger.info(f"Coleta concluída. Total de jogadores coletados: {len(self.jogadores)}")
+            try:
+                while pagina_atual <= max_paginas:
+                    if pipeline and pipeline.interrompido:
+                        break
+                    logger.info(f"Processando página {pagina_atual}...")
+                    
+                    # Página igual à da execução anterior: será copiada do histórico sem extrair
+                    impressao = self.impressao_pagina()
+                    copiada = bool(impressao and impressao == impressoes_anteriores.get(pagina_atual))
+                    
+                    snapshot = None
+                    arquivo = None
+                    if not copiada:
+                        # Captura o snapshot bruto da página com o motor configurado
+                        with self.fase('extracao'):
+                            snapshot = self.capturar_pagina(pagina_atual)
+                            if self.snapshots:
+                                arquivo = self.snapshot_para_arquivo(snapshot)
+                    
+                    if pipeline:
+                        # O processamento segue em paralelo com a navegação para a próxima página
+                        pipeline.enviar(pagina_atual, impressao, snapshot, copiada, arquivo)
+                    elif not self.concluir_pagina(pagina_atual, impressao, snapshot, copiada, arquivo):
+                        break
+                    
+                    if copiada and self.config.parar_em_pagina_inalterada:
+                        logger.info("Ordenação do clube garante que as páginas restantes não mudaram; "
+                                    "paginação encerrada")
+                        break
+                    
+                    # Tenta ir para a próxima página
+                    with self.fase('paginacao'):
+                        mudou_pagina = self.ir_proxima_pagina()
+                    if not mudou_pagina:
+                        logger.info("Não há mais páginas ou botão 'Próxima' não encontrado")
+                        break
+                    
+                    pagina_atual += 1
+            finally:
+                if pipeline:
+                    pipeline.encerrar()
+            
+            logger.info(f"Coleta concluída. Total de jogadores coletados: {self.total_coletados}")
+            self.checkpoint.limpar()
+            if self.armazenamento:
+                self.armazenamento.finalizar_execucao(self.total_coletados)
+            if anterior:
+                logger.info(f"{self.progresso['paginas_inalteradas']} página(s) inalterada(s) copiadas do histórico")
+                self.exportar_diferencas(anterior)
             return True
             
         except Exception as e:
             logger.error(f"Erro durante coleta de dados: {str(e)}")
+            if self.armazenamento and self.armazenamento.conexao:
+                self.armazenamento.finalizar_execucao(self.total_coletados, status='interrompida')
             return False
+        
+        finally:
+            self.saida.fechar()
+            if self.armazenamento:
+                self.armazenamento.fechar()
+            if self.snapshots:
+                self.snapshots.fechar()
     
-    def exportar_csv(self, filename="jogadores_fc25.csv"):
-        """Exporta os dados coletados para CSV"""
+    def concluir_pagina(self, pagina_atual, impressao, snapshot, copiada, arquivo=None):
+        """
+        Processa, valida e grava uma página capturada e registra o checkpoint.
+        Roda na thread do pipeline (ou direto, sem pipeline) e não usa o
+        navegador. Retorna False quando a página não tem cards (fim da coleta)
+        """
+        if copiada:
+            # Com parar_em_pagina_inalterada, copia também todas as páginas seguintes
+            ultima = None if self.config.parar_em_pagina_inalterada else pagina_atual
+            validos = self.armazenamento.copiar_paginas(self.progresso['anterior'], pagina_atual, ultima)
+            jogadores_pagina = validos
+            self.progresso['paginas_inalteradas'] += 1
+            logger.info(f"Página {pagina_atual} inalterada: {len(validos)} jogadores copiados do histórico")
+        else:
+            if arquivo:
+                # Grava o snapshot antes do parse: uma página que falhe hoje pode ser re-extraída depois
+                html, itens = arquivo
+                self.snapshots.gravar(pagina_atual, html, itens, motor=self.config.motor_extracao)
+            
+            jogadores_pagina = self.processar_snapshot(snapshot)
+            
+            if not jogadores_pagina:
+                logger.warning(f"Nenhum card de jogador encontrado na página {pagina_atual}")
+                return False
+            
+            validos = []
+            for jogador in como_registros(jogadores_pagina):
+                # Só adiciona se tem dados válidos
+                if jogador.valido:
+                    validos.append(jogador)
+                    self.log_cards.coletado(pagina_atual, jogador.nome, jogador.overall)
+                else:
+                    self.log_cards.ignorado(pagina_atual)
+            self.log_cards.resumir(pagina_atual)
+            
+            validos = self.filtrar_pagina(pagina_atual, validos)
+            
+            if self.armazenamento:
+                self.armazenamento.gravar_pagina(validos, pagina_atual)
+                if impressao:
+                    self.armazenamento.gravar_impressao(pagina_atual, impressao)
+        
+        if copiada:
+            validos = self.filtrar_pagina(pagina_atual, validos)
+        
+        self.saida.escrever_pagina(validos)
+        self.total_coletados += len(validos)
+        self.progresso['cards_vistos'] += len(jogadores_pagina)
+        if self.config.manter_em_memoria:
+            self.jogadores.extend(validos)
+        
+        # Página concluída: registra o checkpoint
+        self.checkpoint.salvar(
+            pagina_atual, self.progresso['cards_vistos'], self.total_coletados, self.saida.posicao(),
+            motor=self.config.motor_extracao,
+            execucao_id=self.armazenamento.execucao_id if self.armazenamento else None,
+            snapshots=self.snapshots.caminho if self.snapshots else None
+        )
+        if self.progresso.get('abaixo_do_minimo'):
+            logger.info(f"Página {pagina_atual} chegou abaixo do overall mínimo "
+                        f"({self.filtro.overall_minimo}); coleta encerrada")
+            return False
+        return True
+    
+    def filtrar_pagina(self, pagina_atual, registros):
+        """
+        Mantém só os jogadores que atendem ao filtro da coleta. Com a lista
+        ordenada por rating, um card abaixo do overall mínimo encerra a coleta
+        """
+        if not self.filtro or not self.filtro.ativo:
+            return registros
+        if self.filtro_ordenado and any(self.filtro.abaixo_do_minimo(r) for r in registros):
+            self.progresso['abaixo_do_minimo'] = True
+        aceitos = [r for r in registros if self.filtro.aceita(r)]
+        if len(aceitos) != len(registros):
+            logger.info(f"Página {pagina_atual}: {len(registros) - len(aceitos)} jogador(es) fora do filtro")
+        return aceitos
+    
+    def caminho_snapshots(self):
+        """Arquivo de snapshots desta execução (id do histórico ou data/hora)"""
+        if self.armazenamento and self.armazenamento.execucao_id is not None:
+            nome = f"execucao_{self.armazenamento.execucao_id}"
+        else:
+            nome = f"execucao_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        if self.config.conta:
+            nome += f"_{self.config.conta}"
+        if self.secao.nome != SECAO_PADRAO:
+            nome += f"_{self.secao.nome}"
+        return os.path.join(self.config.diretorio_snapshots, nome + '.jsonl.gz')
+    
+    def execucao_referencia(self):
+        """Execução anterior da conta usada pela coleta incremental (ou None)"""
+        if not self.config.incremental:
+            return None
+        if not self.armazenamento:
+            logger.warning("Coleta incremental requer o histórico SQLite (arquivo_banco); coletando tudo")
+            return None
+        anterior = self.armazenamento.execucao_anterior(self.config.conta, self.secao.nome)
+        if anterior is None:
+            logger.info("Nenhuma execução anterior concluída: coleta completa servirá de referência")
+        else:
+            logger.info(f"Coleta incremental em relação à execução {anterior}")
+        return anterior
+    
+    def impressao_pagina(self):
+        """Impressão digital da página atual (nome, rating e classes de todos os cards)"""
+        if not self.armazenamento:
+            return None
+        try:
+            return impressao_pagina(self.driver, self.extrator_js.seletores)
+        except Exception as e:
+            logger.warning(f"Não foi possível calcular a impressão da página: {str(e)}")
+            return None
+    
+    def exportar_diferencas(self, anterior):
+        """Grava os jogadores adicionados, removidos e alterados desde a execução anterior"""
+        try:
+            diferencas = self.armazenamento.diferencas(anterior, self.armazenamento.execucao_id)
+            resumo = gravar_diferencas(diferencas, self.config.arquivo_diferencas,
+                                       anterior, self.armazenamento.execucao_id)
+            print(f"🔎 Mudanças desde a última coleta: {resumo['adicionados']} adicionado(s), "
+                  f"{resumo['removidos']} removido(s), {resumo['alterados']} alterado(s)")
+        except Exception as e:
+            logger.warning(f"Erro ao gravar diferenças: {str(e)}")
+    
+    def exportar_csv(self, filename=None):
+        """
+        Pós-processamento opcional: carrega o CSV gravado incrementalmente em
+        um DataFrame, exporta para `filename` (se diferente) e mostra o preview
+        """
         try:
-            if not self.jogadores:
+            import pandas as pd
+            
+            origem = self.config.arquivo_csv
+            filename = filename or origem
+            
+            # Colunas tipadas: overall e atributos como inteiros, posição/qualidade/status como categorias
+            if self.jogadores:
+                df = dataframe_jogadores(self.jogadores)
+            elif os.path.exists(origem):
+                df = tipar_dataframe(pd.read_csv(origem, encoding='utf-8-sig', dtype=str, keep_default_na=False))
+            else:
+                df = pd.DataFrame(columns=CAMPOS_JOGADOR)
+            
+            if df.empty:
                 logger.warning("Nenhum jogador para exportar")
                 return False
             
-            # Cria DataFrame
-            df = pd.DataFrame(self.jogadores)
+            logger.info(f"DataFrame tipado: {df.memory_usage(deep=True).sum() / 1024:.1f} KiB em memória")
             
-            # Exporta para CSV
-            df.to_csv(filename, index=False, encoding='utf-8-sig')
+            # Exporta para CSV (o arquivo de origem já foi gravado página a página)
+            if os.path.abspath(filename) != os.path.abspath(origem):
+                df.to_csv(filename, index=False, encoding='utf-8-sig')
             
             logger.info(f"Dados exportados com sucesso para {filename}")
-            logger.info(f"Total de jogadores exportados: {len(self.jogadores)}")
+            logger.info(f"Total de jogadores exportados: {len(df)}")
             
             # Mostra preview dos dados
             print("\n" + "="*50)
@@ -761,29 +1272,159 @@ class FC25Scraper:
             logger.error(f"Erro ao exportar CSV: {str(e)}")
             return False
     
+    def exportar_perfil(self):
+        """Grava o perfil de comandos do WebDriver (JSON e, opcionalmente, flamegraph)"""
+        if not self.instrumentacao.total:
+            return
+        try:
+            self.instrumentacao.resumo()
+            esperas = {fase: round(segundos, 6) for fase, segundos in self.esperas.tempos.items()} if self.esperas else {}
+            if self.config.arquivo_perfil:
+                self.instrumentacao.exportar_json(
+                    self.config.arquivo_perfil,
+                    esperas=esperas,
+                    motor=self.config.motor_extracao,
+                    jogadores=self.total_coletados
+                )
+            if self.config.arquivo_flamegraph:
+                self.instrumentacao.exportar_flamegraph(self.config.arquivo_flamegraph)
+        except Exception as e:
+            logger.warning(f"Erro ao exportar perfil do WebDriver: {str(e)}")
+    
+    def preparar_secao(self, secao):
+        """Estado da coleta de uma seção: arquivos de saída, checkpoint e captura da API"""
+        self.secao = secao
+        self.config = self.config_base.para_secao(secao.nome)
+        self.saida = SaidaIncremental(self.config.arquivo_csv, self.config.arquivo_jsonl)
+        self.checkpoint = Checkpoint(self.config.arquivo_checkpoint)
+        self.jogadores = []
+        self.total_coletados = 0
+        self.progresso = {}
+        self.snapshots = None
+        self.filtro_ordenado = False
+        # Motores de snapshot e impressão digital leem o container da seção
+        self.extrator_html = ExtratorHTML(resolvedor=self.identificadores, seletores_cards=secao.seletores_cards)
+        self.extrator_js = ExtratorJS(resolvedor=self.identificadores, seletores_cards=secao.seletores_cards)
+        
+        padrao = self.config.padrao_url_api if secao.nome == SECAO_PADRAO else secao.padrao_url_api
+        if self.captura_api.padrao_url.pattern != padrao:
+            self.captura_api = CapturaAPI(padrao)
+    
+    def secoes_pendentes(self, secoes):
+        """
+        Seções que ainda faltam coletar. Com `retomar`, o checkpoint só existe
+        enquanto a seção não termina: uma seção sem checkpoint antes da última
+        seção com checkpoint já foi concluída na execução interrompida
+        """
+        if not self.config_base.retomar or len(secoes) < 2:
+            return list(secoes)
+        com_checkpoint = [indice for indice, secao in enumerate(secoes)
+                          if os.path.exists(self.config_base.para_secao(secao.nome).arquivo_checkpoint)]
+        if not com_checkpoint:
+            return list(secoes)
+        pendentes = []
+        for indice, secao in enumerate(secoes):
+            if indice < com_checkpoint[-1] and indice not in com_checkpoint:
+                logger.info(f"Seção {secao.nome} já concluída na execução interrompida; pulando")
+            else:
+                pendentes.append(secao)
+        return pendentes
+    
+    def coletar_secao(self, secao):
+        """
+        Coleta uma seção: navega até ela (a não ser que a sessão já esteja na
+        lista), aplica o filtro quando a tela tem os controles e grava a saída
+        """
+        self.preparar_secao(secao)
+        logger.info(f"Coletando a seção {secao.nome} ({secao.titulo})")
+        
+        if self.secao_atual != secao.nome:
+            with self.fase('navegacao'):
+                if not self.navegar_para_secao(secao):
+                    return False
+        
+        # Filtro da coleta na própria tela (só o clube tem os controles)
+        if self.filtro.ativo and secao.filtros_no_webapp:
+            with self.fase('filtros'):
+                self.aplicar_filtros()
+        
+        with self.fase('coleta'):
+            sucesso = self.coletar_dados_jogadores()
+        # A lista foi paginada: a próxima seção sempre parte da barra de abas
+        self.secao_atual = None
+        self.resultados_secoes.append({
+            'secao': secao.nome,
+            'arquivo_csv': self.config.arquivo_csv,
+            'total': self.total_coletados,
+            'sucesso': sucesso
+        })
+        if not sucesso:
+            return False
+        
+        # Exporta para CSV (já gravado incrementalmente; o DataFrame é opcional)
+        if self.total_coletados == 0:
+            logger.info(f"Nenhum jogador na seção {secao.nome}")
+            return True
+        if self.config.exportar_dataframe:
+            with self.fase('exportacao'):
+                return self.exportar_csv()
+        return True
+    
     def executar_scraping(self):
         """Executa o processo completo de scraping"""
+        # Logging assíncrono (sem efeito se o chamador já configurou o logging)
+        configurar_logging(self.config.arquivo_log, json_arquivo=self.config.log_json,
+                           max_bytes=self.config.log_max_bytes, backups=self.config.log_backups)
+        
         try:
             logger.info("Iniciando processo de scraping do EA FC 25 Web App")
             
-            # 1. Configura driver
-            if not self.setup_driver():
+            # Seções e filtro inválidos falham antes de abrir o navegador
+            try:
+                secoes = obter_secoes(self.config_base.secoes)
+                self.filtro = FiltroJogadores.de_config(self.config_base.filtro)
+            except ValueError as e:
+                logger.error(f"Configuração da coleta inválida: {str(e)}")
                 return False
             
-            # 2. Acessa webapp
-            if not self.acessar_webapp():
-                return False
+            # Na retomada, as seções já concluídas não são coletadas de novo
+            self.secoes_coleta = secoes = self.secoes_pendentes(secoes)
             
-            # 3. Aguarda login manual
-            if not self.aguardar_login():
-                return False
+            # 1. Configura driver
+            with self.fase('setup'):
+                if not self.setup_driver():
+                    return False
             
-            # 4. Coleta dados dos jogadores
-            if not self.coletar_dados_jogadores():
+            # 2. Acessa webapp
+            with self.fase('acesso'):
+                if not self.acessar_webapp():
+                    return False
+            
+            # 3. Reaproveita a sessão do perfil ou aguarda o login
+            with self.fase('login'):
+                if self.config.perfil_dir and self.config.reutilizar_sessao and self.sessao_ja_autenticada():
+                    with self.fase('navegacao'):
+                        logado = self.abrir_primeira_secao()
+                else:
+                    logado = self.aguardar_login()
+            if not logado:
                 return False
             
-            # 5. Exporta para CSV
-            if not self.exportar_csv():
+            # 4. Percorre as seções pedidas na mesma sessão autenticada
+            sucesso = True
+            for secao in secoes:
+                if not self.coletar_secao(secao):
+                    logger.error(f"Coleta da seção {secao.nome} falhou")
+                    sucesso = False
+            
+            if len(secoes) > 1:
+                for resultado in self.resultados_secoes:
+                    logger.info(f"Seção {resultado['secao']}: {resultado['total']} jogador(es) "
+                                f"em {resultado['arquivo_csv']}")
+            if not sucesso:
+                return False
+            if not any(resultado['total'] for resultado in self.resultados_secoes):
+                logger.warning("Nenhum jogador para exportar")
                 return False
             
             logger.info("Processo de scraping concluído com sucesso!")
@@ -794,36 +1435,45 @@ class FC25Scraper:
             return False
         
         finally:
-            # Limpa credenciais da memória
+            # Limpa credenciais da memória (também as cópias por seção)
             self.config.limpar_credenciais()
+            self.config_base.limpar_credenciais()
+            
+            # Persiste os seletores aprendidos nesta execução
+            try:
+                self.cache_seletores.salvar()
+            except Exception as e:
+                logger.warning(f"Erro ao salvar cache de seletores: {str(e)}")
+            
+            # Persiste os IDs de clube/nação/liga vistos pela primeira vez
+            try:
+                self.identificadores.salvar()
+            except Exception as e:
+                logger.warning(f"Erro ao salvar cache de identificadores: {str(e)}")
+            
+            # Relatório do tempo gasto em esperas
+            if self.esperas:
+                self.esperas.relatorio()
+            
+            # Perfil dos comandos do WebDriver
+            self.exportar_perfil()
             
             if self.driver:
                 logger.info("Fechando navegador...")
                 self.driver.quit()
 
-def main():
-    """Função principal"""
-    print("="*60)
-    print("SCRAPER EA FC 25 WEB APP")
-    print("="*60)
-    print("Este script irá:")
-    print("1. Abrir o navegador Chrome")
-    print("2. Acessar o EA FC 25 Web App")
-    print("3. Aguardar seu login manual")
-    print("4. Coletar dados dos jogadores do seu clube")
-    print("5. Exportar para jogadores_fc25.csv")
-    print("="*60)
-    
-    scraper = FC25Scraper()
-    sucesso = scraper.executar_scraping()
-    
-    if sucesso:
-        print("\n✅ Scraping concluído com sucesso!")
-        print("📁 Arquivo gerado: jogadores_fc25.csv")
-    else:
-        print("\n❌ Erro durante o scraping. Verifique os logs para mais detalhes.")
-    
-    input("\nPressione ENTER para sair...")
+def main(argv=None):
+    """
+    Função principal mantida para `python fc25_scraper.py [--resume]`; a
+    linha de comando completa está em fc25.py
+    """
+    from fc25 import main as main_cli
+    
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if '--resume' in argv:
+        argv.remove('--resume')
+        return main_cli(['retomar'] + argv)
+    return main_cli(['coletar'] + argv)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Filtros da coleta aplicados na própria tela do clube
+
+Uma consulta (overall mínimo/máximo, posições, qualidade e status) é aplicada
+pelos controles de ordenação e filtro do web app logo após a navegação para
+Clube > Jogadores, para que o navegador só pagine pelos cards que interessam.
+Com a ordenação por rating decrescente, a coleta termina no primeiro card
+abaixo do overall mínimo.
+
+Nem todo critério tem controle correspondente no web app (não há filtro de
+overall nem de status, e posição/qualidade aceitam um valor por vez); o que
+não pode ser aplicado no navegador é conferido em cada página coletada.
+
+Formato textual (Config.filtro / FC25_FILTRO):
+
+    overall>=85 overall<=90 posicao=ST,CF qualidade=Icon status=Tradeable
+
+O overall aceita >=, <=, >, < e =; os demais critérios só =. Critérios
+separados por espaços ou ';'; qualquer outro texto é um erro.
+"""
+
+import re
+import logging
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from esperas import identidade_primeiro_card, primeiro_card_mudou
+from extratores import SELETORES_CARDS
+from registros import Posicao, Qualidade, Status, valor_texto
+
+logger = logging.getLogger(__name__)
+
+PADRAO_CRITERIO = re.compile(r'(\w+)\s*(>=|<=|>|<|=)\s*([^\s;]+)')
+SEPARADORES = re.compile(r'[\s;]*')
+CHAVES_CRITERIO = ('overall', 'posicao', 'posicoes', 'qualidade', 'qualidades', 'status', 'ordenar')
+
+# Controles da tela do clube (listas de fallback, resolvidas pelo cache de seletores)
+SELETORES_BOTAO_FILTROS = [
+    'button.ut-club-search-filters-button',
+    '.ut-navigation-bar-view button.filter-btn',
+    'button.filter-btn',
+    '[data-testid*="filter"]'
+]
+SELETORES_CONTROLES_FILTRO = [
+    '.ut-search-filter-control',
+    '.ut-drop-down-control',
+    '.inline-list-select'
+]
+SELETORES_BOTAO_APLICAR = [
+    '.ut-club-search-filters-view button.call-to-action',
+    '.button-container button.call-to-action',
+    'button.btn-standard.call-to-action'
+]
+
+# Rótulo de cada controle (inglês e português do web app)
+ROTULOS_CONTROLES = {
+    'ordenacao': ('Sort By', 'Ordenar por'),
+    'posicao': ('Position', 'Posição'),
+    'qualidade': ('Rarity', 'Raridade', 'Quality', 'Qualidade')
+}
+
+OPCOES_RATING_DECRESCENTE = ('Rating High to Low', 'Rating - Alto para baixo', 'Rating: alto a baixo')
+
+# Opção do filtro de raridade correspondente a cada qualidade (Base não tem equivalente)
+OPCOES_QUALIDADE = {
+    'Icon': ('Icons', 'Ícones', 'Icon'),
+    'Hero': ('Heroes', 'Heróis', 'Hero'),
+    'Special': ('Special', 'Especial')
+}
+
+
+def _inteiro(valor):
+    """Overall do filtro, com mensagem clara para valores não numéricos"""
+    try:
+        return int(valor)
+    except ValueError:
+        raise ValueError(f"Overall inválido no filtro: {valor}")
+
+
+def _valores(texto, enum):
+    """Valores separados por vírgula, validados contra o enum"""
+    valores = []
+    for valor in texto.split(','):
+        valor = valor.strip()
+        if not valor:
+            continue
+        membro = enum._value2member_map_.get(valor) or enum._value2member_map_.get(valor.upper()) \
+            or enum._value2member_map_.get(valor.capitalize())
+        if membro is None:
+            raise ValueError(f"Valor desconhecido no filtro: {valor}")
+        valores.append(membro.value)
+    return tuple(valores)
+
+
+@dataclass
+class FiltroJogadores:
+    """Consulta da coleta: só os cards que atendem a todos os critérios são gravados"""
+
+    overall_minimo: Optional[int] = None
+    overall_maximo: Optional[int] = None
+    posicoes: Tuple[str, ...] = field(default_factory=tuple)
+    qualidades: Tuple[str, ...] = field(default_factory=tuple)
+    status: Optional[str] = None
+    # Ordena o clube por rating decrescente (permite parar no primeiro card abaixo do mínimo)
+    ordenar_por_rating: bool = True
+
+    @classmethod
+    def de_texto(cls, texto):
+        """Cria o filtro a partir do formato textual (ver docstring do módulo)"""
+        filtro = cls()
+        texto = texto or ''
+        fim = 0
+        for criterio in PADRAO_CRITERIO.finditer(texto):
+            # Só espaços e ';' podem ficar entre os critérios
+            if not SEPARADORES.fullmatch(texto, fim, criterio.start()):
+                raise ValueError(f"Texto não reconhecido no filtro: {texto[fim:criterio.start()].strip()}")
+            fim = criterio.end()
+
+            chave, operador, valor = criterio.groups()
+            chave = chave.lower()
+            if chave not in CHAVES_CRITERIO:
+                raise ValueError(f"Critério desconhecido no filtro: {criterio.group(0)}")
+            if chave != 'overall' and operador != '=':
+                raise ValueError(f"Critério '{chave}' só aceita '=': {criterio.group(0)}")
+            if chave == 'overall' and operador == '>=':
+                filtro.overall_minimo = _inteiro(valor)
+            elif chave == 'overall' and operador == '>':
+                filtro.overall_minimo = _inteiro(valor) + 1
+            elif chave == 'overall' and operador == '<=':
+                filtro.overall_maximo = _inteiro(valor)
+            elif chave == 'overall' and operador == '<':
+                filtro.overall_maximo = _inteiro(valor) - 1
+            elif chave == 'overall':
+                filtro.overall_minimo = filtro.overall_maximo = _inteiro(valor)
+            elif chave in ('posicao', 'posicoes'):
+                filtro.posicoes = _valores(valor, Posicao)
+            elif chave in ('qualidade', 'qualidades'):
+                filtro.qualidades = _valores(valor, Qualidade)
+            elif chave == 'status':
+                filtro.status = _valores(valor, Status)[0]
+            elif chave == 'ordenar':
+                filtro.ordenar_por_rating = valor.lower() in ('1', 'true', 'sim', 'rating')
+            else:
+                raise ValueError(f"Critério desconhecido no filtro: {chave}{operador}{valor}")
+        if not SEPARADORES.fullmatch(texto, fim):
+            raise ValueError(f"Texto não reconhecido no filtro: {texto[fim:].strip()}")
+        return filtro
+
+    @classmethod
+    def de_config(cls, valor):
+        """Aceita um FiltroJogadores, o formato textual ou None (sem filtro)"""
+        if isinstance(valor, cls):
+            return valor
+        return cls.de_texto(valor) if valor else cls()
+
+    @property
+    def ativo(self):
+        return bool(self.overall_minimo is not None or self.overall_maximo is not None or
+                    self.posicoes or self.qualidades or self.status)
+
+    def aceita(self, registro):
+        """O JogadorRegistro atende a todos os critérios"""
+        overall = registro.overall
+        if self.overall_minimo is not None and (overall is None or overall < self.overall_minimo):
+            return False
+        if self.overall_maximo is not None and (overall is None or overall > self.overall_maximo):
+            return False
+        if self.posicoes and (registro.posicao is None or valor_texto(registro.posicao) not in self.posicoes):
+            return False
+        if self.qualidades and (registro.qualidade is None or valor_texto(registro.qualidade) not in self.qualidades):
+            return False
+        if self.status and (registro.status is None or valor_texto(registro.status) != self.status):
+            return False
+        return True
+
+    def abaixo_do_minimo(self, registro):
+        """O card já está abaixo do overall mínimo (fim da coleta com ordenação decrescente)"""
+        return (self.overall_minimo is not None and registro.overall is not None and
+                registro.overall < self.overall_minimo)
+
+    def __str__(self):
+        partes = []
+        if self.overall_minimo is not None:
+            partes.append(f"overall>={self.overall_minimo}")
+        if self.overall_maximo is not None:
+            partes.append(f"overall<={self.overall_maximo}")
+        if self.posicoes:
+            partes.append(f"posicao={','.join(self.posicoes)}")
+        if self.qualidades:
+            partes.append(f"qualidade={','.join(self.qualidades)}")
+        if self.status:
+            partes.append(f"status={self.status}")
+        return ' '.join(partes) or 'sem filtro'
+
+
+class AplicadorFiltros:
+    """Aplica o filtro pelos controles de ordenação e filtro da tela do clube"""
+
+    def __init__(self, driver, esperas, cache_seletores):
+        self.driver = driver
+        self.esperas = esperas
+        self.cache_seletores = cache_seletores
+        self.ordenado_por_rating = False
+
+    def _buscar(self, campo, seletores):
+        def buscar(seletor):
+            elementos = [e for e in self.driver.find_elements(By.CSS_SELECTOR, seletor) if e.is_displayed()]
+            return elementos or None
+        try:
+            return self.cache_seletores.resolver(campo, seletores, buscar) or []
+        except Exception:
+            return []
+
+    def _clicar(self, elemento, descricao):
+        self.driver.execute_script("arguments[0].scrollIntoView(true);", elemento)
+        self.esperas.aguardar(EC.element_to_be_clickable(elemento), descricao=descricao)
+        elemento.click()
+
+    def escolher_opcao(self, controle, opcoes):
+        """Abre o controle com um dos rótulos informados e escolhe a primeira opção encontrada"""
+        rotulos = ROTULOS_CONTROLES[controle]
+        for elemento in self._buscar('controle_filtro', SELETORES_CONTROLES_FILTRO):
+            if not any(rotulo.lower() in elemento.text.lower() for rotulo in rotulos):
+                continue
+            self._clicar(elemento, f"controle '{controle}' clicável")
+            for opcao in opcoes:
+                itens = elemento.find_elements(
+                    By.XPATH, f".//li[normalize-space(.)={_literal_xpath(opcao)}]")
+                if itens:
+                    self._clicar(itens[0], f"opção '{opcao}' clicável")
+                    logger.info(f"Filtro '{controle}': {opcao}")
+                    return True
+            logger.warning(f"Opção {opcoes} não encontrada no controle '{controle}'")
+            return False
+        logger.warning(f"Controle '{controle}' não encontrado na tela do clube")
+        return False
+
+    def aplicar(self, filtro):
+        """
+        Aplica no web app o que o filtro permite e recarrega a lista de cards.
+        Retorna True se a lista passou a ser filtrada/ordenada no navegador
+        """
+        botoes = self._buscar('botao_filtros', SELETORES_BOTAO_FILTROS)
+        if not botoes:
+            logger.warning("Botão de filtros do clube não encontrado; filtro aplicado só na coleta")
+            return False
+
+        referencia = identidade_primeiro_card(self.driver, SELETORES_CARDS)
+        self._clicar(botoes[0], "botão de filtros clicável")
+
+        aplicados = []
+        if filtro.ordenar_por_rating and self.escolher_opcao('ordenacao', OPCOES_RATING_DECRESCENTE):
+            self.ordenado_por_rating = True
+            aplicados.append('ordenação por rating')
+        if len(filtro.posicoes) == 1 and self.escolher_opcao('posicao', filtro.posicoes):
+            aplicados.append(f"posição {filtro.posicoes[0]}")
+        if len(filtro.qualidades) == 1 and filtro.qualidades[0] in OPCOES_QUALIDADE:
+            if self.escolher_opcao('qualidade', OPCOES_QUALIDADE[filtro.qualidades[0]]):
+                aplicados.append(f"qualidade {filtro.qualidades[0]}")
+
+        aplicar = self._buscar('botao_aplicar_filtros', SELETORES_BOTAO_APLICAR)
+        if not aplicar:
+            logger.warning("Botão para aplicar os filtros não encontrado")
+            self.ordenado_por_rating = False
+            return False
+        self._clicar(aplicar[0], "botão de aplicar filtros clicável")
+
+        # A lista filtrada substitui os cards (a mesma ordem pode manter o primeiro card)
+        self.esperas.aguardar(primeiro_card_mudou(SELETORES_CARDS, referencia),
+                              timeout=5, descricao="lista filtrada")
+        logger.info(f"Filtros aplicados no web app: {', '.join(aplicados) or 'nenhum'}")
+        return bool(aplicados)
+
+
+def _literal_xpath(texto):
+    """String literal XPath (textos com aspas simples usam concat)"""
+    if "'" not in texto:
+        return f"'{texto}'"
+    partes = texto.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{parte}'" for parte in partes) + ")"
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Resolução de clube, nação e liga a partir dos escudos dos cards
+
+Os escudos da seção bio apontam para URLs com o ID numérico do item, por
+exemplo `.../flags/list/25.png`, `.../leagueLogos/dark/2118.png` e
+`.../clubs/dark/95.png`. O ID é convertido em nome por uma tabela local
+versionada (`identificadores_fc25.json`). IDs que não estão na tabela são
+guardados em um cache com o rótulo visto no card, para serem revisados e
+incorporados à tabela depois.
+"""
+
+import os
+import re
+import json
+import logging
+import threading
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+TABELA_PADRAO = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'identificadores_fc25.json')
+
+TIPOS = ('nacoes', 'ligas', 'clubes')
+
+# Tipo de cada pasta de escudo nas URLs de imagem do web app
+PADRAO_ESCUDO = re.compile(r'/(flags|leagueLogos|clubs)/(?:[a-z]+/)?(\d+)\.png', re.IGNORECASE)
+TIPO_POR_PASTA = {
+    'flags': 'nacoes',
+    'leaguelogos': 'ligas',
+    'clubs': 'clubes'
+}
+
+# Nome genérico para IDs desconhecidos quando o rótulo do card não ajuda
+NOME_DESCONHECIDO = {
+    'nacoes': 'Nação {}',
+    'ligas': 'Liga {}',
+    'clubes': 'Clube {}'
+}
+
+# Rótulos da seção bio que não identificam o item (só indicam o tipo da linha)
+ROTULOS_GENERICOS = {'CLB', ''}
+
+
+def identificar_escudo(src):
+    """Extrai (tipo, id) da URL de um escudo, ou None se não for um escudo"""
+    match = PADRAO_ESCUDO.search(src or '')
+    if not match:
+        return None
+    return TIPO_POR_PASTA[match.group(1).lower()], match.group(2)
+
+
+class TabelaIdentificadores:
+    """Converte IDs de nação, liga e clube em nomes, com cache de IDs novos"""
+
+    # Contas do pool compartilham o mesmo arquivo de cache
+    _trava_arquivo = threading.Lock()
+
+    def __init__(self, caminho_tabela=TABELA_PADRAO, caminho_cache=None):
+        self.caminho_tabela = caminho_tabela
+        self.caminho_cache = caminho_cache
+        self.versao = None
+        self.tabela = {tipo: {} for tipo in TIPOS}
+        self.cache = {tipo: {} for tipo in TIPOS}
+        self.alterado = False
+        self._trava = threading.Lock()
+        self.carregar()
+
+    def carregar(self):
+        """Carrega a tabela versionada e o cache de IDs aprendidos"""
+        try:
+            with open(self.caminho_tabela, 'r', encoding='utf-8') as arquivo:
+                dados = json.load(arquivo)
+            self.versao = dados.get('versao')
+            for tipo in TIPOS:
+                self.tabela[tipo] = {str(k): v for k, v in dados.get(tipo, {}).items()}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Tabela de identificadores indisponível ({self.caminho_tabela}): {str(e)}")
+
+        if self.caminho_cache and os.path.exists(self.caminho_cache):
+            try:
+                with open(self.caminho_cache, 'r', encoding='utf-8') as arquivo:
+                    dados = json.load(arquivo)
+                for tipo in TIPOS:
+                    # IDs que já entraram na tabela deixam de vir do cache
+                    self.cache[tipo] = {k: v for k, v in dados.get(tipo, {}).items()
+                                        if k not in self.tabela[tipo]}
+            except (OSError, ValueError) as e:
+                logger.warning(f"Cache de identificadores ignorado ({self.caminho_cache}): {str(e)}")
+
+    def nome(self, tipo, identificador, rotulo=None):
+        """Nome do item; IDs novos são registrados no cache com o rótulo do card"""
+        identificador = str(identificador)
+        nome = self.tabela[tipo].get(identificador)
+        if nome is not None:
+            return nome
+
+        entrada = self.cache[tipo].get(identificador)
+        if entrada is None:
+            rotulo = (rotulo or '').strip()
+            entrada = {
+                'nome': rotulo if rotulo not in ROTULOS_GENERICOS else NOME_DESCONHECIDO[tipo].format(identificador),
+                'rotulo': rotulo or None,
+                'visto_em': datetime.now().isoformat(timespec='seconds')
+            }
+            with self._trava:
+                self.cache[tipo][identificador] = entrada
+                self.alterado = True
+            logger.info(f"ID novo em {tipo}: {identificador} ({entrada['nome']})")
+        return entrada['nome']
+
+    def salvar(self):
+        """Grava o cache de IDs novos (se houver alterações), preservando os já gravados por outras contas"""
+        if not self.alterado or not self.caminho_cache:
+            return
+        with self._trava_arquivo, self._trava:
+            dados = {}
+            if os.path.exists(self.caminho_cache):
+                try:
+                    with open(self.caminho_cache, 'r', encoding='utf-8') as arquivo:
+                        dados = json.load(arquivo)
+                except (OSError, ValueError):
+                    dados = {}
+            for tipo in TIPOS:
+                mesclado = {k: v for k, v in dados.get(tipo, {}).items() if k not in self.tabela[tipo]}
+                mesclado.update(self.cache[tipo])
+                self.cache[tipo] = mesclado
+            dados = {'versao_tabela': self.versao}
+            dados.update(self.cache)
+            with open(self.caminho_cache, 'w', encoding='utf-8') as arquivo:
+                json.dump(dados, arquivo, indent=2, ensure_ascii=False)
+            self.alterado = False
+        logger.info(f"Cache de identificadores salvo em {self.caminho_cache}")
+
+
+_tabela_padrao = None
+
+
+def tabela_padrao():
+    """Tabela compartilhada, sem cache em disco (usada quando nenhuma é informada)"""
+    global _tabela_padrao
+    if _tabela_padrao is None:
+        _tabela_padrao = TabelaIdentificadores()
+    return _tabela_padrao
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Coleta incremental: impressão digital por página e diferenças entre execuções
+
+A impressão digital de uma página é um hash de nome, rating e classes de todos
+os cards, lidos em uma única chamada execute_script. Quando ela coincide com a
+da mesma página na execução anterior (histórico SQLite), a extração completa é
+pulada e os jogadores são copiados do histórico.
+"""
+
+import json
+import hashlib
+import logging
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# Lê nome, rating e classes de todos os cards de uma vez
+SCRIPT_RESUMO_CARDS = """
+var seletores = arguments[0];
+var cards = [];
+for (var i = 0; i < seletores.cards.length; i++) {
+    cards = document.querySelectorAll(seletores.cards[i]);
+    if (cards.length) {
+        break;
+    }
+}
+function primeiroTexto(card, lista) {
+    for (var i = 0; i < lista.length; i++) {
+        var el = card.querySelector(lista[i]);
+        var texto = el ? (el.textContent || '').trim() : '';
+        if (texto) {
+            return texto;
+        }
+    }
+    return '';
+}
+return Array.prototype.map.call(cards, function (card) {
+    return [
+        primeiroTexto(card, seletores.nome),
+        primeiroTexto(card, seletores.overall),
+        card.getAttribute('class') || ''
+    ];
+});
+"""
+
+
+def calcular_impressao(resumo_cards):
+    """Hash estável da lista [nome, rating, classes] dos cards de uma página"""
+    conteudo = json.dumps(resumo_cards, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha1(conteudo.encode('utf-8')).hexdigest()
+
+
+def impressao_pagina(driver, seletores):
+    """Impressão digital da página aberta (None se não houver cards)"""
+    resumo = driver.execute_script(SCRIPT_RESUMO_CARDS, seletores)
+    if not resumo:
+        return None
+    return calcular_impressao(resumo)
+
+
+def gravar_diferencas(diferencas, caminho, execucao_anterior, execucao_atual):
+    """Grava em JSON apenas os jogadores adicionados, removidos e alterados"""
+    documento = {
+        'gerado_em': datetime.now().isoformat(timespec='seconds'),
+        'execucao_anterior': execucao_anterior,
+        'execucao_atual': execucao_atual,
+        'resumo': {chave: len(valor) for chave, valor in diferencas.items()},
+        **diferencas
+    }
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        json.dump(documento, arquivo, indent=2, ensure_ascii=False)
+    logger.info(f"Diferenças gravadas em {caminho}: {documento['resumo']}")
+    return documento['resumo']
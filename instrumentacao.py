@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Instrumentação dos comandos do WebDriver (round trips ao chromedriver)
+
+Todas as chamadas do Selenium — inclusive as feitas por WebElements — passam
+por `driver.execute`. A instrumentação substitui esse método na instância do
+driver e registra quantidade e latência de cada comando, agrupados pela fase
+atual da execução (setup, login, navegacao, localizar, extracao, paginacao...).
+"""
+
+import json
+import time
+import logging
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+class InstrumentacaoWebDriver:
+    """Conta e cronometra cada comando enviado ao chromedriver, por fase"""
+
+    def __init__(self, obter_fase=None):
+        self.obter_fase = obter_fase or (lambda: 'geral')
+        self.registros = {}
+        self.total = 0
+        self.inicio = datetime.now()
+
+    def instalar(self, driver):
+        """Intercepta driver.execute na instância informada"""
+        execute_original = driver.execute
+
+        def execute(comando, params=None):
+            inicio = time.perf_counter()
+            try:
+                return execute_original(comando, params)
+            finally:
+                self.registrar(comando, time.perf_counter() - inicio)
+
+        driver.execute = execute
+        return driver
+
+    def registrar(self, comando, segundos, fase=None):
+        """Registra uma execução de comando (também usado para eventos sintéticos)"""
+        chave = (fase or self.obter_fase(), comando)
+        registro = self.registros.get(chave)
+        if registro is None:
+            registro = self.registros[chave] = {'quantidade': 0, 'segundos': 0.0, 'maximo': 0.0}
+        registro['quantidade'] += 1
+        registro['segundos'] += segundos
+        if segundos > registro['maximo']:
+            registro['maximo'] = segundos
+        self.total += 1
+
+    def por_fase(self):
+        """Agrega quantidade e tempo de comandos por fase"""
+        fases = {}
+        for (fase, _), registro in self.registros.items():
+            agregado = fases.setdefault(fase, {'quantidade': 0, 'segundos': 0.0})
+            agregado['quantidade'] += registro['quantidade']
+            agregado['segundos'] += registro['segundos']
+        return fases
+
+    def perfil(self, **extras):
+        """Monta o perfil completo em formato serializável"""
+        comandos = [
+            {
+                'fase': fase,
+                'comando': comando,
+                'quantidade': registro['quantidade'],
+                'segundos': round(registro['segundos'], 6),
+                'media_ms': round(1000 * registro['segundos'] / registro['quantidade'], 3),
+                'maximo_ms': round(1000 * registro['maximo'], 3)
+            }
+            for (fase, comando), registro in sorted(
+                self.registros.items(), key=lambda item: -item[1]['segundos'])
+        ]
+        perfil = {
+            'inicio': self.inicio.isoformat(timespec='seconds'),
+            'total_comandos': self.total,
+            'fases': {fase: {'quantidade': dados['quantidade'], 'segundos': round(dados['segundos'], 6)}
+                      for fase, dados in self.por_fase().items()},
+            'comandos': comandos
+        }
+        perfil.update(extras)
+        return perfil
+
+    def exportar_json(self, caminho, **extras):
+        """Grava o perfil em JSON"""
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            json.dump(self.perfil(**extras), arquivo, indent=2, ensure_ascii=False)
+        logger.info(f"Perfil do WebDriver gravado em {caminho}")
+
+    def exportar_flamegraph(self, caminho):
+        """
+        Grava o perfil no formato 'collapsed stacks' (uma linha por pilha com o
+        tempo em microssegundos), aceito por flamegraph.pl, speedscope e inferno
+        """
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            for (fase, comando), registro in sorted(self.registros.items()):
+                microssegundos = int(registro['segundos'] * 1_000_000)
+                arquivo.write(f"fc25;{fase};{comando} {microssegundos}\n")
+        logger.info(f"Perfil (flamegraph) gravado em {caminho}")
+
+    def resumo(self):
+        """Registra no log o total de comandos e tempo por fase"""
+        logger.info("="*50)
+        logger.info(f"COMANDOS DO WEBDRIVER POR FASE (total: {self.total})")
+        for fase, dados in sorted(self.por_fase().items(), key=lambda item: -item[1]['segundos']):
+            logger.info(f"  {fase:<12} {dados['quantidade']:6d} comando(s) em {dados['segundos']:8.2f}s")
+        logger.info("="*50)
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Logging assíncrono em JSON e amostragem das mensagens por card
+
+Os loggers só colocam os registros em uma fila (QueueHandler); uma thread
+(QueueListener) formata e grava no arquivo com rotação (uma linha JSON por
+registro) e no console. Assim o laço de extração nunca espera por escrita em
+disco.
+
+Mensagens por card (jogador coletado, falha ao ler um campo) passam pelo
+AmostradorCards: só as primeiras ocorrências de cada tipo por página são
+registradas, e o restante entra no resumo da página.
+"""
+
+import json
+import queue
+import atexit
+import logging
+import threading
+from collections import Counter
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+FORMATO_CONSOLE = '%(asctime)s - %(levelname)s - %(message)s'
+
+# Atributos padrão do LogRecord (o resto veio de `extra=` e vai para o JSON)
+_ATRIBUTOS_PADRAO = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+_listener = None
+_trava = threading.Lock()
+
+
+class FormatadorJSON(logging.Formatter):
+    """Uma linha JSON por registro, com os campos passados em `extra=`"""
+
+    def format(self, record):
+        dados = {
+            'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'nivel': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'mensagem': record.getMessage()
+        }
+        for chave, valor in vars(record).items():
+            if chave not in _ATRIBUTOS_PADRAO:
+                dados[chave] = valor
+        if record.exc_info:
+            dados['excecao'] = self.formatException(record.exc_info)
+        return json.dumps(dados, ensure_ascii=False, default=str)
+
+
+def configurar_logging(arquivo='fc25_scraper.log', nivel=logging.INFO, json_arquivo=True,
+                       max_bytes=10 * 1024 * 1024, backups=5, console=True, forcar=False):
+    """
+    Liga o logging assíncrono no logger raiz. Como o basicConfig, não faz nada
+    se o logging já estiver configurado (a menos que `forcar`)
+    """
+    global _listener
+    with _trava:
+        raiz = logging.getLogger()
+        if raiz.handlers and not forcar:
+            return False
+        encerrar_logging()
+        for handler in list(raiz.handlers):
+            raiz.removeHandler(handler)
+
+        destinos = []
+        if arquivo:
+            arquivo_handler = RotatingFileHandler(arquivo, maxBytes=max_bytes, backupCount=backups,
+                                                  encoding='utf-8')
+            arquivo_handler.setFormatter(FormatadorJSON() if json_arquivo else logging.Formatter(FORMATO_CONSOLE))
+            destinos.append(arquivo_handler)
+        if console:
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(logging.Formatter(FORMATO_CONSOLE))
+            destinos.append(console_handler)
+
+        fila = queue.Queue(-1)
+        raiz.addHandler(QueueHandler(fila))
+        raiz.setLevel(nivel)
+        _listener = QueueListener(fila, *destinos, respect_handler_level=True)
+        _listener.start()
+        return True
+
+
+def encerrar_logging():
+    """Esvazia a fila e para a thread de escrita (chamado também na saída do processo)"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(encerrar_logging)
+
+
+class AmostradorCards:
+    """
+    Agrega as mensagens por card de cada página: registra só as primeiras
+    `amostras` ocorrências de cada tipo e conta o restante para o resumo
+    """
+
+    def __init__(self, logger, amostras=1, nomes_no_resumo=3):
+        self.logger = logger
+        self.amostras = amostras
+        self.nomes_no_resumo = nomes_no_resumo
+        self._paginas = {}
+        self._trava = threading.Lock()
+        self.pagina_atual = None
+
+    def iniciar_pagina(self, pagina):
+        """Página cujos cards estão sendo extraídos agora (thread do navegador)"""
+        self.pagina_atual = pagina
+
+    def _contadores(self, pagina):
+        return self._paginas.setdefault(pagina, {'avisos': Counter(), 'coletados': [], 'ignorados': 0})
+
+    def aviso(self, tipo, mensagem, pagina=None):
+        """Falha ao ler um campo de um card (ex.: tipo 'estatisticas')"""
+        pagina = self.pagina_atual if pagina is None else pagina
+        with self._trava:
+            avisos = self._contadores(pagina)['avisos']
+            avisos[tipo] += 1
+            ocorrencia = avisos[tipo]
+        if ocorrencia <= self.amostras:
+            self.logger.warning(mensagem, extra={'pagina': pagina, 'tipo_aviso': tipo})
+
+    def coletado(self, pagina, nome, overall):
+        with self._trava:
+            self._contadores(pagina)['coletados'].append(f"{nome} - {overall}")
+
+    def ignorado(self, pagina):
+        with self._trava:
+            self._contadores(pagina)['ignorados'] += 1
+
+    def resumir(self, pagina):
+        """Registra uma linha de resumo da página e descarta seus contadores"""
+        with self._trava:
+            contadores = self._paginas.pop(pagina, None) or {'avisos': Counter(), 'coletados': [], 'ignorados': 0}
+        coletados = contadores['coletados']
+        suprimidos = {tipo: total - self.amostras for tipo, total in contadores['avisos'].items()
+                      if total > self.amostras}
+
+        mensagem = f"Página {pagina}: {len(coletados)} jogador(es) coletado(s)"
+        if contadores['ignorados']:
+            mensagem += f", {contadores['ignorados']} card(s) ignorado(s) por dados insuficientes"
+        if coletados:
+            mensagem += f" (ex.: {', '.join(coletados[:self.nomes_no_resumo])})"
+        if suprimidos:
+            mensagem += "; avisos repetidos: " + ', '.join(f"{t} x{n}" for t, n in sorted(suprimidos.items()))
+
+        self.logger.info(mensagem, extra={
+            'pagina': pagina,
+            'coletados': len(coletados),
+            'ignorados': contadores['ignorados'],
+            'avisos': dict(contadores['avisos']),
+            'amostra': coletados[:self.nomes_no_resumo]
+        })
+        if self.logger.isEnabledFor(logging.DEBUG):
+            for jogador in coletados:
+                self.logger.debug(f"Jogador coletado: {jogador}", extra={'pagina': pagina})
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pipeline da coleta paginada
+
+A thread principal só usa o navegador: captura o snapshot bruto da página e
+já clica em "Próxima". O processamento (parse, validação, gravação em
+CSV/JSONL/SQLite e checkpoint) roda em uma thread trabalhadora, na ordem das
+páginas. A fila limitada aplica contrapressão: se o processamento atrasar, a
+navegação espera em vez de acumular snapshots na memória.
+"""
+
+import time
+import queue
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class PipelinePaginas:
+    """Processa as páginas capturadas em uma thread trabalhadora"""
+
+    def __init__(self, processar, tamanho_fila=2):
+        self.processar = processar
+        self.fila = queue.Queue(maxsize=tamanho_fila)
+        self.parar = threading.Event()
+        self.erro = None
+        self.espera_fila = 0.0
+        self.thread = threading.Thread(target=self._trabalhar, name='pipeline-paginas', daemon=True)
+
+    def iniciar(self):
+        self.thread.start()
+        return self
+
+    @property
+    def interrompido(self):
+        """A thread trabalhadora pediu para encerrar (fim dos cards ou erro)"""
+        return self.parar.is_set()
+
+    def enviar(self, *tarefa):
+        """Enfileira uma página (bloqueia enquanto a fila estiver cheia)"""
+        inicio = time.perf_counter()
+        self.fila.put(tarefa)
+        self.espera_fila += time.perf_counter() - inicio
+
+    def _trabalhar(self):
+        while True:
+            tarefa = self.fila.get()
+            try:
+                if tarefa is None:
+                    return
+                if self.parar.is_set():
+                    # Após o fim ou um erro, só esvazia a fila para não travar a navegação
+                    continue
+                try:
+                    if self.processar(*tarefa) is False:
+                        self.parar.set()
+                except Exception as e:
+                    logger.error(f"Erro ao processar página no pipeline: {str(e)}")
+                    self.erro = e
+                    self.parar.set()
+            finally:
+                self.fila.task_done()
+
+    def encerrar(self):
+        """Aguarda o processamento das páginas enfileiradas e propaga erros"""
+        self.fila.put(None)
+        self.thread.join()
+        if self.espera_fila:
+            logger.info(f"Navegação aguardou {self.espera_fila:.2f}s pelo processamento (fila cheia)")
+        if self.erro is not None:
+            raise self.erro
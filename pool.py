@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Execução paralela do scraper para várias contas/clubes
+
+Cada conta roda em sua própria instância do Chrome, com um --user-data-dir
+dedicado, em um pool de threads (o trabalho é dominado por espera de rede e do
+navegador). Ao final, os CSVs de cada conta podem ser mesclados em um único
+arquivo com a coluna 'Conta'.
+
+Arquivo de contas (JSON):
+    [
+        {"conta": "principal", "email_env": "EA_EMAIL_PRINCIPAL", "senha_env": "EA_SENHA_PRINCIPAL"},
+        {"conta": "secundaria", "email": "outro@exemplo.com", "senha_env": "EA_SENHA_SECUNDARIA"}
+    ]
+
+Uso:
+    python pool.py contas.json --trabalhadores 4 --saida saida_contas
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from config import Config
+from logs import configurar_logging
+from extratores import CAMPOS_JOGADOR
+
+logger = logging.getLogger(__name__)
+
+
+def carregar_contas(caminho):
+    """Lê o arquivo de contas, resolvendo credenciais de variáveis de ambiente"""
+    with open(caminho, 'r', encoding='utf-8') as arquivo:
+        contas = json.load(arquivo)
+
+    for conta in contas:
+        if 'conta' not in conta:
+            raise ValueError(f"Conta sem o campo 'conta' em {caminho}: {conta}")
+        conta.setdefault('email', os.getenv(conta.get('email_env', ''), None))
+        conta.setdefault('senha', os.getenv(conta.get('senha_env', ''), None))
+    return contas
+
+
+def executar_conta(conta, diretorio_saida, diretorio_perfis, configurar=None):
+    """Executa o scraping completo de uma conta (roda dentro de uma thread)"""
+    from fc25_scraper import FC25Scraper
+
+    config = Config().para_conta(conta['conta'], diretorio_saida, diretorio_perfis)
+    config.email = conta.get('email')
+    config.senha = conta.get('senha')
+    config.interativo = False
+    config.exportar_dataframe = False
+    if configurar:
+        configurar(config)
+
+    inicio = time.perf_counter()
+    scraper = FC25Scraper(config)
+    sucesso = scraper.executar_scraping()
+
+    return {
+        'conta': conta['conta'],
+        'sucesso': sucesso,
+        'jogadores': scraper.total_coletados,
+        'segundos': time.perf_counter() - inicio,
+        'arquivo_csv': config.arquivo_csv
+    }
+
+
+def mesclar_csvs(resultados, arquivo_destino):
+    """Mescla os CSVs das contas em um único arquivo com a coluna 'Conta'"""
+    campos = ['Conta'] + CAMPOS_JOGADOR
+    total = 0
+    with open(arquivo_destino, 'w', newline='', encoding='utf-8-sig') as destino:
+        escritor = csv.DictWriter(destino, fieldnames=campos, extrasaction='ignore')
+        escritor.writeheader()
+        for resultado in resultados:
+            if not os.path.exists(resultado['arquivo_csv']):
+                continue
+            with open(resultado['arquivo_csv'], 'r', newline='', encoding='utf-8-sig') as origem:
+                for linha in csv.DictReader(origem):
+                    linha['Conta'] = resultado['conta']
+                    escritor.writerow(linha)
+                    total += 1
+    logger.info(f"{total} jogadores mesclados em {arquivo_destino}")
+    return total
+
+
+def preparar_driver():
+    """Resolve o chromedriver uma vez antes de abrir as instâncias em paralelo"""
+    try:
+        from driver_cache import ResolvedorDriver
+        ResolvedorDriver(Config().arquivo_manifesto_driver).resolver()
+    except Exception as e:
+        logger.warning(f"Não foi possível pré-carregar o chromedriver: {str(e)}")
+
+
+def executar_pool(contas, trabalhadores=2, diretorio_saida='saida_contas',
+                  diretorio_perfis='perfis', mesclar=True, configurar=None):
+    """Executa as contas em paralelo e retorna o resultado de cada uma"""
+    os.makedirs(diretorio_saida, exist_ok=True)
+    os.makedirs(diretorio_perfis, exist_ok=True)
+    preparar_driver()
+
+    inicio = time.perf_counter()
+    resultados = []
+    with ThreadPoolExecutor(max_workers=trabalhadores, thread_name_prefix='conta') as executor:
+        futuros = {
+            executor.submit(executar_conta, conta, diretorio_saida, diretorio_perfis, configurar): conta
+            for conta in contas
+        }
+        for futuro in as_completed(futuros):
+            conta = futuros[futuro]['conta']
+            try:
+                resultado = futuro.result()
+            except Exception as e:
+                logger.error(f"Erro na conta {conta}: {str(e)}")
+                resultado = {'conta': conta, 'sucesso': False, 'jogadores': 0, 'segundos': 0.0,
+                             'arquivo_csv': None}
+            resultados.append(resultado)
+            logger.info(f"Conta {conta} finalizada: {resultado['jogadores']} jogadores "
+                        f"em {resultado['segundos']:.1f}s")
+    duracao = time.perf_counter() - inicio
+
+    if mesclar:
+        mesclar_csvs([r for r in resultados if r['arquivo_csv']],
+                     os.path.join(diretorio_saida, 'jogadores_contas.csv'))
+
+    imprimir_resumo(resultados, duracao, trabalhadores)
+    return resultados
+
+
+def imprimir_resumo(resultados, duracao, trabalhadores):
+    """Mostra o resumo de vazão do pool"""
+    total_jogadores = sum(r['jogadores'] for r in resultados)
+    soma_sequencial = sum(r['segundos'] for r in resultados)
+
+    print("\n" + "="*60)
+    print(f"RESUMO DO POOL ({trabalhadores} navegador(es))")
+    print("="*60)
+    for r in sorted(resultados, key=lambda r: r['conta']):
+        status = "✅" if r['sucesso'] else "❌"
+        print(f"{status} {r['conta']:<20} {r['jogadores']:>6} jogadores  {r['segundos']:>8.1f}s")
+    print("-"*60)
+    print(f"Total de jogadores: {total_jogadores}")
+    print(f"Tempo total (parede): {duracao:.1f}s")
+    print(f"Soma dos tempos das contas: {soma_sequencial:.1f}s")
+    if duracao:
+        print(f"Vazão: {total_jogadores / duracao:.2f} jogadores/s")
+        print(f"Aceleração em relação à execução sequencial: {soma_sequencial / duracao:.2f}x")
+    print("="*60)
+
+
+def main(argv=None):
+    """Função principal do pool"""
+    parser = argparse.ArgumentParser(description="Scraping paralelo de várias contas EA FC 25")
+    parser.add_argument('contas', help="arquivo JSON com as contas")
+    parser.add_argument('-t', '--trabalhadores', type=int, default=2,
+                        help="quantidade de navegadores em paralelo (padrão: 2)")
+    parser.add_argument('--saida', default='saida_contas', help="diretório dos arquivos de saída")
+    parser.add_argument('--perfis', default='perfis', help="diretório dos perfis do Chrome")
+    parser.add_argument('--sem-mesclar', action='store_true', help="não gera o CSV mesclado")
+    args = parser.parse_args(argv)
+
+    configurar_logging(Config().arquivo_log)
+
+    contas = carregar_contas(args.contas)
+    resultados = executar_pool(contas, args.trabalhadores, args.saida, args.perfis,
+                               mesclar=not args.sem_mesclar)
+    return 0 if all(r['sucesso'] for r in resultados) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Registro tipado e compacto de jogador
+
+Os motores de extração produzem dicionários de strings no esquema
+CAMPOS_JOGADOR ('N/A' para ausentes). Na fronteira de cada página eles viram
+`JogadorRegistro`: uma dataclass com __slots__, overall e atributos inteiros,
+posição/qualidade/status como enums (uma única instância por valor) e None
+para valores ausentes. O CSV/JSONL continua no formato de strings.
+
+Um valor de posição/qualidade/status fora do enum (ex.: 'ZAG' do web app em
+português, uma raridade nova) é mantido como texto, e não descartado; cada
+valor desconhecido é registrado uma vez no log para que o enum seja estendido.
+"""
+
+import logging
+from enum import Enum
+from dataclasses import dataclass, fields
+from typing import Optional, Union
+
+from extratores import CAMPOS_JOGADOR, ESTATISTICAS
+
+logger = logging.getLogger(__name__)
+
+
+class Posicao(str, Enum):
+    GK = 'GK'
+    CB = 'CB'
+    LB = 'LB'
+    RB = 'RB'
+    LWB = 'LWB'
+    RWB = 'RWB'
+    CDM = 'CDM'
+    CM = 'CM'
+    CAM = 'CAM'
+    LM = 'LM'
+    RM = 'RM'
+    LW = 'LW'
+    RW = 'RW'
+    ST = 'ST'
+    CF = 'CF'
+
+
+class Qualidade(str, Enum):
+    BASE = 'Base'
+    SPECIAL = 'Special'
+    HERO = 'Hero'
+    ICON = 'Icon'
+
+
+class Status(str, Enum):
+    TRADEABLE = 'Tradeable'
+    UNTRADEABLE = 'Untradeable'
+
+
+def _texto(valor):
+    """'N/A' e vazio viram None"""
+    if valor is None:
+        return None
+    valor = str(valor).strip()
+    return None if valor in ('', 'N/A') else valor
+
+
+def _inteiro(valor):
+    """Converte para int (None se ausente ou não numérico)"""
+    valor = _texto(valor)
+    if valor is None:
+        return None
+    try:
+        return int(valor)
+    except ValueError:
+        return None
+
+
+# (enum, valor) fora do enum já registrados no log
+_desconhecidos = set()
+
+
+def _membro(enum, valor):
+    """Membro do enum com esse valor; fora do enum, o próprio texto (None se ausente)"""
+    texto = _texto(valor)
+    if texto is None:
+        return None
+    membro = enum._value2member_map_.get(texto)
+    if membro is not None:
+        return membro
+    if (enum, texto) not in _desconhecidos:
+        _desconhecidos.add((enum, texto))
+        logger.warning(f"Valor fora de {enum.__name__}: {texto!r} (mantido como texto)")
+    return texto
+
+
+def valor_texto(valor):
+    """Texto de um campo enumerado (membro do enum ou texto mantido)"""
+    return valor.value if isinstance(valor, Enum) else valor
+
+
+@dataclass
+class JogadorRegistro:
+    """Jogador coletado, com tipos nativos e None para valores ausentes"""
+
+    __slots__ = (
+        'nome', 'overall', 'posicao', 'clube', 'rating', 'qualidade', 'nacao', 'liga',
+        'pac', 'sho', 'pas', 'dri', 'def_', 'phy', 'traits', 'status',
+        'posicoes_alternativas', 'id_item'
+    )
+
+    nome: Optional[str]
+    overall: Optional[int]
+    posicao: Optional[Union[Posicao, str]]
+    clube: Optional[str]
+    rating: Optional[int]
+    qualidade: Optional[Union[Qualidade, str]]
+    nacao: Optional[str]
+    liga: Optional[str]
+    pac: Optional[int]
+    sho: Optional[int]
+    pas: Optional[int]
+    dri: Optional[int]
+    def_: Optional[int]
+    phy: Optional[int]
+    traits: Optional[str]
+    status: Optional[Union[Status, str]]
+    posicoes_alternativas: Optional[str]
+    id_item: Optional[int]
+
+    @classmethod
+    def de_dicionario(cls, jogador):
+        """Cria o registro a partir de um dicionário no esquema CAMPOS_JOGADOR"""
+        return cls(
+            nome=_texto(jogador.get('Nome')),
+            overall=_inteiro(jogador.get('Overall')),
+            posicao=_membro(Posicao, jogador.get('Posição')),
+            clube=_texto(jogador.get('Clube')),
+            rating=_inteiro(jogador.get('Rating')),
+            qualidade=_membro(Qualidade, jogador.get('Qualidade')),
+            nacao=_texto(jogador.get('Nação')),
+            liga=_texto(jogador.get('Liga')),
+            pac=_inteiro(jogador.get('PAC')),
+            sho=_inteiro(jogador.get('SHO')),
+            pas=_inteiro(jogador.get('PAS')),
+            dri=_inteiro(jogador.get('DRI')),
+            def_=_inteiro(jogador.get('DEF')),
+            phy=_inteiro(jogador.get('PHY')),
+            traits=_texto(jogador.get('Traits')),
+            status=_membro(Status, jogador.get('Status')),
+            posicoes_alternativas=_texto(jogador.get('Posições_Alternativas')),
+            id_item=_inteiro(jogador.get('ID'))
+        )
+
+    @classmethod
+    def de_valores(cls, valores, id_item=None):
+        """Cria o registro a partir de valores já tipados, na ordem de CAMPOS_JOGADOR"""
+        registro = cls(*valores, id_item)
+        registro.posicao = _membro(Posicao, registro.posicao)
+        registro.qualidade = _membro(Qualidade, registro.qualidade)
+        registro.status = _membro(Status, registro.status)
+        return registro
+
+    @property
+    def valido(self):
+        """Tem dados suficientes para ser coletado (nome e overall)"""
+        return self.nome is not None and self.nome != 'Erro' and self.overall is not None
+
+    def valores(self):
+        """Valores na ordem de CAMPOS_JOGADOR (enums como texto, ausentes como None)"""
+        return tuple(valor_texto(getattr(self, atributo)) for atributo in ATRIBUTOS_CAMPOS)
+
+    def como_dicionario(self):
+        """Dicionário de strings no esquema CAMPOS_JOGADOR ('N/A' para ausentes)"""
+        jogador = {
+            campo: 'N/A' if valor is None else str(valor)
+            for campo, valor in zip(CAMPOS_JOGADOR, self.valores())
+        }
+        if self.id_item is not None:
+            jogador['ID'] = self.id_item
+        return jogador
+
+
+# Atributo do registro correspondente a cada campo de CAMPOS_JOGADOR
+ATRIBUTOS_CAMPOS = [f.name for f in fields(JogadorRegistro)][:len(CAMPOS_JOGADOR)]
+
+# Tipos das colunas na exportação para pandas
+TIPOS_COLUNAS = {
+    'Overall': 'Int8',
+    'Rating': 'Int8',
+    **{estatistica: 'Int8' for estatistica in ESTATISTICAS},
+    'Posição': 'category',
+    'Qualidade': 'category',
+    'Status': 'category',
+    'Nação': 'category',
+    'Liga': 'category',
+    'Clube': 'category'
+}
+
+
+def como_registros(jogadores):
+    """Converte uma lista de dicionários (ou registros) em registros"""
+    return [j if isinstance(j, JogadorRegistro) else JogadorRegistro.de_dicionario(j) for j in jogadores]
+
+
+def tipar_dataframe(df):
+    """
+    Converte as colunas de um DataFrame no esquema CAMPOS_JOGADOR (lido como
+    strings) para inteiros anuláveis e categorias
+    """
+    import pandas as pd
+
+    df = df.replace({'N/A': None, '': None})
+    for coluna, tipo in TIPOS_COLUNAS.items():
+        if coluna not in df.columns:
+            continue
+        if tipo == 'category':
+            df[coluna] = df[coluna].astype('category')
+        else:
+            df[coluna] = pd.to_numeric(df[coluna], errors='coerce').astype(tipo)
+    return df
+
+
+def dataframe_jogadores(registros):
+    """DataFrame tipado a partir de registros"""
+    import pandas as pd
+
+    df = pd.DataFrame.from_records([r.valores() for r in registros], columns=CAMPOS_JOGADOR)
+    return tipar_dataframe(df)
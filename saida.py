@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gravação incremental dos jogadores coletados (CSV e JSONL)
+"""
+
+import os
+import csv
+import json
+import logging
+from extratores import CAMPOS_JOGADOR
+from registros import JogadorRegistro
+
+logger = logging.getLogger(__name__)
+
+
+class SaidaIncremental:
+    """
+    Grava os jogadores página a página em CSV e JSONL, em modo append e com
+    flush ao fim de cada página. A memória usada não cresce com o clube.
+    """
+
+    def __init__(self, arquivo_csv='jogadores_fc25.csv', arquivo_jsonl='jogadores_fc25.jsonl',
+                 campos=None, anexar=False):
+        self.arquivo_csv = arquivo_csv
+        self.arquivo_jsonl = arquivo_jsonl
+        self.campos = list(campos or CAMPOS_JOGADOR)
+        self.anexar = anexar
+        self.total = 0
+        self._csv = None
+        self._jsonl = None
+        self._escritor = None
+
+    def abrir(self, offsets=None):
+        """
+        Abre os arquivos de saída (truncando, a menos que esteja anexando).
+        Ao anexar, `offsets` corta os arquivos no tamanho salvo no checkpoint,
+        descartando linhas gravadas depois dele.
+        """
+        modo = 'a' if self.anexar else 'w'
+
+        if self.anexar and offsets:
+            self._truncar(self.arquivo_csv, offsets.get('csv'))
+            self._truncar(self.arquivo_jsonl, offsets.get('jsonl'))
+
+        escrever_cabecalho = not (self.anexar and os.path.exists(self.arquivo_csv)
+                                  and os.path.getsize(self.arquivo_csv) > 0)
+        self._csv = open(self.arquivo_csv, modo, newline='', encoding='utf-8-sig')
+        self._escritor = csv.DictWriter(self._csv, fieldnames=self.campos, extrasaction='ignore')
+        if escrever_cabecalho:
+            self._escritor.writeheader()
+
+        if self.arquivo_jsonl:
+            self._jsonl = open(self.arquivo_jsonl, modo, encoding='utf-8')
+
+        logger.info(f"Saída incremental aberta: {self.arquivo_csv}"
+                    + (f" e {self.arquivo_jsonl}" if self.arquivo_jsonl else ""))
+        return self
+
+    def escrever_pagina(self, jogadores):
+        """Grava os jogadores de uma página e força o flush para o disco"""
+        if self._escritor is None:
+            self.abrir()
+
+        for jogador in jogadores:
+            if isinstance(jogador, JogadorRegistro):
+                jogador = jogador.como_dicionario()
+            linha = {campo: jogador.get(campo, 'N/A') for campo in self.campos}
+            self._escritor.writerow(linha)
+            if self._jsonl:
+                self._jsonl.write(json.dumps(linha, ensure_ascii=False) + '\n')
+
+        self._csv.flush()
+        if self._jsonl:
+            self._jsonl.flush()
+        self.total += len(jogadores)
+
+    @staticmethod
+    def _truncar(caminho, tamanho):
+        """Corta o arquivo no tamanho informado (se existir e for maior)"""
+        if caminho and tamanho is not None and os.path.exists(caminho) \
+                and os.path.getsize(caminho) > tamanho:
+            with open(caminho, 'r+b') as arquivo:
+                arquivo.truncate(tamanho)
+            logger.info(f"{caminho} truncado em {tamanho} bytes (checkpoint)")
+
+    def posicao(self):
+        """Retorna o tamanho atual (bytes) dos arquivos de saída já gravados"""
+        offsets = {}
+        for chave, arquivo in (('csv', self._csv), ('jsonl', self._jsonl)):
+            if arquivo:
+                arquivo.flush()
+                offsets[chave] = os.fstat(arquivo.fileno()).st_size
+        return offsets
+
+    def fechar(self):
+        """Fecha os arquivos de saída"""
+        for arquivo in (self._csv, self._jsonl):
+            if arquivo:
+                arquivo.close()
+        self._csv = None
+        self._jsonl = None
+        self._escritor = None
+
+    def __enter__(self):
+        return self.abrir()
+
+    def __exit__(self, *exc):
+        self.fechar()
+        return False
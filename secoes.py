@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Seções do web app com listas de itens coletáveis
+
+Cada seção descreve o caminho de navegação a partir da barra de abas (aba e
+tile do hub, cada passo com uma lista de seletores de fallback), o container
+dos cards e o endpoint da API que preenche a lista. Todas as listas usam os
+mesmos cards `listFUTItem`, então os motores de extração são os mesmos do
+clube; itens que não são jogadores (consumíveis, estádio) são descartados
+como cards com dados insuficientes.
+
+Uma sessão autenticada percorre as seções pedidas em sequência (Config.secoes
+ou FC25_SECOES="clube,transferencias"), sem recarregar a página nem refazer o
+login, e grava uma saída por seção.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from captura_api import PADRAO_URL_CLUBE
+from extratores import SELETORES_CARDS
+
+# Seção coletada por padrão (mantém os nomes de arquivo originais)
+SECAO_PADRAO = 'clube'
+
+# Abas da barra de navegação do web app
+ABA_INICIO = ('aba Home', ['button.ut-tab-bar-item.icon-home'])
+ABA_CLUBE = ('aba Club', ['button.ut-tab-bar-item.icon-club'])
+ABA_TRANSFERENCIAS = ('aba Transfers', ['button.ut-tab-bar-item.icon-transfer'])
+
+
+@dataclass
+class Secao:
+    """Lista de itens do web app: caminho de navegação, container dos cards e API"""
+
+    nome: str
+    titulo: str
+    # Passos clicados em ordem: (descrição, seletores CSS ou XPath iniciados por '//')
+    caminho: List[Tuple[str, List[str]]]
+    # Container dos cards; None usa o padrão dos motores (SELETORES_CARDS)
+    seletores_cards: Optional[List[str]] = None
+    # Endpoint (regex) das respostas JSON da lista, lido pelo motor 'api'
+    padrao_url_api: str = PADRAO_URL_CLUBE
+    # A tela tem os controles de ordenação/filtro do clube (filtros.py)
+    filtros_no_webapp: bool = False
+
+    @property
+    def aba(self):
+        """Descrição do passo da barra de abas (o primeiro do caminho)"""
+        return self.caminho[0][0]
+
+    def chave_seletor(self, campo):
+        """Campo no cache de seletores (o clube mantém as chaves originais)"""
+        return campo if self.nome == SECAO_PADRAO else f"{campo}:{self.nome}"
+
+
+SECOES = {
+    'clube': Secao(
+        nome='clube',
+        titulo='Club > Players',
+        caminho=[
+            ABA_CLUBE,
+            ('tile Players', ['div.players-tile', "//h1[contains(text(), 'Players')]"])
+        ],
+        filtros_no_webapp=True
+    ),
+    'transferencias': Secao(
+        nome='transferencias',
+        titulo='Transfers > Transfer List',
+        caminho=[
+            ABA_TRANSFERENCIAS,
+            ('tile Transfer List', ['div.ut-tile-transfer-list', 'div.transfer-list-tile',
+                                    "//h1[contains(text(), 'Transfer List')]"])
+        ],
+        seletores_cards=['.ut-transfer-list-view li.listFUTItem',
+                         '.sectioned-item-list li.listFUTItem'] + list(SELETORES_CARDS),
+        padrao_url_api=r'/ut/game/fc\d+/tradepile'
+    ),
+    'nao_atribuidos': Secao(
+        nome='nao_atribuidos',
+        titulo='Home > Unassigned',
+        caminho=[
+            ABA_INICIO,
+            ('tile Unassigned', ['div.ut-unassigned-tile-view', 'div.unassigned-tile',
+                                 "//h1[contains(text(), 'Unassigned')]"])
+        ],
+        seletores_cards=['.ut-unassigned-view li.listFUTItem',
+                         '.sectioned-item-list li.listFUTItem'] + list(SELETORES_CARDS),
+        padrao_url_api=r'/ut/game/fc\d+/purchased/items'
+    ),
+    'armazenamento_sbc': Secao(
+        nome='armazenamento_sbc',
+        titulo='Club > SBC Storage',
+        caminho=[
+            ABA_CLUBE,
+            ('tile SBC Storage', ['div.sbc-storage-tile', 'div.ut-tile-view--sbc-storage',
+                                  "//h1[contains(text(), 'SBC Storage')]"])
+        ],
+        padrao_url_api=r'/ut/game/fc\d+/storagepile'
+    )
+}
+
+# Nomes alternativos aceitos em Config.secoes / --secoes
+APELIDOS = {
+    'jogadores': 'clube',
+    'club': 'clube',
+    'transfer_list': 'transferencias',
+    'tradepile': 'transferencias',
+    'unassigned': 'nao_atribuidos',
+    'sbc': 'armazenamento_sbc',
+    'storage': 'armazenamento_sbc'
+}
+
+
+def obter_secoes(nomes):
+    """
+    Seções na ordem pedida (lista ou texto separado por vírgulas), sem
+    repetições. Nome desconhecido gera ValueError
+    """
+    if isinstance(nomes, str):
+        nomes = nomes.split(',')
+    secoes = []
+    for nome in nomes or [SECAO_PADRAO]:
+        nome = nome.strip().lower()
+        if not nome:
+            continue
+        nome = APELIDOS.get(nome, nome)
+        if nome not in SECOES:
+            raise ValueError(f"Seção desconhecida: {nome} (disponíveis: {', '.join(SECOES)})")
+        if SECOES[nome] not in secoes:
+            secoes.append(SECOES[nome])
+    return secoes or [SECOES[SECAO_PADRAO]]
+
+
+def caminho_da_secao(caminho, secao):
+    """Arquivo de saída da seção: jogadores_fc25.csv -> jogadores_fc25_transferencias.csv"""
+    if not caminho or secao == SECAO_PADRAO:
+        return caminho
+    base, extensao = os.path.splitext(caminho)
+    return f"{base}_{secao}{extensao}"
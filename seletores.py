@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cache de estratégias de seletores para o EA FC 25 Web App Scraper
+
+Cada campo (cards, nome, overall, próxima página...) tem uma lista ordenada de
+seletores de fallback. O cache aprende qual seletor funcionou e passa a testá-lo
+primeiro; a lista completa só é percorrida quando o seletor aprendido falha.
+O mapeamento aprendido é salvo em disco, separado por versão do web app.
+"""
+
+import os
+import json
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Procura a versão do web app em metadados ou no caminho dos scripts carregados
+SCRIPT_VERSAO_WEBAPP = """
+var meta = document.querySelector('meta[name="version"], meta[name="app-version"]');
+if (meta && meta.content) {
+    return meta.content;
+}
+var scripts = document.querySelectorAll('script[src]');
+for (var i = 0; i < scripts.length; i++) {
+    var match = scripts[i].src.match(/\\/(\\d+(?:\\.\\d+){1,3})\\//);
+    if (match) {
+        return match[1];
+    }
+}
+return null;
+"""
+
+
+def detectar_versao_webapp(driver):
+    """Detecta a versão do web app carregado (ou 'desconhecida')"""
+    try:
+        return driver.execute_script(SCRIPT_VERSAO_WEBAPP) or 'desconhecida'
+    except Exception as e:
+        logger.warning(f"Não foi possível detectar a versão do web app: {str(e)}")
+        return 'desconhecida'
+
+
+class CacheSeletores:
+    """Aprende e persiste o seletor vencedor de cada campo"""
+
+    # Várias instâncias do scraper (pool de contas) podem gravar o mesmo arquivo
+    _trava_arquivo = threading.Lock()
+
+    def __init__(self, caminho='seletores_cache.json'):
+        self.caminho = caminho
+        self.versao = None
+        self.aprendidos = {}
+        self.alterado = False
+        self.acertos = 0
+        self.falhas = 0
+
+    def carregar(self, versao):
+        """Carrega os seletores aprendidos para a versão informada do web app"""
+        self.versao = versao
+        self.aprendidos = {}
+        if os.path.exists(self.caminho):
+            try:
+                with open(self.caminho, 'r', encoding='utf-8') as arquivo:
+                    self.aprendidos = json.load(arquivo).get(versao, {})
+            except (OSError, ValueError) as e:
+                logger.warning(f"Cache de seletores ignorado ({self.caminho}): {str(e)}")
+        logger.info(f"Cache de seletores: {len(self.aprendidos)} campo(s) aprendido(s) para a versão {versao}")
+
+    def salvar(self):
+        """Grava os seletores aprendidos, preservando as outras versões"""
+        if not self.alterado or self.versao is None:
+            return
+        with self._trava_arquivo:
+            dados = {}
+            if os.path.exists(self.caminho):
+                try:
+                    with open(self.caminho, 'r', encoding='utf-8') as arquivo:
+                        dados = json.load(arquivo)
+                except (OSError, ValueError):
+                    dados = {}
+            dados.setdefault(self.versao, {}).update(self.aprendidos)
+            with open(self.caminho, 'w', encoding='utf-8') as arquivo:
+                json.dump(dados, arquivo, indent=2, ensure_ascii=False)
+        self.alterado = False
+        logger.info(f"Cache de seletores salvo em {self.caminho}")
+
+    def resolver(self, campo, seletores, buscar):
+        """
+        Retorna o primeiro resultado verdadeiro de `buscar(seletor)`, testando
+        primeiro o seletor aprendido para o campo. Registra o novo vencedor
+        quando precisa recorrer à lista completa.
+        """
+        aprendido = self.aprendidos.get(campo)
+        if aprendido is not None:
+            resultado = buscar(aprendido)
+            if resultado:
+                self.acertos += 1
+                return resultado
+
+        self.falhas += 1
+        for seletor in seletores:
+            if seletor == aprendido:
+                continue
+            resultado = buscar(seletor)
+            if resultado:
+                if aprendido != seletor:
+                    logger.info(f"Seletor aprendido para '{campo}': {seletor}")
+                    self.aprendidos[campo] = seletor
+                    self.alterado = True
+                return resultado
+        return None
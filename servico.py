@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Serviço local de consulta (somente leitura) sobre a última coleta
+
+Carrega os jogadores da última execução concluída do histórico SQLite (ou do
+CSV, sem histórico) uma única vez e monta índices em memória por posição,
+faixa de overall, liga, nação, qualidade e status. As consultas são
+respondidas em JSON sem reler nenhum arquivo; quando uma nova coleta termina,
+os dados são recarregados em segundo plano e os índices trocados de uma vez.
+
+Uso:
+    python servico.py --porta 8765
+
+    GET /jogadores?posicao=ST,CF&overall_min=85&liga=Premier League&ordenar=-pac&limite=10
+    GET /resumo       contagem por valor de cada índice
+    GET /saude        versão carregada e total de jogadores
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import heapq
+import argparse
+import logging
+import threading
+from datetime import datetime
+from urllib.parse import urlsplit, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from extratores import CAMPOS_JOGADOR
+from registros import ATRIBUTOS_CAMPOS, JogadorRegistro
+
+logger = logging.getLogger(__name__)
+
+LARGURA_FAIXA_OVERALL = 5
+
+# Parâmetro da consulta -> atributo do JogadorRegistro usado em cada índice
+CAMPOS_INDICE = {
+    'posicao': 'posicao',
+    'liga': 'liga',
+    'nacao': 'nacao',
+    'qualidade': 'qualidade',
+    'status': 'status',
+    'clube': 'clube'
+}
+
+# Campos aceitos em `ordenar` (nome do parâmetro -> atributo do registro)
+CAMPOS_ORDENACAO = {atributo.rstrip('_'): atributo for atributo in ATRIBUTOS_CAMPOS}
+
+LIMITE_PADRAO = 50
+
+
+def _texto(valor):
+    """Valor de índice como texto (enums pelo valor)"""
+    return getattr(valor, 'value', valor)
+
+
+class IndiceJogadores:
+    """Jogadores de uma coleta com índices invertidos em memória"""
+
+    def __init__(self, registros, versao=None):
+        self.registros = list(registros)
+        self.versao = versao
+        self.carregado_em = datetime.now().isoformat(timespec='seconds')
+
+        # Dicionários JSON prontos, montados uma vez por carga
+        self.dicionarios = []
+        for registro in self.registros:
+            jogador = dict(zip(CAMPOS_JOGADOR, registro.valores()))
+            jogador['ID'] = registro.id_item
+            self.dicionarios.append(jogador)
+
+        self.indices = {campo: {} for campo in CAMPOS_INDICE}
+        self.faixas = {}
+        for posicao, registro in enumerate(self.registros):
+            for campo, atributo in CAMPOS_INDICE.items():
+                valor = _texto(getattr(registro, atributo))
+                if valor is not None:
+                    self.indices[campo].setdefault(valor.lower(), set()).add(posicao)
+            if registro.overall is not None:
+                faixa = registro.overall // LARGURA_FAIXA_OVERALL
+                self.faixas.setdefault(faixa, set()).add(posicao)
+
+        # Ordens (e a posição de cada jogador nelas) por campo, montadas na primeira consulta
+        self._ordens = {}
+
+    def __len__(self):
+        return len(self.registros)
+
+    def _por_faixa(self, minimo, maximo):
+        """Posições com overall em [minimo, maximo], pelas faixas e conferindo as bordas"""
+        baixo = -1 if minimo is None else minimo // LARGURA_FAIXA_OVERALL
+        alto = float('inf') if maximo is None else maximo // LARGURA_FAIXA_OVERALL
+        candidatos = set()
+        for faixa, posicoes in self.faixas.items():
+            if baixo <= faixa <= alto:
+                if baixo < faixa < alto:
+                    candidatos |= posicoes
+                else:
+                    candidatos.update(
+                        p for p in posicoes
+                        if (minimo is None or self.registros[p].overall >= minimo) and
+                        (maximo is None or self.registros[p].overall <= maximo))
+        return candidatos
+
+    def consultar(self, filtros, ordenar=None, limite=LIMITE_PADRAO):
+        """
+        Jogadores que atendem a todos os filtros. `filtros` mapeia campos de
+        CAMPOS_INDICE para listas de valores aceitos (OU dentro do campo, E entre
+        campos), além de overall_min/overall_max e nome (trecho do nome)
+        """
+        conjuntos = []
+        for campo in CAMPOS_INDICE:
+            valores = filtros.get(campo)
+            if valores:
+                indice = self.indices[campo]
+                conjuntos.append(set().union(*(indice.get(v.lower(), set()) for v in valores)))
+
+        minimo, maximo = filtros.get('overall_min'), filtros.get('overall_max')
+        if minimo is not None or maximo is not None:
+            conjuntos.append(self._por_faixa(minimo, maximo))
+
+        if conjuntos:
+            conjuntos.sort(key=len)
+            resultado = conjuntos[0].intersection(*conjuntos[1:])
+        else:
+            resultado = None
+
+        nome = (filtros.get('nome') or '').lower()
+        if nome:
+            base = resultado if resultado is not None else range(len(self.registros))
+            resultado = {p for p in base if nome in (self.registros[p].nome or '').lower()}
+
+        total = len(self.registros) if resultado is None else len(resultado)
+        posicoes = self._ordenar(resultado, ordenar, limite)
+        return total, [self.dicionarios[p] for p in posicoes]
+
+    def _ordem(self, atributo, decrescente):
+        """Jogadores ordenados pelo atributo (ausentes no fim) e o posto de cada um"""
+        chave = (atributo, decrescente)
+        if chave not in self._ordens:
+            def valor(p):
+                return _texto(getattr(self.registros[p], atributo))
+            presentes = [p for p in range(len(self.registros)) if valor(p) is not None]
+            presentes.sort(key=valor, reverse=decrescente)
+            ordem = presentes + [p for p in range(len(self.registros)) if valor(p) is None]
+            postos = [0] * len(ordem)
+            for posto, p in enumerate(ordem):
+                postos[p] = posto
+            self._ordens[chave] = (ordem, postos)
+        return self._ordens[chave]
+
+    def _ordenar(self, resultado, ordenar, limite):
+        """Top-N pelo campo pedido ('-campo' = decrescente); padrão: overall decrescente"""
+        ordenar = ordenar or '-overall'
+        ordem, postos = self._ordem(CAMPOS_ORDENACAO[ordenar.lstrip('-+')], ordenar.startswith('-'))
+        if resultado is None:
+            return ordem[:limite]
+        return heapq.nsmallest(limite, resultado, key=postos.__getitem__)
+
+    def resumo(self):
+        """Quantidade de jogadores por valor de cada índice"""
+        resumo = {campo: {valor: len(posicoes) for valor, posicoes in sorted(indice.items())}
+                  for campo, indice in self.indices.items()}
+        resumo['overall'] = {
+            f"{faixa * LARGURA_FAIXA_OVERALL}-{faixa * LARGURA_FAIXA_OVERALL + LARGURA_FAIXA_OVERALL - 1}":
+                len(posicoes) for faixa, posicoes in sorted(self.faixas.items())
+        }
+        return resumo
+
+
+class FonteHistorico:
+    """Última execução concluída do histórico SQLite"""
+
+    def __init__(self, banco, conta=None):
+        self.banco = banco
+        self.conta = conta
+
+    def disponivel(self):
+        return self.versao() is not None
+
+    def versao(self):
+        from armazenamento import ArmazenamentoSQLite
+
+        if not os.path.exists(self.banco):
+            return None
+        with ArmazenamentoSQLite(self.banco, somente_leitura=True) as armazenamento:
+            execucao = armazenamento.ultima_execucao(self.conta)
+        return f"execucao:{execucao}" if execucao is not None else None
+
+    def carregar(self):
+        from armazenamento import ArmazenamentoSQLite
+
+        with ArmazenamentoSQLite(self.banco, somente_leitura=True) as armazenamento:
+            execucao = armazenamento.ultima_execucao(self.conta)
+            return armazenamento.jogadores_execucao(execucao), f"execucao:{execucao}"
+
+
+class FonteCSV:
+    """CSV exportado pelo scraper (recarregado quando muda e para de crescer)"""
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        self._ultimo = None
+
+    def disponivel(self):
+        return os.path.exists(self.caminho)
+
+    def versao(self):
+        if not os.path.exists(self.caminho):
+            return None
+        estado = os.stat(self.caminho)
+        assinatura = (estado.st_mtime_ns, estado.st_size)
+        # O CSV é gravado página a página: só vale quando não mudou desde a última verificação
+        estavel = assinatura == self._ultimo
+        self._ultimo = assinatura
+        return f"csv:{assinatura[0]}:{assinatura[1]}" if estavel else None
+
+    def carregar(self):
+        estado = os.stat(self.caminho)
+        with open(self.caminho, 'r', newline='', encoding='utf-8-sig') as arquivo:
+            registros = [JogadorRegistro.de_dicionario(linha) for linha in csv.DictReader(arquivo)]
+        return registros, f"csv:{estado.st_mtime_ns}:{estado.st_size}"
+
+
+class ServicoConsulta:
+    """Mantém o índice atual e o recarrega quando uma nova coleta termina"""
+
+    def __init__(self, fonte, intervalo=2.0):
+        self.fonte = fonte
+        self.intervalo = intervalo
+        self.indice = IndiceJogadores([])
+        self._parar = threading.Event()
+        self._thread = None
+
+    def recarregar(self):
+        """Carrega a fonte e troca o índice (as consultas em andamento usam o anterior)"""
+        inicio = time.perf_counter()
+        registros, versao = self.fonte.carregar()
+        self.indice = IndiceJogadores(registros, versao)
+        logger.info(f"Dados carregados ({versao}): {len(registros)} jogadores "
+                    f"em {(time.perf_counter() - inicio) * 1000:.0f} ms")
+
+    def _vigiar(self):
+        while not self._parar.wait(self.intervalo):
+            try:
+                versao = self.fonte.versao()
+                if versao is not None and versao != self.indice.versao:
+                    self.recarregar()
+            except Exception as e:
+                logger.warning(f"Erro ao verificar nova coleta: {str(e)}")
+
+    def iniciar(self):
+        if self.fonte.disponivel():
+            try:
+                self.recarregar()
+            except Exception as e:
+                logger.warning(f"Dados ainda indisponíveis: {str(e)}")
+        self._thread = threading.Thread(target=self._vigiar, name='recarga-servico', daemon=True)
+        self._thread.start()
+        return self
+
+    def encerrar(self):
+        self._parar.set()
+
+
+def interpretar_consulta(query):
+    """Converte a query string em filtros, ordenação e limite"""
+    parametros = parse_qs(query)
+
+    def lista(nome):
+        return [v.strip() for valor in parametros.get(nome, []) for v in valor.split(',') if v.strip()]
+
+    def inteiro(nome):
+        valores = parametros.get(nome)
+        return int(valores[-1]) if valores else None
+
+    filtros = {campo: lista(campo) for campo in CAMPOS_INDICE}
+    filtros['overall_min'] = inteiro('overall_min')
+    filtros['overall_max'] = inteiro('overall_max')
+    filtros['nome'] = (parametros.get('nome') or [''])[-1]
+
+    ordenar = (parametros.get('ordenar') or [None])[-1]
+    if ordenar and ordenar.lstrip('-+') not in CAMPOS_ORDENACAO:
+        raise ValueError(f"Campo de ordenação desconhecido: {ordenar}")
+    limite = inteiro('limite') or LIMITE_PADRAO
+    return filtros, ordenar, max(1, limite)
+
+
+def criar_handler(servico):
+    """Handler HTTP somente leitura ligado ao serviço"""
+
+    class HandlerConsulta(BaseHTTPRequestHandler):
+
+        def _responder(self, status, corpo):
+            dados = json.dumps(corpo, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(dados)))
+            self.end_headers()
+            self.wfile.write(dados)
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            indice = servico.indice
+            if url.path == '/jogadores':
+                try:
+                    filtros, ordenar, limite = interpretar_consulta(url.query)
+                except ValueError as e:
+                    self._responder(400, {'erro': str(e)})
+                    return
+                inicio = time.perf_counter()
+                total, jogadores = indice.consultar(filtros, ordenar, limite)
+                self._responder(200, {
+                    'versao': indice.versao,
+                    'total': total,
+                    'jogadores': jogadores,
+                    'microssegundos': round((time.perf_counter() - inicio) * 1e6)
+                })
+            elif url.path == '/resumo':
+                self._responder(200, {'versao': indice.versao, 'total': len(indice), 'indices': indice.resumo()})
+            elif url.path == '/saude':
+                self._responder(200, {'versao': indice.versao, 'total': len(indice),
+                                      'carregado_em': indice.carregado_em})
+            else:
+                self._responder(404, {'erro': f"Caminho desconhecido: {url.path}"})
+
+        def log_message(self, format, *args):
+            logger.debug(format % args)
+
+    return HandlerConsulta
+
+
+def main(argv=None):
+    """Função principal do serviço de consulta"""
+    from config import Config
+
+    config = Config()
+    parser = argparse.ArgumentParser(description="Serviço local de consulta sobre a última coleta")
+    parser.add_argument('--banco', default=config.arquivo_banco, help="histórico SQLite (fonte preferida)")
+    parser.add_argument('--csv', default=config.arquivo_csv, help="CSV usado quando não há histórico")
+    parser.add_argument('--conta', help="usa só as execuções desta conta")
+    parser.add_argument('--host', default='127.0.0.1', help="endereço (padrão: só a máquina local)")
+    parser.add_argument('--porta', type=int, default=8765)
+    parser.add_argument('--intervalo', type=float, default=2.0,
+                        help="segundos entre as verificações de nova coleta")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    if args.banco and os.path.exists(args.banco):
+        fonte = FonteHistorico(args.banco, args.conta)
+    else:
+        fonte = FonteCSV(args.csv)
+    servico = ServicoConsulta(fonte, args.intervalo).iniciar()
+
+    servidor = ThreadingHTTPServer((args.host, args.porta), criar_handler(servico))
+    print(f"🔎 Consultas em http://{args.host}:{servidor.server_port}/jogadores "
+          f"({len(servico.indice)} jogadores, {servico.indice.versao})")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servico.encerrar()
+        servidor.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
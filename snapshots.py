@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Arquivo de snapshots das páginas e re-extração offline
+
+Com `gravar_snapshots` ativo, o HTML de cada página (e os itens da API, no
+motor 'api') é gravado durante a coleta em `snapshots/execucao_<id>.jsonl.gz`,
+uma linha JSON por página, com a conta e a seção da coleta. Depois de corrigir um seletor ou adicionar um
+campo, o histórico inteiro pode ser reprocessado sem navegador, com um
+processo por arquivo:
+
+    python snapshots.py snapshots/*.jsonl.gz --saida reextracao --banco historico_fc25.db
+"""
+
+import os
+import sys
+import glob
+import gzip
+import json
+import time
+import argparse
+import logging
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+logger = logging.getLogger(__name__)
+
+
+class GravadorSnapshots:
+    """Grava o HTML de cada página em um arquivo JSONL comprimido com gzip"""
+
+    def __init__(self, caminho, execucao=None, conta=None, secao=None):
+        self.caminho = caminho
+        self.execucao = execucao
+        self.conta = conta
+        self.secao = secao
+        self._arquivo = None
+        self.paginas = 0
+
+    def abrir(self):
+        """Abre o arquivo em modo append (uma retomada continua o mesmo arquivo)"""
+        diretorio = os.path.dirname(self.caminho)
+        if diretorio:
+            os.makedirs(diretorio, exist_ok=True)
+        self._arquivo = gzip.open(self.caminho, 'at', encoding='utf-8', compresslevel=6)
+        logger.info(f"Gravando snapshots das páginas em {self.caminho}")
+        return self
+
+    def gravar(self, pagina, html, itens=None, motor=None):
+        """Grava o snapshot de uma página"""
+        registro = {
+            'execucao': self.execucao,
+            'conta': self.conta,
+            'secao': self.secao,
+            'pagina': pagina,
+            'motor': motor,
+            'capturado_em': datetime.now().isoformat(timespec='seconds'),
+            'html': html
+        }
+        if itens is not None:
+            registro['itens'] = itens
+        self._arquivo.write(json.dumps(registro, ensure_ascii=False) + '\n')
+        self._arquivo.flush()
+        self.paginas += 1
+
+    def fechar(self):
+        if self._arquivo:
+            self._arquivo.close()
+            self._arquivo = None
+
+
+def ler_snapshots(caminho):
+    """
+    Lê os snapshots de um arquivo, em ordem de página. Se uma página aparece
+    mais de uma vez (execução retomada), vale a última gravação
+    """
+    paginas = {}
+    with gzip.open(caminho, 'rt', encoding='utf-8') as arquivo:
+        try:
+            for linha in arquivo:
+                if linha.strip():
+                    registro = json.loads(linha)
+                    paginas[registro['pagina']] = registro
+        except (EOFError, ValueError) as e:
+            # Execução interrompida no meio de uma gravação: aproveita o que foi lido
+            logger.warning(f"{caminho} truncado após {len(paginas)} página(s): {str(e)}")
+    return [paginas[pagina] for pagina in sorted(paginas)]
+
+
+def reextrair_arquivo(caminho):
+    """
+    Re-extrai todas as páginas de um arquivo de snapshots (roda em um processo
+    do pool). Retorna dicionários simples para atravessar a fronteira do processo
+    """
+    from extratores import ExtratorHTML
+    from captura_api import mapear_itens, completar_com_dom
+    from registros import como_registros
+    from secoes import SECOES, SECAO_PADRAO
+
+    inicio = time.perf_counter()
+    registros = ler_snapshots(caminho)
+    # Arquivos gravados antes da conta/seção no snapshot são do clube
+    primeiro = registros[0] if registros else {}
+    secao = primeiro.get('secao') or SECAO_PADRAO
+    extrator = ExtratorHTML(seletores_cards=SECOES.get(secao, SECOES[SECAO_PADRAO]).seletores_cards)
+
+    paginas = []
+    execucao = None
+    for registro in registros:
+        execucao = registro.get('execucao', execucao)
+        jogadores = extrator.extrair_pagina(registro['html'])
+        if registro.get('itens'):
+            jogadores = completar_com_dom(mapear_itens(registro['itens']), jogadores)
+        validos = [r for r in como_registros(jogadores) if r.valido]
+        paginas.append((registro['pagina'], [r.como_dicionario() for r in validos]))
+
+    return {
+        'arquivo': caminho,
+        'execucao': execucao,
+        'conta': primeiro.get('conta'),
+        'secao': secao,
+        'capturado_em': min((r['capturado_em'] for r in registros if r.get('capturado_em')), default=None),
+        'paginas': paginas,
+        'segundos': time.perf_counter() - inicio
+    }
+
+
+def gravar_resultado(resultado, diretorio_saida, armazenamento=None):
+    """Grava um arquivo re-extraído nas saídas normais (CSV/JSONL e SQLite)"""
+    from saida import SaidaIncremental
+
+    nome = os.path.basename(resultado['arquivo']).split('.')[0]
+    saida = SaidaIncremental(os.path.join(diretorio_saida, f'jogadores_{nome}.csv'),
+                             os.path.join(diretorio_saida, f'jogadores_{nome}.jsonl'))
+    if armazenamento:
+        # Mesma conta, seção e data da coleta original (motor 'offline' não serve de referência)
+        armazenamento.iniciar_execucao(conta=resultado['conta'], motor='offline',
+                                       versao_webapp=f"snapshots:{nome}", secao=resultado['secao'],
+                                       inicio=resultado['capturado_em'])
+
+    with saida:
+        for pagina, jogadores in resultado['paginas']:
+            saida.escrever_pagina(jogadores)
+            if armazenamento:
+                armazenamento.gravar_pagina(jogadores, pagina)
+
+    if armazenamento:
+        armazenamento.finalizar_execucao(saida.total)
+    return saida.total
+
+
+def reextrair(arquivos, diretorio_saida='reextracao', banco=None, processos=None):
+    """Re-extrai os arquivos em paralelo (um processo por arquivo) e grava as saídas"""
+    os.makedirs(diretorio_saida, exist_ok=True)
+    armazenamento = None
+    if banco:
+        from armazenamento import ArmazenamentoSQLite
+        armazenamento = ArmazenamentoSQLite(banco).abrir()
+
+    inicio = time.perf_counter()
+    resumo = []
+    try:
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            futuros = [executor.submit(reextrair_arquivo, caminho) for caminho in arquivos]
+            for futuro in as_completed(futuros):
+                resultado = futuro.result()
+                total = gravar_resultado(resultado, diretorio_saida, armazenamento)
+                resumo.append((resultado['arquivo'], len(resultado['paginas']), total, resultado['segundos']))
+                logger.info(f"{resultado['arquivo']}: {len(resultado['paginas'])} página(s), "
+                            f"{total} jogadores em {resultado['segundos']:.2f}s")
+    finally:
+        if armazenamento:
+            armazenamento.fechar()
+
+    return resumo, time.perf_counter() - inicio
+
+
+def main(argv=None):
+    """Função principal da re-extração offline"""
+    parser = argparse.ArgumentParser(description="Re-extração offline dos snapshots gravados")
+    parser.add_argument('arquivos', nargs='+', help="arquivos ou padrões snapshots/*.jsonl.gz")
+    parser.add_argument('--saida', default='reextracao', help="diretório dos CSV/JSONL gerados")
+    parser.add_argument('--banco', help="grava também cada arquivo como uma execução neste SQLite")
+    parser.add_argument('-p', '--processos', type=int, default=None,
+                        help="processos em paralelo (padrão: todos os núcleos)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    arquivos = sorted({caminho for padrao in args.arquivos for caminho in glob.glob(padrao)})
+    if not arquivos:
+        print("❌ Nenhum arquivo de snapshots encontrado")
+        return 1
+
+    resumo, duracao = reextrair(arquivos, args.saida, args.banco, args.processos)
+
+    paginas = sum(item[1] for item in resumo)
+    jogadores = sum(item[2] for item in resumo)
+    print(f"\n✅ {len(resumo)} arquivo(s), {paginas} página(s) e {jogadores} jogadores "
+          f"re-extraídos em {duracao:.1f}s")
+    print(f"📁 Saídas em {args.saida}/")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())